@@ -1,5 +1,6 @@
 import os.path
 import logging
+import functools
 import numpy    as np
 from   typing   import Union
 from   beartype import beartype
@@ -10,7 +11,7 @@ from PyMieSim.Physics           import _Polarization, Angle
 from PyMieSim.Tools.BaseClasses import BaseDetector, MeshProperty
 from PyMieSim.Tools.Directories import RootPath, LPModePath
 from PyMieSim.Tools.ErrorMsg    import *
-from PyMieSim.Tools.utils       import ( interp_at,
+from PyMieSim.Tools.utils       import ( BilinearInterp,
                                          NA2Angle,
                                          Normalize,
                                          RescaleComplex,
@@ -18,6 +19,47 @@ from PyMieSim.Tools.utils       import ( interp_at,
                                          IO )
 
 
+_ModeBank = {}
+
+
+def LoadMode(ModeNumber):
+    """Function return the far field of the LP mode from the mode bank
+    (PyMieSim/Data/LPmodes/FLP*.npy). Each file is memory-mapped read-only
+    the first time it is requested and kept for the life of the process.
+
+    """
+    filename = f'FLP{ModeNumber[0]}{ModeNumber[1]}.npy'
+
+    if filename not in _ModeBank:
+        fileDir = os.path.join(LPModePath, filename)
+
+        if not os.path.exists(fileDir):
+            raise ValueError( Error_LPMissing )
+
+        _ModeBank[filename] = np.load(fileDir, mmap_mode='r')
+
+    return _ModeBank[filename]
+
+
+@functools.lru_cache(maxsize=32)
+def StructuredMode(ModeNumber, Num, Rotation):
+    """Function return the LP mode far field rotated and rescaled on a
+    [Num, Num] grid. Results are cached and returned read-only.
+
+    """
+    mode = LoadMode(ModeNumber)
+
+    if Rotation != 0: mode = RotateComplex(mode, Rotation)
+
+    if Num != mode.shape[0]: mode = RescaleComplex(Input=mode, Scale=Num/mode.shape[0])
+
+    mode = np.array(mode)
+
+    mode.setflags(write=False)
+
+    return mode
+
+
 class Photodiode(BaseDetector, MeshProperty):
     """
     .. note::
@@ -238,8 +280,10 @@ class LPmode(BaseDetector, MeshProperty):
         """
         .. note::
             Compute the FarField in a structured or unstructured Mesh.
-            The unstructured far field is computed using linear interpolation
-            on a structured mesh.
+            The unstructured far field is computed by bilinear interpolation
+            of the mode grid, each mesh point being projected on the
+            plane of the mode. The rotation is applied to the projected
+            points so that the memory-mapped mode is never copied.
 
         Parameters
         ----------
@@ -256,34 +300,20 @@ class LPmode(BaseDetector, MeshProperty):
 
         """
 
-        filename = f'FLP{self.ModeNumber[0]}{self.ModeNumber[1]}.npy'
-
-        fileDir = os.path.join(LPModePath, filename)
-
-        if not os.path.exists(fileDir):
-            raise ValueError( Error_LPMissing )
-
-        mode = np.load(fileDir)
+        if Structured:
+            return StructuredMode(tuple(self.ModeNumber[:2]), Num, Rotation)
 
-        if Rotation !=0: mode = RotateComplex(mode, Rotation)
+        mode = LoadMode(self.ModeNumber)
 
-        if Num != mode.shape[0]: mode = RescaleComplex(Input=mode, Scale=Num/mode.shape[0])
+        Elevation, Azimuth = self.Mesh.base
 
-        if Structured: return mode
+        Radius  = np.tan(np.pi/2 - Elevation) / np.tan(self.Mesh.MaxAngle)
 
-        self._phi, self._theta = self.SphericalMesh(Sampling    = mode.shape[0],
-                                                    MaxAngle    = self.Mesh.MaxAngle,
-                                                    PhiOffset   = 0,
-                                                    GammaOffset = 0,
-                                                    Structured  = True)
+        Azimuth = Azimuth - np.deg2rad(Rotation)
 
-        Interp = interp_at(x           = self._phi.flatten(),
-                           y           = self._theta.flatten(),
-                           v           = mode.astype(np.complex).flatten(),
-                           xp          = self.Mesh.base[0],
-                           yp          = self.Mesh.base[1],
-                           algorithm   = 'linear',
-                           extrapolate = True)
+        Interp = BilinearInterp(Input = mode,
+                                i     = (1 + Radius * np.cos(Azimuth)) / 2 * (mode.shape[0] - 1),
+                                j     = (1 + Radius * np.sin(Azimuth)) / 2 * (mode.shape[1] - 1) )
 
         return Normalize(Interp)
 
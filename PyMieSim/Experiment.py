@@ -2,19 +2,33 @@
 # -*- coding: utf-8 -*-
 
 import itertools
+import hashlib
+import json
 import logging
+import os
+import time
 import numpy                    as np
 from copy                       import deepcopy, copy
 from beartype                   import beartype
-from multiprocessing            import Process
+from multiprocessing            import Pool
+from multiprocessing.pool       import ThreadPool
 from scipy.optimize             import minimize
 
 from PyMieSim.Source            import PlaneWave
 from PyMieSim.Detector          import LPmode, Photodiode
 from PyMieSim.Scatterer         import Sphere, WMSample
+from PyMieSim.LMT.Scatterer     import SphereEfficiencies
 from PyMieSim.Tools.BaseClasses import Set
-from PyMieSim.Tools.utils       import ToList, GeneratorFromDict, MergeDict, FormatString
-from PyMieSim.Tools.NdArray     import PMSArray, Opt5DArray
+from PyMieSim.Tools             import Couplings
+from PyMieSim.Tools             import Stats as Instrument
+from PyMieSim.Tools.Constants   import eps0, c
+from PyMieSim.Tools.utils       import ( ToList,
+                                         GeneratorFromDict,
+                                         MergeDict,
+                                         FormatString,
+                                         ChunkSlices,
+                                         AsArray )
+from PyMieSim.Tools.NdArray     import PMSArray, Opt5DArray, ToJSON
 from PyMieSim.Tools.Config      import *
 
 
@@ -22,6 +36,76 @@ class Namespace:
     def __init__(self, **kwargs):
         self.__dict__.update(kwargs)
 
+
+def EvaluateChunk(Scatterer, Detector, Keys, Grid, Input):
+    """Function evaluate the Input properties for every point of a flat
+    chunk of the parameter space. It is defined at module level so it can be
+    sent to worker processes by :func:`Setup.Get`.
+
+    Parameters
+    ----------
+    Scatterer : :class:`type`
+        Scatterer class (Sphere, Cylinder, ...).
+    Detector : :class:`type`
+        Detector class, None if no detector is used.
+    Keys : :class:`dict`
+        Name of the Source, Scatterer and Detector keyword arguments.
+    Grid : :class:`dict`
+        Flat arrays of the chunk independent variables.
+    Input : :class:`list`
+        Ordered list of the properties to compute.
+
+    Returns
+    -------
+    :class:`numpy.ndarray`
+        Array of the computed properties [size of chunk, len(Input)].
+
+    """
+    Size      = len( next( iter( Grid.values() ) ) )
+
+    Array     = np.empty([Size, len(Input)])
+
+    source    = Namespace(kwargs=None)
+    scatterer = Namespace(kwargs=None)
+    detectors = {}
+
+    for i in range(Size):
+        kwargs = { key: Grid[key][i] for key in Keys['Source'] }
+        if source.kwargs != kwargs:
+            with Instrument.Timer('Construction'):
+                source        = PlaneWave(**kwargs)
+            source.kwargs = kwargs
+            scatterer     = Namespace(kwargs=None)
+
+        kwargs = { key: Grid[key][i] for key in Keys['Scatterer'] }
+        if scatterer.kwargs != kwargs:
+            with Instrument.Timer('Construction'):
+                scatterer        = Scatterer(**kwargs, Source = source)
+            scatterer.kwargs = kwargs
+
+        if 'Coupling' in Input:
+            kwargs = { key: Grid[key][i] for key in Keys['Detector'] }
+            key    = tuple( kwargs.items() )
+            Instrument.Hit('Detector', key in detectors)
+            if key not in detectors:
+                with Instrument.Timer('Detector'):
+                    detectors[key] = Detector(**kwargs)
+            detector = detectors[key]
+
+        for n, prop in enumerate(Input):
+            if prop == 'Coupling':
+                Array[i, n] = detector.Coupling(scatterer)
+
+            else:
+                with Instrument.Timer('Efficiencies'):
+                    Array[i, n] = getattr(scatterer, prop)
+
+    return Array
+
+
+def EvaluateTask(Task):
+    return EvaluateChunk(*Task)
+
 class ScatSet(Set):
 
     @beartype
@@ -39,17 +123,37 @@ class ScatSet(Set):
         self._Source     = None
 
 
-    def Generator(self):
+    def Generator(self, Cache=None):
+        """Method yield the scatterer of every point of the parameter set.
+        If a Cache dict is given, the scatterers are looked up in it by
+        their source and scatterer keyword arguments and stored in it when
+        built, see :func:`Setup.ScattererCache`.
+
+        """
         Generator = GeneratorFromDict(self.kwargs)
 
         for kwargs in Generator:
 
-            if self._Scatterer.kwargs == kwargs and \
+            if Cache is not None:
+                Key = ( tuple( self._Source.kwargs.items() ), tuple( kwargs.items() ) )
+
+                Instrument.Hit('Scatterer', Key in Cache)
+
+                if Key not in Cache:
+                    with Instrument.Timer('Construction'):
+                        Cache[Key] = self._Scatterer_(**kwargs, Source = self._Source)
+                    Cache[Key].kwargs = {key:val for key, val in kwargs.items()}
+
+                self._Scatterer = Cache[Key]
+                yield self._Scatterer
+
+            elif self._Scatterer.kwargs == kwargs and \
             self._Scatterer.Source.Wavelength == self._Source:
                 yield self._Scatterer
 
             else:
-                self._Scatterer = self._Scatterer_(**kwargs, Source = self._Source)
+                with Instrument.Timer('Construction'):
+                    self._Scatterer = self._Scatterer_(**kwargs, Source = self._Source)
                 self._Scatterer.kwargs = {key:val for key, val in kwargs.items()}
                 yield self._Scatterer
 
@@ -76,7 +180,8 @@ class SourceSet(Set):
 
             else:
 
-                self._Source  = self._Source_(**kwargs)
+                with Instrument.Timer('Construction'):
+                    self._Source  = self._Source_(**kwargs)
                 self._Source.kwargs = {key:val for key, val in kwargs.items()}
                 yield self._Source
 
@@ -105,7 +210,8 @@ class DetectorSet(Set):
                 yield self._Detector
 
             else:
-                self._Detector  = self._Detector_(**kwargs)
+                with Instrument.Timer('Detector'):
+                    self._Detector  = self._Detector_(**kwargs)
                 self._Detector.kwargs = {key:val for key, val in kwargs.items()}
                 yield self._Detector
 
@@ -122,6 +228,20 @@ class EmptyDetectorSet(set):
 
 
 class Setup(object):
+    """
+    .. note::
+        Experiment made of a set of scatterers, sources and detectors.
+        Scatterers built by :func:`Get` are kept, together with their Mie
+        coefficients and far fields, as long as the source and scatterer
+        parameters are unchanged, so that a new evaluation differing only
+        by the detectors parameters, e.g. an :class:`Optimizer` step,
+        recomputes only the detectors meshes and the couplings. Timings of
+        such evaluations thus exclude the far fields already computed, call
+        :func:`ClearCache` to measure a cold run.
+
+    """
+    ScattererCacheSize = 4096                                                   # parameter spaces with more scatterers are not cached
+    FarFieldCacheSize  = 256e6                                                  # bytes of far field, split evenly between the scatterers
 
     @beartype
     def __init__(self,
@@ -147,6 +267,65 @@ class Setup(object):
 
         self.config = config
 
+        self._Scatterers = {}
+
+        self._Signature  = None
+
+
+    def ScattererCache(self):
+        """Method return the cache of the scatterers built by :func:`LoopGet`,
+        keyed by their source and scatterer keyword arguments. The cache
+        depends only on the source and scatterer sets: it is emptied when
+        their parameters change whereas changes of the detectors parameters
+        keep it.
+
+        Returns
+        -------
+        :class:`dict`
+            The scatterers cache, None if the parameter space holds more than
+            ScattererCacheSize scatterers.
+
+        """
+        if self.ScattererCount() > self.ScattererCacheSize:
+            self.ClearCache()
+            return None
+
+        Signature = json.dumps( ToJSON( [self.SourceSet.kwargs, self.ScattererSet.kwargs] ) )
+
+        if Signature != self._Signature:
+            self._Scatterers = {}
+            self._Signature  = Signature
+
+        return self._Scatterers
+
+
+    def ScattererCount(self):
+        """Method return the number of scatterers of the parameter space,
+        i.e. the number of combinations of the source and scatterer
+        parameters.
+
+        Returns
+        -------
+        :class:`int`
+            Number of scatterers.
+
+        """
+        Count = 1
+        for Group in [self.SourceSet, self.ScattererSet]:
+            for val in Group.kwargs.values(): Count *= len(val)
+
+        return Count
+
+
+    def ClearCache(self):
+        """Method drop the scatterers kept between evaluations, together
+        with their Mie coefficients and far fields, see
+        :func:`ScattererCache`. The next evaluation starts cold.
+
+        """
+        self._Scatterers = {}
+        self._Signature  = None
+
 
     def AssertionType(self, AsType=None, Input=None):
         if 'Coupling' in Input and self.DetectorSet.isEmpty:
@@ -168,6 +347,8 @@ class Setup(object):
 
     def UpdateConfig(self, Input, AsType):
 
+        self.config['Y'] = {}
+
         for i, prop in enumerate(Input):
             dic                 = self.config['Y']
             dic[prop]           = deepcopy( Prop2Dict[prop.lower()] )
@@ -177,18 +358,53 @@ class Setup(object):
 
         self.config['output'] = AsType
 
+        if Instrument.Current is not None:
+            Instrument.Current.Total = Instrument.Current.Points + int( np.prod(self.config['shape'][:-1]) )
+
 
-    def Get(self, Input='Qsca', AsType='pymiesim'):
+    def Get(self, Input='Qsca', AsType='pymiesim', Workers=1, Output=None, ChunkSize=65536, Resume=False, Checkpoint=30, Stats=None):
         """Methode generate array of the givens parameters as a function of
         all independent variables.
 
+        Parameters
+        ----------
+        Input : :class:`str` or :class:`list`
+            Properties to compute (Qsca, Coupling, ...).
+        AsType : :class:`str`
+            Output type, either 'pymiesim' or 'optimizer'.
+        Workers : :class:`int`
+            Number of cores used. The parameter space is split in contiguous
+            chunks evaluated in parallel, either by threads running the c++
+            batch kernel or by worker processes.
+        Output : :class:`str`
+            Path of a .npy file. If given, the results are computed chunk
+            by chunk, see :func:`Stream`, and written to the file which is
+            returned memory-mapped. The configuration is written along, so
+            the file can be reopened with :func:`PMSArray.Load`.
+        ChunkSize : :class:`int`
+            Number of points per chunk when Output is given.
+        Resume : :class:`bool`
+            If True, the chunks recorded as finished in the manifest of a
+            previous interrupted run with the same Output are not computed
+            again.
+        Checkpoint : :class:`float`
+            Minimal time in seconds between two checkpoints, i.e. writes of
+            the finished chunks and of the manifest, when Output is given.
+        Stats : :class:`Stats`
+            Instrumentation collecting the progress, timings and cache hit
+            rates of the run, see :class:`PyMieSim.Tools.Stats.Stats`.
+
         Returns
         -------
         :class:`PyMieSimArray`
             Dataframe containing Efficiencies vs. Wavelength, Diameter vs. Index...
 
         """
-        Input = set( ToList(Input) )
+        if Stats is not None:
+            with Stats:
+                return self.Get(Input, AsType, Workers, Output, ChunkSize, Resume, Checkpoint)
+
+        Input = list( dict.fromkeys( ToList(Input) ) )
 
         self.config['Got'] = [FormatString(element) for element in Input]
 
@@ -196,27 +412,352 @@ class Setup(object):
 
         self.UpdateConfig(Input, AsType)
 
+        if Resume and Output is None:
+            raise ValueError('Resuming a run requires the Output file of the interrupted run.')
+
+        if Output is not None:
+            Array  = self.WriteGet(Input, Output, ChunkSize, Workers, Resume, Checkpoint)
+
+            Result = self.ReturnType(Array = Array, AsType = AsType)
+
+            if isinstance(Result, PMSArray): Result.Save(Array.filename)
+
+            return Result
+
+        if self.Batchable(Input):
+            Array = self.BatchGet(Input, Workers = Workers)
+
+        elif Workers > 1:
+            Array = self.ParallelGet(Input, Workers = Workers)
+
+        else:
+            Array = self.LoopGet(Input)
+
+        Array = Array.reshape( self.config['shape'] )
+
+        return self.ReturnType(Array = Array, AsType = AsType)
+
+
+    def LoopGet(self, Input):
+        """Method evaluate the Input properties by instanciating one
+        source, scatterer and detector per point of the parameter space.
+        Detectors are built once and the couplings of a scatterer with all
+        of them are computed together, see :func:`Couplings`. Scatterers
+        are reused from previous calls, see :func:`ScattererCache`.
+
+        Returns
+        -------
+        :class:`numpy.ndarray`
+            Flat array of the computed properties.
+
+        """
         Array = np.empty(self.config['size'])
 
         if 'Material' in self.ScattererSet.kwargs: self.BindMaterial()
 
+        Detectors = list( self.DetectorSet.Generator() )
+
+        Cache     = self.ScattererCache()
+
+        Budget    = self.FarFieldCacheSize / self.ScattererCount()
+
         i = 0
         for source in self.SourceSet.Generator():
             self.ScattererSet._Source = source
-            for scatterer in self.ScattererSet.Generator():
-                for detector in self.DetectorSet.Generator():
+            for scatterer in self.ScattererSet.Generator(Cache):
+                if Cache is not None:
+                    scatterer.FarFieldCacheSize = Budget
+
+                if 'Coupling' in Input:
+                    C = Couplings(Scatterer = scatterer, Detectors = Detectors) * eps0 * c * 0.5
+
+                for d, detector in enumerate(Detectors):
                     for prop in Input:
                         if prop == 'Coupling':
-                            Array[i] = detector.Coupling(scatterer)
+                            Array[i] = C[d]
                             i       += 1
 
                         else:
-                            Array[i] = getattr(scatterer, prop)
+                            with Instrument.Timer('Efficiencies'):
+                                Array[i] = getattr(scatterer, prop)
                             i       += 1
 
-        Array = Array.reshape( self.config['shape'] )
+                Instrument.Progress( len(Detectors) )
 
-        return self.ReturnType(Array = Array, AsType = AsType)
+        return Array
+
+
+    def Stream(self, Input='Qsca', ChunkSize=65536, Workers=1):
+        """Method evaluate the Input properties chunk by chunk, so that the
+        memory used does not depend on the size of the parameter space.
+        Filling an array of shape config['shape'] with
+        :code:`Array[Index] = Chunk` for every yielded pair rebuilds the
+        output of :func:`Get`.
+
+        Parameters
+        ----------
+        Input : :class:`str` or :class:`list`
+            Properties to compute (Qsca, Coupling, ...).
+        ChunkSize : :class:`int`
+            Number of points of the parameter space evaluated per chunk.
+        Workers : :class:`int`
+            Number of cores used to evaluate each chunk.
+
+        Returns
+        -------
+        :class:`generator`
+            Pairs of the chunk points index, one integer array per
+            independent variable, and of the array of the computed
+            properties [ChunkSize, len(Input)].
+
+        """
+        Input = list( dict.fromkeys( ToList(Input) ) )
+
+        self.config['Got'] = [FormatString(element) for element in Input]
+
+        self.AssertionType(Input=Input)
+
+        self.UpdateConfig(Input, 'pymiesim')
+
+        return ( (Index, Array) for _, Index, Array in self.IterChunks(Input, ChunkSize, Workers) )
+
+
+    def IterChunks(self, Input, ChunkSize, Workers, Skip=()):
+        Shape = self.config['shape'][:-1]
+
+        Size  = int( np.prod(Shape) )
+
+        for n, start in enumerate( range(0, Size, ChunkSize) ):
+            if n in Skip: continue
+
+            Points = np.arange(start, min(start + ChunkSize, Size))
+
+            Grid   = self.GetGrid(Points)
+
+            if self.Batchable(Input):
+                Array = self.BatchGet(Input, Workers = Workers, Grid = Grid)
+
+            else:
+                Array = self.ChunkGet(Input, Grid, Workers = Workers)
+
+            yield n, np.unravel_index(Points, Shape), Array
+
+
+    def WriteGet(self, Input, Output, ChunkSize, Workers, Resume, Checkpoint):
+        """Method evaluate the Input properties chunk by chunk into the
+        memory-mapped file Output. Every Checkpoint seconds the file is
+        flushed and the finished chunks are recorded in the manifest
+        Output.manifest.json, written atomically, so that an interrupted
+        run can be resumed.
+
+        Returns
+        -------
+        :class:`numpy.memmap`
+            Array of the computed properties, of shape config['shape'].
+
+        """
+        Output   = os.path.splitext(Output)[0] + '.npy'
+
+        File     = os.path.splitext(Output)[0] + '.manifest.json'
+
+        Key      = hashlib.sha1( json.dumps( ToJSON( [self.config['X'], Input, ChunkSize] ) ).encode() ).hexdigest()
+
+        Done     = set()
+
+        if Resume and os.path.exists(File) and os.path.exists(Output):
+            with open(File) as f:
+                Manifest = json.load(f)
+
+            if Manifest['key'] != Key:
+                raise ValueError(f'The checkpoint {File} was written by a different experiment.')
+
+            Done  = set( Manifest['done'] )
+            Array = np.load(Output, mmap_mode='r+')
+
+            if Array.shape != tuple(self.config['shape']) or Array.dtype != float:
+                raise ValueError(f'The output {Output} does not match the checkpoint {File}.')
+
+        else:
+            Array = np.lib.format.open_memmap(Output, mode='w+', dtype=float, shape=tuple(self.config['shape']))
+
+        def Save():
+            Array.flush()
+            with open(File + '.tmp', 'w') as f:
+                json.dump( {'key': Key, 'done': sorted(Done)}, f )
+            os.replace(File + '.tmp', File)
+
+        Save()                                                                  # a fresh run must not inherit the chunks of a previous manifest
+
+        Last = time.monotonic()
+
+        for n, Index, Chunk in self.IterChunks(Input, ChunkSize, Workers, Skip = Done):
+            Array[Index] = Chunk
+            Done.add(n)
+
+            if time.monotonic() - Last >= Checkpoint:
+                Save()
+                Last = time.monotonic()
+
+        Save()
+
+        return Array
+
+
+    def ChunkGet(self, Input, Grid, Workers=1):
+        """Method evaluate the Input properties for the points of Grid, in
+        worker processes if Workers > 1.
+
+        Returns
+        -------
+        :class:`numpy.ndarray`
+            Array of the computed properties [size of Grid, len(Input)].
+
+        """
+        Keys     = { 'Source'    : list( self.SourceSet.kwargs.keys() ),
+                     'Scatterer' : list( self.ScattererSet.kwargs.keys() ),
+                     'Detector'  : [] if self.DetectorSet.isEmpty else list( self.DetectorSet.kwargs.keys() ) }
+
+        Detector = None if self.DetectorSet.isEmpty else self.DetectorSet._Detector_
+
+        if Workers == 1:
+            Array = EvaluateChunk(self.ScattererSet._Scatterer_, Detector, Keys, Grid, Input)
+            Instrument.Progress( len(Array) )
+            return Array
+
+        Size   = len( next( iter( Grid.values() ) ) )
+
+        Chunks = ChunkSlices(Size, 4 * Workers)
+
+        Tasks  = [ ( self.ScattererSet._Scatterer_,
+                     Detector,
+                     Keys,
+                     { key: val[chunk] for key, val in Grid.items() },
+                     Input ) for chunk in Chunks ]
+
+        Array  = np.empty([Size, len(Input)])
+
+        with Pool(Workers) as pool:
+            for chunk, Result in zip(Chunks, pool.imap(EvaluateTask, Tasks)):
+                Array[chunk] = Result
+                Instrument.Progress( len(Result) )
+
+        return Array
+
+
+    def Batchable(self, Input):
+        """Method return True if the Input properties can be evaluated
+        with a single call to the c++ batch kernel, i.e. efficiencies or
+        cross-sections of a spherical scatterer defined by its index.
+
+        """
+        if self.ScattererSet._Scatterer_ is not Sphere:
+            return False
+
+        if 'Material' in self.ScattererSet.kwargs:
+            return False
+
+        return set(Input).issubset(BATCHTYPE)
+
+
+    def GetGrid(self, Points=None):
+        """Method return the flattened cartesian product of all the
+        independent variables. The points are ordered as they would be by
+        the source, scatterer and detector generators.
+
+        Parameters
+        ----------
+        Points : :class:`numpy.ndarray`
+            Flat indices of the points to return, all of them if None.
+
+        Returns
+        -------
+        :class:`dict`
+            Dictionnary of flat arrays, one per independent variable.
+
+        """
+        kwargs = {**self.SourceSet.kwargs, **self.ScattererSet.kwargs}
+
+        if not self.DetectorSet.isEmpty:
+            kwargs.update(self.DetectorSet.kwargs)
+
+        shape   = [ len(val) for val in kwargs.values() ]
+
+        if Points is None: Points = np.arange( np.prod(shape, dtype=int) )
+
+        indices = np.unravel_index(Points, shape)
+
+        return { key: AsArray(val)[idx] for (key, val), idx in zip(kwargs.items(), indices) }
+
+
+    def ParallelGet(self, Input, Workers):
+        """Method evaluate the Input properties by splitting the parameter
+        space in contiguous chunks sent to a pool of worker processes.
+        Results are written back in the generators order.
+
+        Returns
+        -------
+        :class:`numpy.ndarray`
+            Array of the computed properties [size of parameter space, len(Input)].
+
+        """
+        return self.ChunkGet(list(Input), self.GetGrid(), Workers = Workers)
+
+
+    def BatchGet(self, Input, Workers=1, Grid=None):
+        """Method evaluate the Input properties for the whole parameter
+        space in one call to the c++ layer, without creating any python
+        scatterer object.
+
+        The c++ kernel release the GIL so with Workers > 1 the chunks are
+        computed concurrently by a thread pool.
+
+        Returns
+        -------
+        :class:`numpy.ndarray`
+            Array of the computed properties [size of parameter space, len(Input)].
+
+        """
+        if Grid is None: Grid = self.GetGrid()
+
+        Size    = Grid['Diameter'].size
+
+        nMedium = Grid.get('nMedium', np.ones(Size)).real
+
+        Index      = np.ascontiguousarray(Grid['Index'],      dtype=complex)
+        Diameter   = np.ascontiguousarray(Grid['Diameter'],   dtype=float)
+        Wavelength = np.ascontiguousarray(Grid['Wavelength'], dtype=float)
+        nMedium    = np.ascontiguousarray(nMedium,            dtype=float)
+
+        Eff     = np.empty([Size, len(EFFINDEX)])
+
+        def Compute(chunk):
+            Eff[chunk] = SphereEfficiencies(Index      = Index[chunk],
+                                            Diameter   = Diameter[chunk],
+                                            Wavelength = Wavelength[chunk],
+                                            nMedium    = nMedium[chunk])
+
+        with Instrument.Timer('Efficiencies'):
+            if Workers > 1:
+                with ThreadPool(Workers) as pool:
+                    pool.map(Compute, ChunkSlices(Size, Workers))
+
+            else:
+                Compute(slice(None))
+
+        Instrument.Progress(Size)
+
+        Area    = np.pi * (Grid['Diameter']/2)**2
+
+        Array   = np.empty([Size, len(Input)])
+
+        for n, prop in enumerate(Input):
+            if prop in CROSSTYPE:
+                Array[:, n] = Eff[:, EFFINDEX['Q' + prop[1:]]] * Area
+
+            else:
+                Array[:, n] = Eff[:, EFFINDEX[prop]]
+
+        return Array
 
 
     def BindMaterial(self):
@@ -248,6 +789,15 @@ class Setup(object):
         config['size']  = size  *  length
 
 
+    def Coupling(self, AsType='pymiesim'):
+        """Method return the coupling of every scatterer with every
+        detector, see :func:`Get`. Successive calls differing only by the
+        detectors parameters reuse the scatterers and their far fields.
+
+        """
+        return self.Get(Input='Coupling', AsType=AsType)
+
+
     def Optimize(self, *args, **kwargs):
         return Optimizer(Setup = self, *args, **kwargs)
 
@@ -265,7 +815,8 @@ class Optimizer:
                  Optimum       : str,
                  FirstStride   : Union[float, int],
                  MaxIter       : int               = 50,
-                 Tol           : Union[float, int] = 1e-10):
+                 Tol           : Union[float, int] = 1e-10,
+                 Stats                             = None):
 
         assert Metric.lower() in MetricList, IO( f"Metric {Metric} not in the MetricList \n{MetricList}" )
         assert all(len(x)==len(Parameter) for x in [X0, MinVal, MaxVal ]  ), IO( f'Lenght of parameters, X0, MinVal, MaxVal not equal' )
@@ -280,6 +831,7 @@ class Optimizer:
         self.FirstStride     = FirstStride
         self.MaxIter         = MaxIter
         self.Tol             = Tol
+        self.Stats           = Stats
 
         if Optimum.lower()   == 'maximum': self.sign = -1
         elif Optimum.lower() == 'minimum': self.sign = 1
@@ -304,14 +856,17 @@ class Optimizer:
     def UpdateConfiguration(self, Parameters, x, WhichDetector):
         for n in range(len(Parameters)):
             if Parameters[n] in DetectorParamList:
-                setattr(self.Setup.DetectorSet[WhichDetector], Parameters[0], x[0])
+                self.Setup.DetectorSet.kwargs[Parameters[n]][WhichDetector] = x[n]
 
             elif Parameters[n] in SourceParamList:
-                setattr(self.Setup.SourceSet.Source, Parameters[0], x[0])
+                Values    = self.Setup.SourceSet.kwargs[Parameters[n]]
+                Values[:] = [x[n]] * len(Values)
 
 
     def Run(self):
         def EvalFunc(x):
+            Instrument.Count('Cost')
+
             Penalty = self.ComputePenalty(self.Parameters, x, self.MaxVal, self.MinVal, factor=100)
 
             self.UpdateConfiguration(self.Parameters, x, self.WhichDetector)
@@ -324,11 +879,12 @@ class Optimizer:
 
         Minimizer = Caller(EvalFunc, ParameterName = self.Parameters)
 
-        return minimize(fun      = Minimizer.optimize,
-                        x0       = self.X0,
-                        method   = 'COBYLA',
-                        tol      = self.Tol,
-                        options  = {'maxiter': self.MaxIter, 'rhobeg':self.FirstStride})
+        with self.Stats or Instrument.Null:
+            return minimize(fun      = Minimizer.optimize,
+                            x0       = self.X0,
+                            method   = 'COBYLA',
+                            tol      = self.Tol,
+                            options  = {'maxiter': self.MaxIter, 'rhobeg':self.FirstStride})
 
 
 class Caller:
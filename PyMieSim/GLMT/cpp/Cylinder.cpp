@@ -118,6 +118,8 @@ _CYLINDER::IsPolarized()
 std::tuple<Cndarray,Cndarray>
 _CYLINDER::sS1S2(ndarray& Phi, ndarray& Theta)
 {
+  PROFILE("Cylinder.sS1S2");
+
 
   uint         PhiLength    = Phi.request().shape[0],
                ThetaLength  = Theta.request().shape[0],
@@ -235,6 +237,8 @@ _CYLINDER::ComputeExpTerm(complex128 * expTerm, int ThetaLength, double* ThetaPt
 std::tuple<Cndarray,Cndarray>
 _CYLINDER::uS1S2(ndarray& Phi, ndarray& Theta)
 {
+  PROFILE("Cylinder.uS1S2");
+
 
   uint         PhiLength    = Phi.request().shape[0],
                ThetaLength  = Theta.request().shape[0];
@@ -287,6 +291,8 @@ _CYLINDER::uS1S2(ndarray& Phi, ndarray& Theta)
 std::tuple<Cndarray,Cndarray>
 _CYLINDER::sFields(ndarray& Phi, ndarray& Theta, double R)
 {
+  PROFILE("Cylinder.sFields");
+
   uint         PhiLength    = Phi.request().shape[0],
                ThetaLength  = Theta.request().shape[0],
                index        = 0;
@@ -315,6 +321,8 @@ _CYLINDER::sFields(ndarray& Phi, ndarray& Theta, double R)
 std::tuple<Cndarray,Cndarray>
 _CYLINDER::uFields(ndarray& Phi, ndarray& Theta, double R)
 {
+  PROFILE("Cylinder.uFields");
+
   uint         PhiLength    = Phi.request().shape[0];
 
   Cndarray     ETheta, EPhi;
@@ -410,6 +418,8 @@ _CYLINDER::GetQext()
 std::tuple<double, double, double>
 _CYLINDER::GetEfficiencies()
 {
+  PROFILE("Cylinder.Efficiencies");
+
     double Qsca = GetQsca();
     double Qext = GetQext();
     double Qabs = Qext - Qsca;
@@ -456,6 +466,8 @@ _CYLINDER::ComputePrefactor(double* prefactor)
 void
 _CYLINDER::ComputeAnBn(complex128* anPtr, complex128* bnPtr)
 {
+  PROFILE("Cylinder.ComputeAnBn");
+
   return HighFreqAnBn(anPtr, bnPtr, MaxOrder) ;
 }
 
@@ -1,6 +1,7 @@
 #include "../../includes/SpecialFunc.h"
 #include "../../includes/utils.h"
 #include "../../includes/BaseClass.h"
+#include "../../includes/Profiler.h"
 #include <iostream>
 
 #include <stdio.h>
@@ -37,7 +38,7 @@ struct argument
   double r, rhon, angle, s, R0, w0, xi, k;
   complex128 Q, beta;
   Vec Offset;
-} args, args0 ;
+};
 
 
 
@@ -117,12 +118,114 @@ ImTrapz(int m, complex128 beta)
 
 
 
+void
+ScaledBesselI(complex128 beta, int MaxOrder, complex128* Output)
+{
+  // exp(-beta) I_m(beta) for m = 0..MaxOrder by Miller backward recurrence,
+  // normalised with exp(beta) = I_0 + 2 sum I_k. I_m(-z) = (-1)^m I_m(z)
+  // brings the argument to the right half-plane first.
+  bool       Flip  = std::real(beta) < 0;
+  complex128 z     = Flip ? -beta : beta;
+
+  if (std::abs(z) < 1e-300)
+  {
+    Output[0] = 1.;
+    for (int m = 1; m <= MaxOrder; m++){ Output[m] = 0.; }
+    return;
+  }
+
+  double     Order = std::max( (double) MaxOrder, std::abs(z) );
+  int        Start = (int) ( Order + 30. + sqrt(40. * Order) );
+
+  complex128 Next  = 0.,
+             Curr  = 1e-300,
+             Sum   = 0.;
+
+  for (int n = Start; n > 0; n--)
+  {
+    complex128 Prev = Next + 2. * (double) n / z * Curr;
+
+    Next = Curr;
+    Curr = Prev;
+
+    if (n - 1 <= MaxOrder){ Output[n-1] = Curr; }
+    if (n - 1 > 0)        { Sum += 2. * Curr; }
+
+    if (std::abs(Curr) > 1e250)
+    {
+      Next *= 1e-250; Curr *= 1e-250; Sum *= 1e-250;
+      for (int m = n - 1; m <= std::min(MaxOrder, Start); m++){ Output[m] *= 1e-250; }
+    }
+  }
+
+  Sum += Curr;
+
+  complex128 Scale = Flip ? exp(2. * z) / Sum : 1. / Sum;
+
+  for (int m = 0; m <= MaxOrder; m++)
+  {
+    Output[m] *= (Flip && m % 2) ? -Scale : Scale;
+  }
+}
+
+
+complex128
+ImBessel(int m, complex128 beta)
+{
+  iVec Output = iVec( abs(m) + 1 );
+
+  ScaledBesselI(beta, abs(m), Output.data());
+
+  return Output[abs(m)] * exp(beta);
+}
+
+
+void
+ScaledIm(complex128 beta, int MaxOrder, complex128* Output, const std::string& Method)
+{
+  // exp(-beta) I_m(beta) for m = 0..MaxOrder, in closed form ('bessel') or
+  // from the integral representation ('trapz', 'simpson') for validation.
+  if (Method == "bessel"){ ScaledBesselI(beta, MaxOrder, Output); return; }
+
+  for (int m = 0; m <= MaxOrder; m++)
+  {
+    Output[m] = ( Method == "trapz" ? ImTrapz(m, beta) : ImSimpson(m, beta) ) * exp(-beta);
+  }
+}
+
+
 complex128
-ImHat(double     m,
-      complex128 beta,
-      double     xi)
+ImHat(double             m,
+      complex128         beta,
+      double             xi,
+      const std::string& Method = "bessel")
 {
-  return ImTrapz(m, beta) * exp(-beta - J * m * xi ) ;
+  iVec Output = iVec( abs((int) m) + 1 );
+
+  ScaledIm(beta, abs((int) m), Output.data(), Method);
+
+  return Output[abs((int) m)] * exp(- J * m * xi ) ;
+}
+
+
+void
+ImHat3(int m, complex128 beta, double xi, complex128* Ih, const std::string& Method = "bessel")
+{
+  iVec Scaled = iVec( abs(m) + 2 );
+
+  ScaledIm(beta, abs(m) + 1, Scaled.data(), Method);
+
+  for (int i = 0; i < 3; i++){ Ih[i] = Scaled[abs(m + i - 1)] * exp(- J * (double)(m + i - 1) * xi); }
+}
+
+
+complex128
+PyIm(int m, complex128 beta, std::string Method)
+{
+  if (Method == "trapz")  { return ImTrapz(m, beta); }
+  if (Method == "simpson"){ return ImSimpson(m, beta); }
+
+  return ImBessel(m, beta);
 }
 
 
@@ -146,22 +249,23 @@ complex128 I_3(argument arg){ return 4. * arg.Q * arg.s*arg.s * arg.Offset[0] *
 complex128 I_4(argument arg){ return 4. * arg.Q * arg.s*arg.s * arg.Offset[1] * cos(arg.angle); }
 
 complex128
-I_1(argument arg)
+I_1Common(argument arg)
 {
   complex128 term0 = J * arg.Q * arg.s*arg.s * pow(arg.R0 - arg.rhon * sin(arg.angle), 2. ),
-             term2 = J * arg.rhon * cos(arg.angle),
-             term3 = NPnm(arg.n, abs(arg.m), cos(arg.angle)) * sin(arg.angle) ;
+             term2 = J * arg.rhon * cos(arg.angle);
 
-  return arg.Q * exp(term0 + term2 ) * term3;
+  return arg.Q * exp(term0 + term2 ) * sin(arg.angle);
 }
 
+complex128 I_1(argument arg){ return I_1Common(arg) * NPnm(arg.n, abs(arg.m), cos(arg.angle)); }
+
 
 
 
 
 
 complex128
-Bnm_integrand(double angle, argument args0)
+Bnm_integrand(double angle, argument args0, const std::string& Method = "bessel")
 {
   if (abs(args0.m) >args0.n){return 0;}
 
@@ -171,11 +275,15 @@ Bnm_integrand(double angle, argument args0)
 
   complex128 beta = -2. * J * args0.Q * args0.s*args0.s * args0.R0 * args0.rhon * sin(angle);
 
-  complex128 term0 =  ImHat(args0.m+1, beta, args0.xi) - ImHat(args0.m-1, beta, args0.xi);
+  complex128 Ih[3];
+
+  ImHat3(args0.m, beta, args0.xi, Ih, Method);
+
+  complex128 term0 =  Ih[2] - Ih[0];
 
   term0 *= I_2(args0);
 
-  term0 -= (I_4(args0) * ImHat(args0.m, beta, args0.xi));
+  term0 -= (I_4(args0) * Ih[1]);
 
   term0 *= I_1(args0);
 
@@ -187,7 +295,7 @@ Bnm_integrand(double angle, argument args0)
 
 
 complex128
-Anm_integrand(double angle, argument args0)
+Anm_integrand(double angle, argument args0, const std::string& Method = "bessel")
 {
   if (abs(args0.m) >args0.n){return 0;}
 
@@ -197,11 +305,15 @@ Anm_integrand(double angle, argument args0)
 
   complex128 beta = -2. * J * args0.Q * args0.s*args0.s * args0.R0 * args0.rhon * sin(angle);
 
-  complex128 term0 =  ImHat(args0.m+1, beta, args0.xi) + ImHat(args0.m-1, beta, args0.xi);
+  complex128 Ih[3];
+
+  ImHat3(args0.m, beta, args0.xi, Ih, Method);
+
+  complex128 term0 =  Ih[2] + Ih[0];
 
   term0 *= I_2(args0);
 
-  term0 -= (I_3(args0) * ImHat(args0.m, beta, args0.xi));
+  term0 -= (I_3(args0) * Ih[1]);
 
   term0 *= I_1(args0);
 
@@ -211,13 +323,12 @@ Anm_integrand(double angle, argument args0)
 
 
 
-complex128
-Anm(int    n,
-    int    m,
-    double k,
-    double w0,
-    Vec    Offset,
-    double Tolerance)
+argument
+Argument(int    n,
+         int    m,
+         double k,
+         double w0,
+         Vec    Offset)
 {
   argument args0;
            args0.n      = n;
@@ -229,9 +340,27 @@ Anm(int    n,
            args0.xi     = acos(Offset[0]/args0.R0);
            args0.s      = 1./(k*w0);
            args0.w0     = w0;
-           args0.r      = args.rhon/k;
+           args0.r      = args0.rhon/k;
+
+  return args0;
+}
 
-  auto func_ = [=](double angle)->complex128 {return Anm_integrand(angle, args0);};
+
+
+complex128
+Anm(int    n,
+    int    m,
+    double k,
+    double w0,
+    Vec    Offset,
+    double Tolerance,
+    std::string Method)
+{
+  PROFILE("Anm");
+
+  argument args0 = Argument(n, m, k, w0, Offset);
+
+  auto func_ = [=](double angle)->complex128 {return Anm_integrand(angle, args0, Method);};
 
   return -trapezoidal(func_, 0.0, pi<double>(),Tolerance) * I_0(args0) * Correction;
 
@@ -245,21 +374,14 @@ Bnm(int n,
     double k,
     double w0,
     Vec Offset,
-    double Tolerance)
+    double Tolerance,
+    std::string Method)
 {
-  argument args0;
-           args0.n      = n;
-           args0.m      = m;
-           args0.rhon   = (n + 0.5);
-           args0.Offset = Offset;
-           args0.k      = k;
-           args0.R0     = sqrt(Offset[0]*Offset[0] + Offset[1]*Offset[1]);
-           args0.xi     = acos(Offset[0]/args0.R0);
-           args0.s      = 1./(k*w0);
-           args0.w0     = w0;
-           args0.r      = args.rhon/k;
+  PROFILE("Bnm");
 
-  auto func_ = [=](double angle)->complex128 {return Bnm_integrand(angle, args0);};
+  argument args0 = Argument(n, m, k, w0, Offset);
+
+  auto func_ = [=](double angle)->complex128 {return Bnm_integrand(angle, args0, Method);};
 
   return -trapezoidal(func_, 0.0, pi<double>(),Tolerance) * I_0(args0) * Correction;
 
@@ -267,6 +389,224 @@ Bnm(int n,
 
 
 
+Vec
+SimpsonWeights(int Sampling)
+{
+  Vec    Weights = Vec(Sampling, 2.);
+
+  double h       = pi<double>() / (Sampling - 1);
+
+  for (int i = 1; i < Sampling; i += 2){ Weights[i] = 4.; }
+
+  Weights[0] = Weights[Sampling-1] = 1.;
+
+  for (auto& w: Weights){ w *= h / 3.; }
+
+  return Weights;
+}
+
+
+Vec
+NPnmTable(int MaxOrder, Vec& X)
+{
+  uint Sampling = X.size();
+
+  Vec  Table    = Vec(MaxOrder * MaxOrder * Sampling, 0.);
+
+  for (int m = 0; m < MaxOrder; m++)
+    for (uint j = 0; j < Sampling; j++)
+    {
+      double Pn   = Pnm(m, m, X[j]),
+             Pnm1 = 0.;
+
+      for (int n = m; n < MaxOrder; n++)
+      {
+        Table[(n * MaxOrder + m) * Sampling + j] = sqrt((2.*(double)n + 1.)/2. * nmFactorial(n,m)) * Pn;
+
+        double Next = (n == m) ? X[j] * (2. * m + 1.) * Pn
+                               : boost::math::legendre_next(n, m, X[j], Pn, Pnm1);
+        Pnm1 = Pn;
+        Pn   = Next;
+      }
+    }
+
+  return Table;
+}
+
+
+Cndarray
+BSCTable(int    MaxOrder,
+         double k,
+         double w0,
+         Vec    Offset,
+         bool   OnAxis,
+         int    Sampling,
+         std::string Method)
+{
+  PROFILE("BSCTable");
+
+  if (Sampling % 2 == 0){ Sampling++; }
+
+  std::vector<int> nList, mList, First;
+
+  for (int n = 0; n < MaxOrder; n++)
+  {
+    First.push_back(nList.size());
+    if (n == 0) continue;
+
+    for (int m = (OnAxis ? -1 : -n); m <= (OnAxis ? 1 : n); m += (OnAxis ? 2 : 1))
+    {
+      nList.push_back(n);
+      mList.push_back(m);
+    }
+  }
+  First.push_back(nList.size());
+
+  uint       Size     = nList.size();
+
+  Cndarray   Output   = Cndarray(Size * 4);
+
+  complex128 * OutPtr = Output.mutable_data();
+
+  Vec Angle   = Linspace( 0.0, pi<double>(), Sampling),
+      Cos     = Vec(Sampling),
+      Weights = SimpsonWeights(Sampling);
+
+  for (int j = 0; j < Sampling; j++){ Cos[j] = cos(Angle[j]); }
+
+  {
+    py::gil_scoped_release Release;
+
+    Vec Legendre = NPnmTable(MaxOrder, Cos);
+
+    #pragma omp parallel for schedule(dynamic)
+    for (int n = 1; n < MaxOrder; n++)
+    {
+      argument   arg      = Argument(n, 0, k, w0, Offset);
+
+      int        Mmax     = OnAxis ? 1 : n;
+
+      iVec       Ih       = iVec(2 * Mmax + 3),
+                 Scaled   = iVec(Mmax + 2),
+                 TE       = iVec(First[n+1] - First[n], 0.),
+                 TM       = iVec(First[n+1] - First[n], 0.);
+
+      for (int j = 0; j < Sampling; j++)
+      {
+        arg.angle = Angle[j];
+        arg.Q     = Q(arg.r, Angle[j], arg.w0, arg.Offset, arg.k);
+
+        complex128 beta = -2. * J * arg.Q * arg.s*arg.s * arg.R0 * arg.rhon * sin(Angle[j]);
+
+        ScaledIm(beta, Mmax + 1, Scaled.data(), Method);
+
+        for (int mp = -Mmax - 1; mp <= Mmax + 1; mp++){ Ih[mp + Mmax + 1] = Scaled[abs(mp)] * exp(- J * (double) mp * arg.xi); }
+
+        complex128 Common = Weights[j] * I_1Common(arg),
+                   I2     = I_2(arg),
+                   I3     = I_3(arg),
+                   I4     = I_4(arg);
+
+        for (int row = First[n]; row < First[n+1]; row++)
+        {
+          int        m    = mList[row];
+
+          complex128 Term = Common * Legendre[(n * MaxOrder + abs(m)) * Sampling + j],
+                     Ip   = Ih[m + Mmax + 2],
+                     I0   = Ih[m + Mmax + 1],
+                     Im   = Ih[m + Mmax];
+
+          TE[row - First[n]] += Term * ( I2 * (Ip - Im) - I4 * I0 );
+          TM[row - First[n]] += Term * ( I2 * (Ip + Im) - I3 * I0 );
+        }
+      }
+
+      complex128 Prefactor = -I_0(arg) * Correction;
+
+      for (int row = First[n]; row < First[n+1]; row++)
+      {
+        OutPtr[4*row + 0] = (double) nList[row];
+        OutPtr[4*row + 1] = (double) mList[row];
+        OutPtr[4*row + 2] = Prefactor * TE[row - First[n]];
+        OutPtr[4*row + 3] = Prefactor * TM[row - First[n]];
+      }
+    }
+  }
+
+  Output.resize({Size, (uint) 4});
+
+  return Output;
+}
+
+
+Cndarray
+BSCLocalized(int    MaxOrder,
+             double k,
+             double w0,
+             Vec    Offset,
+             bool   OnAxis)
+{
+  PROFILE("BSCLocalized");
+
+  // Integral localized approximation, written in the normalisation of the
+  // quadrature above (normalised Legendre functions, exp(-i Z0) phase).
+  std::vector<int> nList, mList;
+
+  for (int n = 1; n < MaxOrder; n++)
+    for (int m = (OnAxis ? -1 : -n); m <= (OnAxis ? 1 : n); m += (OnAxis ? 2 : 1))
+    {
+      nList.push_back(n);
+      mList.push_back(m);
+    }
+
+  uint       Size     = nList.size();
+
+  Cndarray   Output   = Cndarray(Size * 4);
+
+  complex128 * OutPtr = Output.mutable_data();
+
+  double     s        = 1./(k*w0),
+             R0       = sqrt(Offset[0]*Offset[0] + Offset[1]*Offset[1]),
+             xi       = acos(Offset[0]/R0);
+
+  complex128 Qhat     = 1. / (J + 2. * s*s * Offset[2]);
+
+  iVec       Scaled   = iVec(MaxOrder + 2);
+
+  for (uint row = 0; row < Size; row++)
+  {
+    int        n      = nList[row],
+               m      = mList[row];
+
+    double     rhon   = n + 0.5;
+
+    complex128 x      = 2. * Qhat * s*s * rhon * R0,
+               Psi0   = J * Qhat * exp(-J * Qhat * s*s * (rhon*rhon + R0*R0)),
+               Zn     = (m == 0) ? 2. * (double) n * (n + 1.) * J / (2. * n + 1.)
+                                 : pow(-2. * J / (2. * n + 1.), abs(m) - 1),
+               Norm   = sqrt((2.*(double)n + 1.)/2. * nmFactorial(n, abs(m)));
+
+    ScaledBesselI(J * x, abs(m) + 1, Scaled.data());
+
+    // J_p(x) = i^-p I_p(i x)
+    auto Jp = [&](int p)->complex128 { return pow(-J, p) * Scaled[abs(p)] * exp(J * x); };
+
+    complex128 a      = Jp(m-1) * exp(-J * (double)(m-1) * xi),
+               b      = Jp(m+1) * exp(-J * (double)(m+1) * xi),
+               Factor = -J * pow(-J, m) * Zn / Norm * Psi0 * exp(-J * Offset[2]);
+
+    OutPtr[4*row + 0] = (double) n;
+    OutPtr[4*row + 1] = (double) m;
+    OutPtr[4*row + 2] = - Factor * (a + b);
+    OutPtr[4*row + 3] =   Factor * (a - b);
+  }
+
+  Output.resize({Size, (uint) 4});
+
+  return Output;
+}
+
+
 std::tuple<ndarray,Cndarray>
 PyAnm_integrand(int    n,
                 int    m,
@@ -277,17 +617,7 @@ PyAnm_integrand(int    n,
                 double Tolerance)
 {
 
- argument args0;
-          args0.n      = n;
-          args0.m      = m;
-          args0.rhon   = (n + 0.5);
-          args0.Offset = Offset;
-          args0.k      = k;
-          args0.R0     = sqrt(Offset[0]*Offset[0] + Offset[1]*Offset[1]);
-          args0.xi     = acos(Offset[0]/args0.R0);
-          args0.s      = 1./(k*w0);
-          args0.w0     = w0;
-          args0.r      = args.rhon/k;
+ argument args0 = Argument(n, m, k, w0, Offset);
 
   Cndarray _Anm = Cndarray(sampling);
   auto _Anm_data = _Anm.mutable_data();
@@ -299,7 +629,7 @@ PyAnm_integrand(int    n,
 
   for (auto i=0; i<sampling;i++)
   {
-    _Anm_data[i] = Anm_integrand(X[i], args);
+    _Anm_data[i] = Anm_integrand(X[i], args0);
     Angle_data[i] = X[i];
   }
   return std::make_tuple(Angle, _Anm);
@@ -316,17 +646,7 @@ PyBnm_integrand(int    n,
                 double Tolerance)
 {
 
-  argument args0;
-           args0.n      = n;
-           args0.m      = m;
-           args0.rhon   = (n + 0.5);
-           args0.Offset = Offset;
-           args0.k      = k;
-           args0.R0     = sqrt(Offset[0]*Offset[0] + Offset[1]*Offset[1]);
-           args0.xi     = acos(Offset[0]/args0.R0);
-           args0.s      = 1./(k*w0);
-           args0.w0     = w0;
-           args0.r      = args.rhon/k;
+  argument args0 = Argument(n, m, k, w0, Offset);
 
    Cndarray _Bnm = Cndarray(sampling);
    auto _Bnm_data = _Bnm.mutable_data();
@@ -338,7 +658,7 @@ PyBnm_integrand(int    n,
 
    for (auto i=0; i<sampling;i++)
    {
-     _Bnm_data[i] = Bnm_integrand(X[i], args);
+     _Bnm_data[i] = Bnm_integrand(X[i], args0);
      Angle_data[i] = X[i];
    }
    return std::make_tuple(Angle, _Bnm);
@@ -351,6 +671,8 @@ PyBnm_integrand(int    n,
 PYBIND11_MODULE(GaussianBeam, module) {
     module.doc() = "Generalized Lorenz-Mie Theory (GLMT) c++ binding module for light scattering from a spherical scatterer";
 
+    Profiler::Bind(module);
+
     module.def("Anm",
                &Anm,
                py::arg("n"),
@@ -359,7 +681,8 @@ PYBIND11_MODULE(GaussianBeam, module) {
                py::arg("w0"),
                py::arg("Offset"),
                py::arg("Tolerance") = 1e-8,
-               "Compute Anm");
+               py::arg("Method") = "bessel",
+               "Compute Anm, I_m being evaluated in closed form ('bessel') or by quadrature ('trapz', 'simpson')");
 
 
      module.def("Anm_integrand",
@@ -383,7 +706,38 @@ PYBIND11_MODULE(GaussianBeam, module) {
                py::arg("w0"),
                py::arg("Offset"),
                py::arg("Tolerance") = 1e-8,
-               "Compute Bnm");
+               py::arg("Method") = "bessel",
+               "Compute Bnm, I_m being evaluated in closed form ('bessel') or by quadrature ('trapz', 'simpson')");
+
+
+    module.def("Im",
+               &PyIm,
+               py::arg("m"),
+               py::arg("beta"),
+               py::arg("Method") = "bessel",
+               "Modified Bessel function I_m(beta) from its recurrence ('bessel') or its integral representation ('trapz', 'simpson')");
+
+
+    module.def("BSCTable",
+               &BSCTable,
+               py::arg("MaxOrder"),
+               py::arg("k"),
+               py::arg("w0"),
+               py::arg("Offset"),
+               py::arg("OnAxis"),
+               py::arg("Sampling") = 201,
+               py::arg("Method") = "bessel",
+               "Compute the (n, m, TE, TM) beam shape coefficient table for orders 1 to MaxOrder-1, I_m being evaluated in closed form ('bessel') or by quadrature ('trapz', 'simpson')");
+
+
+    module.def("BSCLocalized",
+               &BSCLocalized,
+               py::arg("MaxOrder"),
+               py::arg("k"),
+               py::arg("w0"),
+               py::arg("Offset"),
+               py::arg("OnAxis"),
+               "Compute the (n, m, TE, TM) beam shape coefficient table with the integral localized approximation");
 
 
      module.def("Bnm_integrand",
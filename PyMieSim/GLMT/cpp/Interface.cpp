@@ -7,6 +7,7 @@
 #include "../../includes/SpecialFunc.h"
 #include "../../includes/utils.h"
 #include "../../includes/BaseClass.h"
+#include "../../includes/Profiler.h"
 
 namespace py = pybind11;
 
@@ -21,6 +22,8 @@ typedef py::buffer_info info;
 PYBIND11_MODULE(Scatterer, module) {
     module.doc() = "Generalized Lorenz-Mie Theory (GLMT) c++ binding module for light scattering from a spherical scatterer";
 
+    Profiler::Bind(module);
+
     py::class_<_SPHERE>(module, "SPHERE")
     .def(py::init<double, double, double, double, double, double, Cndarray>(),
         py::arg("Index"),
@@ -118,6 +118,8 @@ _SPHERE::IsPolarized()
 std::tuple<Cndarray,Cndarray>
 _SPHERE::sS1S2(ndarray& Phi, ndarray& Theta)
 {
+  PROFILE("Sphere.sS1S2");
+
 
   uint         PhiLength    = Phi.request().shape[0],
                ThetaLength  = Theta.request().shape[0],
@@ -246,6 +248,8 @@ _SPHERE::ComputeExpTerm(complex128 * expTerm, int ThetaLength, double* ThetaPtr)
 std::tuple<Cndarray,Cndarray>
 _SPHERE::uS1S2(ndarray& Phi, ndarray& Theta)
 {
+  PROFILE("Sphere.uS1S2");
+
 
   uint         PhiLength    = Phi.request().shape[0],
                ThetaLength  = Theta.request().shape[0];
@@ -295,6 +299,8 @@ _SPHERE::uS1S2(ndarray& Phi, ndarray& Theta)
 std::tuple<Cndarray,Cndarray>
 _SPHERE::sFields(ndarray& Phi, ndarray& Theta, double R)
 {
+  PROFILE("Sphere.sFields");
+
   uint         PhiLength    = Phi.request().shape[0],
                ThetaLength  = Theta.request().shape[0];
 
@@ -323,6 +329,8 @@ _SPHERE::sFields(ndarray& Phi, ndarray& Theta, double R)
 std::tuple<Cndarray,Cndarray>
 _SPHERE::uFields(ndarray& Phi, ndarray& Theta, double R)
 {
+  PROFILE("Sphere.uFields");
+
   uint         PhiLength    = Phi.request().shape[0];
 
   Cndarray     ETheta, EPhi;
@@ -418,6 +426,8 @@ _SPHERE::GetQext()
 std::tuple<double, double, double>
 _SPHERE::GetEfficiencies()
 {
+  PROFILE("Sphere.Efficiencies");
+
     double Qsca = GetQsca();
     double Qext = GetQext();
     double Qabs = Qext - Qsca;
@@ -463,6 +473,8 @@ _SPHERE::ComputePrefactor(double* prefactor)
 void
 _SPHERE::ComputeAnBn(complex128* an, complex128* bn)
 {
+  PROFILE("Sphere.ComputeAnBn");
+
   if (SizeParam < 0.5){LowFreqAnBn(an, bn) ; }
   else                {HighFreqAnBn(an, bn, MaxOrder) ; }
 }
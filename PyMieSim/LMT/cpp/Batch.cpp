@@ -0,0 +1,218 @@
+#include <iostream>
+#include <math.h>
+
+
+ndarray
+SphereEfficiencies(Cndarray& Index,
+                   ndarray&  Diameter,
+                   ndarray&  Wavelength,
+                   ndarray&  nMedium)
+{
+  PROFILE("SphereEfficiencies");
+
+  uint         Size          = Diameter.request().size;
+
+  complex128 * IndexPtr      = (complex128*) Index.request().ptr;
+
+  double     * DiameterPtr   = (double*) Diameter.request().ptr,
+             * WavelengthPtr = (double*) Wavelength.request().ptr,
+             * nMediumPtr    = (double*) nMedium.request().ptr;
+
+  ndarray      Output        = ndarray(Size * 7);
+
+  double     * OutputPtr     = Output.mutable_data();
+
+  {
+    py::gil_scoped_release Release;
+
+    for (uint i = 0; i < Size; i++)
+    {
+      SPHERE Scat = SPHERE(IndexPtr[i], DiameterPtr[i], WavelengthPtr[i], nMediumPtr[i], 0., 1.);
+
+      std::tie(OutputPtr[0],
+               OutputPtr[1],
+               OutputPtr[2],
+               OutputPtr[3],
+               OutputPtr[4],
+               OutputPtr[5],
+               OutputPtr[6]) = Scat.GetEfficiencies();
+
+      OutputPtr += 7;
+    }
+  }
+
+  Output.resize({Size, (uint) 7});
+
+  return Output;
+}
+
+
+std::vector<ssize_t>
+BroadcastShape(std::vector<py::buffer_info>& Infos)
+{
+  uint ndim = 0;
+
+  for (auto const& Info: Infos){ ndim = std::max(ndim, (uint) Info.ndim); }
+
+  std::vector<ssize_t> Shape(ndim, 1);
+
+  for (auto const& Info: Infos)
+  {
+    uint offset = ndim - Info.ndim;
+
+    for (uint d = 0; d < (uint) Info.ndim; d++)
+    {
+      if (Info.shape[d] == 1) continue;
+
+      if (Shape[offset+d] != 1 && Shape[offset+d] != Info.shape[d])
+        throw std::invalid_argument("Diameter, Index, Wavelength and nMedium could not be broadcast together.");
+
+      Shape[offset+d] = Info.shape[d];
+    }
+  }
+
+  return Shape;
+}
+
+
+std::vector<ssize_t>
+BroadcastStrides(py::buffer_info& Info, std::vector<ssize_t>& Shape)
+{
+  uint offset = Shape.size() - Info.ndim;
+
+  std::vector<ssize_t> Strides(Shape.size(), 0);
+
+  for (uint d = 0; d < (uint) Info.ndim; d++)
+  {
+    if (Info.shape[d] != 1) Strides[offset+d] = Info.strides[d] / Info.itemsize;
+  }
+
+  return Strides;
+}
+
+
+py::dict
+Efficiencies(Cndarray Index,
+             ndarray  Diameter,
+             ndarray  Wavelength,
+             ndarray  nMedium)
+{
+  PROFILE("BatchEfficiencies");
+
+  std::vector<py::buffer_info> Infos;
+
+  Infos.push_back( Index.request() );
+  Infos.push_back( Diameter.request() );
+  Infos.push_back( Wavelength.request() );
+  Infos.push_back( nMedium.request() );
+
+  std::vector<ssize_t> Shape = BroadcastShape(Infos);
+
+  std::vector<std::vector<ssize_t>> Strides;
+
+  for (auto& Info: Infos){ Strides.push_back( BroadcastStrides(Info, Shape) ); }
+
+  ssize_t      Size          = 1;
+  for (auto const& s: Shape){ Size *= s; }
+
+  complex128 * IndexPtr      = (complex128*) Infos[0].ptr;
+
+  double     * DiameterPtr   = (double*) Infos[1].ptr,
+             * WavelengthPtr = (double*) Infos[2].ptr,
+             * nMediumPtr    = (double*) Infos[3].ptr;
+
+  std::vector<std::string> Keys = {"Qsca", "Qext", "Qabs", "Qback", "Qratio", "g", "Qpr"};
+
+  std::vector<ndarray> Outputs;
+  std::vector<double*> OutputPtrs;
+
+  for (uint q = 0; q < Keys.size(); q++)
+  {
+    Outputs.push_back( ndarray(Shape) );
+    OutputPtrs.push_back( Outputs[q].mutable_data() );
+  }
+
+  std::vector<ssize_t> Counter(Shape.size(), 0),
+                       Offset(Infos.size(), 0);
+
+  for (ssize_t i = 0; i < Size; i++)
+  {
+    for (uint a = 0; a < Infos.size(); a++)
+    {
+      Offset[a] = 0;
+      for (uint d = 0; d < Shape.size(); d++){ Offset[a] += Counter[d] * Strides[a][d]; }
+    }
+
+    SPHERE Scat = SPHERE(IndexPtr[Offset[0]], DiameterPtr[Offset[1]], WavelengthPtr[Offset[2]], nMediumPtr[Offset[3]], 0., 1.);
+
+    std::tie(OutputPtrs[0][i],
+             OutputPtrs[1][i],
+             OutputPtrs[2][i],
+             OutputPtrs[3][i],
+             OutputPtrs[4][i],
+             OutputPtrs[5][i],
+             OutputPtrs[6][i]) = Scat.GetEfficiencies();
+
+    for (int d = (int) Shape.size() - 1; d >= 0; d--)
+    {
+      if (++Counter[d] < Shape[d]) break;
+      Counter[d] = 0;
+    }
+  }
+
+  py::dict Output;
+
+  for (uint q = 0; q < Keys.size(); q++){ Output[Keys[q].c_str()] = Outputs[q]; }
+
+  return Output;
+}
+
+
+std::tuple<ndarray, ndarray>
+PiTau(ndarray& Phi, uint MaxOrder)
+{
+  PROFILE("PiTau");
+
+  uint         PhiLength     = Phi.request().size;
+
+  double     * PhiPtr        = (double*) Phi.request().ptr;
+
+  ndarray      Pi            = ndarray(PhiLength * MaxOrder),
+               Tau           = ndarray(PhiLength * MaxOrder);
+
+  double     * PiPtr         = Pi.mutable_data(),
+             * TauPtr        = Tau.mutable_data();
+
+  {
+    py::gil_scoped_release Release;
+
+    #pragma omp parallel num_threads(NumThreads)
+    {
+      Scratch&     Buffer    = GetScratch();
+
+      complex128 * pin       = Reserve(Buffer.Pin, std::max(MaxOrder, (uint) 2)),
+                 * taun      = Reserve(Buffer.Taun, std::max(MaxOrder, (uint) 2));
+
+      #pragma omp for
+      for (int i = 0; i < (int) PhiLength; i++)
+      {
+        BASE::MiePiTau( cos( PhiPtr[i]-PI/2 ), MaxOrder, pin, taun );
+
+        for (uint m = 0; m < MaxOrder ; m++)
+        {
+          PiPtr[i * MaxOrder + m]  = pin[m].real();
+          TauPtr[i * MaxOrder + m] = taun[m].real();
+        }
+      }
+    }
+  }
+
+  Pi.resize({PhiLength, MaxOrder});
+  Tau.resize({PhiLength, MaxOrder});
+
+  return std::make_tuple(Pi, Tau);
+}
+
+
+
+// -
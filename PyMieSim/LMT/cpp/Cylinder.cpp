@@ -19,17 +19,17 @@ private:
              Mu,
              MuScat;
 
+    double&  Getk(){return this->k;};
+    double&  GetPolarization(){return this->Polarization;};
+    double&  GetE0(){return this->E0;};
+    double&  GetSizeParam(){return this->SizeParam;};
+
     void     ComputeAnBn(complex128* an, complex128* bn, uint MaxOrder),
              LowFreqAnBn(complex128* an, complex128* bn),
              HighFreqAnBn(complex128* an, complex128* bn, uint MaxOrder);
 
 
     public:
-        Cndarray                           An(uint MaxOrder),
-                                           Bn(uint MaxOrder),
-                                           Cn(uint MaxOrder),
-                                           Dn(uint MaxOrder);
-
         std::tuple<Cndarray,Cndarray>      S1S2(ndarray Phi),
                                            sS1S2(ndarray& Phi, ndarray& Theta),
                                            uS1S2(ndarray& Phi, ndarray& Theta),
@@ -108,32 +108,6 @@ CYLINDER::LowFreqAnBn(complex128* anPtr, complex128* bnPtr)
 }
 
 
-Cndarray
-CYLINDER::Bn(uint MaxOrder)
-{
-  Cndarray     an         = Cndarray(MaxOrder),
-               bn         = Cndarray(MaxOrder);
-
-  complex128 * anPtr      = (complex128 *) an.request().ptr,
-             * bnPtr      = (complex128 *) bn.request().ptr;
-
-  this->HighFreqAnBn(anPtr, bnPtr, MaxOrder);
-  return bn;
-}
-
-
-Cndarray
-CYLINDER::An(uint MaxOrder)
-{
-  Cndarray     an         = Cndarray(MaxOrder),
-               bn         = Cndarray(MaxOrder);
-
-  complex128 * anPtr      = (complex128 *) an.request().ptr,
-             * bnPtr      = (complex128 *) bn.request().ptr;
-
-  this->HighFreqAnBn(anPtr, bnPtr, MaxOrder);
-  return an;
-}
 
 
 
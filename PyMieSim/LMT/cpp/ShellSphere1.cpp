@@ -27,6 +27,7 @@ private:
     double&     Getk(){return this->k;};
     double&     GetPolarization(){return this->Polarization;};
     double&     GetE0(){return this->E0;};
+    double&     GetSizeParam(){return this->xShell;};
 
     void        ComputeAnBn( complex128* an, complex128* bn, uint MaxOrder),
                 LowFreqAnBn( complex128* an, complex128* bn),
@@ -36,11 +37,6 @@ private:
     public:
       std::tuple<double, double, double, double, double, double, double> GetEfficiencies();
 
-      Cndarray  An(uint MaxOrder),
-                Bn(uint MaxOrder),
-                Cn(uint MaxOrder),
-                Dn(uint MaxOrder);
-
 
   SHELLSPHERE1(complex128 ShellIndex,
                complex128 CoreIndex,
@@ -78,35 +74,6 @@ SHELLSPHERE1::ComputeAnBn(complex128* an, complex128* bn, uint MaxOrder)
   HighFreqAnBn(an, bn, MaxOrder);
 }
 
-Cndarray
-SHELLSPHERE1::Bn(uint MaxOrder)
-{
-  Cndarray     an         = Cndarray(MaxOrder),
-               bn         = Cndarray(MaxOrder);
-
-  complex128 * anPtr      = (complex128 *) an.request().ptr,
-             * bnPtr      = (complex128 *) bn.request().ptr;
-
-  this->HighFreqAnBn(anPtr, bnPtr, MaxOrder);
-  return bn;
-}
-
-
-Cndarray
-SHELLSPHERE1::An(uint MaxOrder)
-{
-  Cndarray     an         = Cndarray(MaxOrder),
-               bn         = Cndarray(MaxOrder);
-
-  complex128 * anPtr      = (complex128 *) an.request().ptr,
-             * bnPtr      = (complex128 *) bn.request().ptr;
-
-  this->HighFreqAnBn(anPtr, bnPtr, MaxOrder);
-  return an;
-}
-
-
-
 void
 SHELLSPHERE1::HighFreqAnBn(complex128* an, complex128* bn, uint MaxOrder)
 {
@@ -123,31 +90,33 @@ SHELLSPHERE1::HighFreqAnBn(complex128* an, complex128* bn, uint MaxOrder)
   //int nmax = (int) ( 2. + xShell + 4. * ( pow(xShell, 1./3.) ) );
   int nmx  = (int) ( std::max( MaxOrder, mx ) + 16. )  ;
 
-  iVec pv, pw, py, chv, chw, chy, p1y, ch1y, gsy, gs1y;
+  Scratch&     Buffer = GetScratch();
 
-  p1y. push_back( sin(xShell) ) ;
-  ch1y.push_back( cos(xShell) ) ;
+  complex128 * pv     = Reserve(Buffer.Pv,  MaxOrder + 1),
+             * pw     = Reserve(Buffer.Pw,  MaxOrder + 1),
+             * py     = Reserve(Buffer.Py,  MaxOrder + 1),
+             * chv    = Reserve(Buffer.Chv, MaxOrder + 1),
+             * chw    = Reserve(Buffer.Chw, MaxOrder + 1),
+             * chy    = Reserve(Buffer.Chy, MaxOrder + 1),
+             * Du     = Reserve(Buffer.Du, nmx),
+             * Dv     = Reserve(Buffer.Dv, nmx),
+             * Dw     = Reserve(Buffer.Dw, nmx);
 
-  for (int i=0; i<MaxOrder+1; i++)
+  for (uint i=0; i<MaxOrder+1; i++)
   {
     double nu = i + 1.5 ;
-    pw.push_back( sw*F90Jn(nu,w) );
-    pv.push_back( sv*F90Jn(nu,v) );
-    py.push_back( sy*F90Jn(nu,xShell) );
-
-    chv.push_back( -sv*F90Yn(nu,v) );
-    chw.push_back( -sw*F90Yn(nu,w) );
-    chy.push_back( -sy*F90Yn(nu,xShell) );
-
-    p1y.push_back ( py[i]  );
-    ch1y.push_back( chy[i] );
-    gsy.push_back ( py[i]  - JJ * chy[i]  );
-    gs1y.push_back ( p1y[i] - JJ * ch1y[i] );
+    pw[i]  = sw*F90Jn(nu,w);
+    pv[i]  = sv*F90Jn(nu,v);
+    py[i]  = sy*F90Jn(nu,xShell);
+
+    chv[i] = -sv*F90Yn(nu,v);
+    chw[i] = -sw*F90Yn(nu,w);
+    chy[i] = -sy*F90Yn(nu,xShell);
   }
 
-  iVec Du = iVec(nmx, 0.),
-       Dv = iVec(nmx, 0.),
-       Dw = iVec(nmx, 0.);
+  Du[nmx-1] = 0.;
+  Dv[nmx-1] = 0.;
+  Dw[nmx-1] = 0.;
 
   for (int i = nmx-1; i > 1; i--)
   {
@@ -156,32 +125,32 @@ SHELLSPHERE1::HighFreqAnBn(complex128* an, complex128* bn, uint MaxOrder)
     Dw[i-1] = (double)i / w -1. / (Dw[i] + (double)i / w);
   }
 
-  Du.erase(Du.begin());
-  Dv.erase(Dv.begin());
-  Dw.erase(Dw.begin());
-
-  iVec uu, vv, fv, dns, gns, a1, b1;
-  for (int i=0; i<MaxOrder; i++)
+  for (uint i=0; i<MaxOrder; i++)
   {
-    double n = (double) (i+1);
-    uu.push_back ( m * Du[i] - Dv[i]  );
-    vv.push_back ( Du[i] / m - Dv[i] );
-    fv.push_back ( pv[i] / chv[i]    );
-    dns.push_back( ( ( uu[i] * fv[i] / pw[i] ) / ( uu[i] * ( pw[i] - chw[i] * fv[i] ) + ( pw[i] / pv[i] ) / chv[i] ) ) + Dw[i] );
-    gns.push_back( ( ( vv[i] * fv[i] / pw[i] ) / ( vv[i] * ( pw[i] - chw[i] * fv[i] ) + ( pw[i] / pv[i] ) / chv[i] ) ) + Dw[i] );
-    a1.push_back ( dns[i] / ShellIndex + n / xShell );
-    b1.push_back ( ShellIndex * gns[i] + n / xShell );
-    an[i] = ( py[i] * a1[i] - p1y[i] ) / ( gsy[i] * a1[i] - gs1y[i] ) ;
-    bn[i] = ( py[i] * b1[i] - p1y[i] ) / ( gsy[i] * b1[i] - gs1y[i] ) ;
+    double     n    = (double) (i+1);
+
+    complex128 p1y  = (i == 0) ? (complex128) sin(xShell) : py[i-1],
+               ch1y = (i == 0) ? (complex128) cos(xShell) : chy[i-1],
+               gsy  = py[i] - JJ * chy[i],
+               gs1y = p1y   - JJ * ch1y,
+               uu   = m * Du[i+1] - Dv[i+1],
+               vv   = Du[i+1] / m - Dv[i+1],
+               fv   = pv[i] / chv[i],
+               dns  = ( ( uu * fv / pw[i] ) / ( uu * ( pw[i] - chw[i] * fv ) + ( pw[i] / pv[i] ) / chv[i] ) ) + Dw[i+1],
+               gns  = ( ( vv * fv / pw[i] ) / ( vv * ( pw[i] - chw[i] * fv ) + ( pw[i] / pv[i] ) / chv[i] ) ) + Dw[i+1],
+               a1   = dns / ShellIndex + n / xShell,
+               b1   = ShellIndex * gns + n / xShell;
+
+    an[i] = ( py[i] * a1 - p1y ) / ( gsy * a1 - gs1y ) ;
+    bn[i] = ( py[i] * b1 - p1y ) / ( gsy * b1 - gs1y ) ;
   }
-
-
-
 }
 
 std::tuple<double, double, double, double, double, double, double>
 SHELLSPHERE1::GetEfficiencies()
 {
+  PROFILE("Efficiencies");
+
     double _nMedium = nMedium;
 
     complex128 _mCore   = CoreIndex  / _nMedium,
@@ -190,10 +159,10 @@ SHELLSPHERE1::GetEfficiencies()
     double _xCore   = PI * CoreDiameter  * _nMedium / Wavelength,
            _xShell  = PI * ShellDiameter * _nMedium / Wavelength;
 
-    complex128 * an         = (complex128*) calloc(MaxOrder, sizeof(complex128)),
-               * bn         = (complex128*) calloc(MaxOrder, sizeof(complex128));
+    this->CacheAnBn(MaxOrder);
 
-    this->ComputeAnBn(an, bn, MaxOrder);
+    complex128 * an         = anCache.data(),
+               * bn         = bnCache.data();
 
     double Qsca   = GetQsca(an, bn, MaxOrder, _xShell);
     double Qext   = GetQext(an, bn, MaxOrder, _xShell);
@@ -203,8 +172,6 @@ SHELLSPHERE1::GetEfficiencies()
     double Qpr    = Qext - g * Qsca;
     double Qratio = Qback / Qsca;
 
-    free(an);
-    free(bn);
     return std::make_tuple(Qsca, Qext, Qabs, Qback, Qratio, g, Qpr);
 }
 
@@ -19,6 +19,9 @@ private:
                 Mu,
                 MuScat;
 
+  iVec          cnCache,
+                dnCache;
+
     double&     Getk(){return this->k;};
     double&     GetPolarization(){return this->Polarization;};
     double&     GetE0(){return this->E0;};
@@ -28,12 +31,11 @@ private:
     void        ComputeAnBn( complex128* an, complex128* bn, uint MaxOrder),
                 LowFreqAnBn( complex128* an, complex128* bn),
                 HighFreqAnBn(complex128* an, complex128* bn, uint MaxOrder),
-                HighFreqCnDn(complex128* an, complex128* bn, uint MaxOrder);
+                HighFreqCnDn(complex128* an, complex128* bn, uint MaxOrder),
+                CacheCnDn(uint MaxOrder);
 
     public:
-      Cndarray  An(uint MaxOrder),
-                Bn(uint MaxOrder),
-                Cn(uint MaxOrder),
+      Cndarray  Cn(uint MaxOrder),
                 Dn(uint MaxOrder);
 
 
@@ -63,46 +65,39 @@ private:
 void
 SPHERE::ComputeAnBn(complex128* an, complex128* bn, uint MaxOrder)
 {
-  HighFreqAnBn(an, bn, MaxOrder) ;
-  //if (SizeParam < 0.5){LowFreqAnBn(an, bn) ; }
-  //else                {HighFreqAnBn(an, bn, MaxOrder) ; }
+  HighFreqAnBn(an, bn, MaxOrder) ;                                              // full series at any size parameter: an() and bn() return these coefficients
 }
 
 
 void
 SPHERE::HighFreqAnBn(complex128* an, complex128* bn, uint MaxOrder)
 {
-
-  complex128 mx   = Index * SizeParam,
-             temp = sqrt(0.5 * PI * SizeParam);
+  complex128 mx   = Index * SizeParam;
 
   uint nmx = std::max( MaxOrder, (uint) std::abs(mx) ) + 16;
 
-  iVec gsx, gs1x, px, chx, p1x, ch1x, D, da, db;
+  Scratch&     Buffer = GetScratch();
 
-  iVec Dn = iVec(nmx);
+  complex128 * Dn     = Reserve(Buffer.Dn, nmx);
 
-  p1x.push_back( sin(SizeParam) );
-  ch1x.push_back( cos(SizeParam) );
+  double     * psi    = Reserve(Buffer.Psi, MaxOrder + 1),
+             * chi    = Reserve(Buffer.Chi, MaxOrder + 1);
 
   ComputeDn(nmx, mx, Dn);
 
+  RiccatiBessel(SizeParam, MaxOrder, nmx, psi, chi);
+
   for (uint i = 0; i < MaxOrder; i++)
     {
-        px.push_back(  SizeParam * F90jn( (double)(i+1), SizeParam ) );
-        chx.push_back(-SizeParam * F90yn( (double)(i+1), SizeParam ) );
+        double     n   = (double)(i+1);
 
-        p1x.push_back(px[i]);
-        ch1x.push_back(chx[i]);
-
-        gsx.push_back( px[i] - 1.*JJ * chx[i] );
-        gs1x.push_back( p1x[i] - 1.*JJ * ch1x[i] );
-
-        da.push_back( Dn[i+1] / Index + (double)(i+1) / SizeParam );
-        db.push_back( Index * Dn[i+1] + (double)(i+1) / SizeParam );
-        an[i] = (da[i] * px[i] - p1x[i]) / (da[i] * gsx[i] - gs1x[i]) ;
-        bn[i] = (db[i] * px[i] - p1x[i]) / (db[i] * gsx[i] - gs1x[i]) ;
+        complex128 gsx  = psi[i+1] - 1.*JJ * chi[i+1],
+                   gs1x = psi[i]   - 1.*JJ * chi[i],
+                   da   = Dn[i+1] / Index + n / SizeParam,
+                   db   = Index * Dn[i+1] + n / SizeParam;
 
+        an[i] = (da * psi[i+1] - psi[i]) / (da * gsx - gs1x) ;
+        bn[i] = (db * psi[i+1] - psi[i]) / (db * gsx - gs1x) ;
     }
 
 }
@@ -115,40 +110,52 @@ SPHERE::HighFreqCnDn(complex128* cn, complex128* dn, uint MaxOrder)
 
   uint nmx = std::max( MaxOrder, (uint) std::abs(mx) ) + 16;
 
-  iVec Cnx = iVec(nmx);
-  iVec Cnn, jnx, jnmx, yx, hx, b1x, y1x, hn1x, ax, ahx, numerator;
-  iVec c_denominator, d_denominator;
+  Scratch&     Buffer = GetScratch();
+
+  complex128 * Cnx    = Reserve(Buffer.Cnx, nmx),
+             * psim   = Reserve(Buffer.Psim, MaxOrder + 1);
+
+  double     * psi    = Reserve(Buffer.Psi, MaxOrder + 1),
+             * chi    = Reserve(Buffer.Chi, MaxOrder + 1);
 
-  b1x.push_back( +sin(SizeParam) / SizeParam );
-  y1x.push_back( -cos(SizeParam) / SizeParam );
+  Cnx[nmx-1] = 0.;
 
   for (double i = nmx; i > 1; i--)
   {
-    Cnx[i-2] = i - mx*mx/(Cnx[i-1] + i);
+    Cnx[(uint) i-2] = i - mx*mx/(Cnx[(uint) i-1] + i);
   }
 
+  RiccatiBessel(SizeParam, MaxOrder, nmx, psi, chi);
+
+  RiccatiBessel(mx, MaxOrder, nmx, psim);
+
   for (uint i = 0; i < MaxOrder; i++)
   {
-    Cnn.push_back( Cnx[i] );
-    jnx.push_back(  F90jn( (double)(i+1), SizeParam ) );
+    double     n         = (double)(i+1);
+
+    complex128 jnx       = psi[i+1] / SizeParam,
+               jnmx      = mx / psim[i+1],
+               hx        = ( psi[i+1] - JJ * chi[i+1] ) / SizeParam,
+               hn1x      = ( psi[i]   - JJ * chi[i]   ) / SizeParam,
+               ax        = psi[i] - n * jnx,
+               ahx       = SizeParam * hn1x - n * hx,
+               numerator = jnx * ahx - hx * ax;
+
+    cn[i] = jnmx * numerator / ( ahx - hx * Cnx[i] ) ;
+    dn[i] = jnmx * Index * numerator / ( Index * Index * ahx - hx * Cnx[i] ) ;
+  }
+}
 
-    jnmx.push_back( 1. / ( F90jn( (double)(i+1), mx ) ) );
-    yx.push_back( F90yn( (double)( i + 1 ), SizeParam ) );
-    hx.push_back( jnx[i] + JJ * yx[i] );
 
-    b1x.push_back( jnx[i] );
-    y1x.push_back( yx[i] );
-    hn1x.push_back( b1x[i] + JJ * y1x[i] );
+void
+SPHERE::CacheCnDn(uint MaxOrder)
+{
+  if (cnCache.size() >= MaxOrder) return;
 
-    ax.push_back(  SizeParam * b1x[i] - (double)( i + 1 ) * jnx[i] );
-    ahx.push_back( SizeParam * hn1x[i] - (double)( i + 1 ) * hx[i] );
+  cnCache.resize(MaxOrder);
+  dnCache.resize(MaxOrder);
 
-    numerator.push_back( jnx[i] * ahx[i] - hx[i] * ax[i] );
-    c_denominator.push_back( ahx[i] - hx[i] * Cnn[i] );
-    d_denominator.push_back( Index * Index * ahx[i] - hx[i] * Cnn[i] );
-    cn[i] = jnmx[i] * numerator[i] / c_denominator[i] ;
-    dn[i] = jnmx[i] * Index * numerator[i] / d_denominator[i] ;
-  }
+  this->HighFreqCnDn(cnCache.data(), dnCache.data(), MaxOrder);
 }
 
 
@@ -172,58 +179,21 @@ SPHERE::LowFreqAnBn(complex128* an, complex128* bn)
 Cndarray
 SPHERE::Dn(uint MaxOrder)
 {
-  Cndarray     cn         = Cndarray(MaxOrder),
-               dn         = Cndarray(MaxOrder);
+  this->CacheCnDn(MaxOrder);
 
-  complex128 * cnPtr      = (complex128 *) cn.request().ptr,
-             * dnPtr      = (complex128 *) dn.request().ptr;
-
-  this->HighFreqCnDn(cnPtr, dnPtr, MaxOrder);
-  return dn;
+  return Cndarray(MaxOrder, dnCache.data());
 }
 
 
 Cndarray
 SPHERE::Cn(uint MaxOrder)
 {
-  Cndarray     cn         = Cndarray(MaxOrder),
-               dn         = Cndarray(MaxOrder);
-
-  complex128 * cnPtr      = (complex128 *) cn.request().ptr,
-             * dnPtr      = (complex128 *) dn.request().ptr;
+  this->CacheCnDn(MaxOrder);
 
-  this->HighFreqCnDn(cnPtr, dnPtr, MaxOrder);
-  return cn;
+  return Cndarray(MaxOrder, cnCache.data());
 }
 
 
-Cndarray
-SPHERE::Bn(uint MaxOrder)
-{
-  Cndarray     an         = Cndarray(MaxOrder),
-               bn         = Cndarray(MaxOrder);
-
-  complex128 * anPtr      = (complex128 *) an.request().ptr,
-             * bnPtr      = (complex128 *) bn.request().ptr;
-
-  this->HighFreqAnBn(anPtr, bnPtr, MaxOrder);
-  return bn;
-}
-
-
-Cndarray
-SPHERE::An(uint MaxOrder)
-{
-  Cndarray     an         = Cndarray(MaxOrder),
-               bn         = Cndarray(MaxOrder);
-
-  complex128 * anPtr      = (complex128 *) an.request().ptr,
-             * bnPtr      = (complex128 *) bn.request().ptr;
-
-  this->HighFreqAnBn(anPtr, bnPtr, MaxOrder);
-  return an;
-}
-
 
 
 
@@ -2,10 +2,12 @@
 #include "../includes/SpecialFunc.h"
 #include "../includes/utils.h"
 #include "../includes/BaseFunc.h"
+#include "../../includes/Profiler.h"
 #include "../includes/BaseClass.h"
 #include "Sphere.cpp"
 #include "ShellSphere1.cpp"
 #include "Cylinder.cpp"
+#include "Batch.cpp"
 #include <iostream>
 
 
@@ -15,6 +17,17 @@
 PYBIND11_MODULE(Scatterer, module) {
     module.doc() = "Lorenz-Mie Theory (GLMT) c++ binding module for light scattering from a spherical scatterer";
 
+      Profiler::Bind(module);
+
+      module.def("SetNumThreads",
+                 &SetNumThreads,
+                 py::arg("N"),
+                 "Set the number of OpenMP threads used by the field kernels");
+
+      module.def("GetNumThreads",
+                 &GetNumThreads,
+                 "Return the number of OpenMP threads used by the field kernels");
+
 
       py::class_<SPHERE>(module, "SPHERE")
       .def(py::init<complex128, double, double, double, double, double>(),
@@ -51,14 +64,16 @@ PYBIND11_MODULE(Scatterer, module) {
            py::arg("Phi"),
            py::arg("Theta"))
 
-      .def("an", &SPHERE::An, py::arg("MaxOrder")  = 5)
+      .def("an", &BASE::An, py::arg("MaxOrder")  = 5)
 
-      .def("bn", &SPHERE::Bn, py::arg("MaxOrder")  = 5)
+      .def("bn", &BASE::Bn, py::arg("MaxOrder")  = 5)
 
       .def("cn", &SPHERE::Cn, py::arg("MaxOrder")  = 5)
 
       .def("dn", &SPHERE::Dn, py::arg("MaxOrder")  = 5)
 
+      .def_property_readonly("MaxOrder", &BASE::GetOrder)
+
       .def_property_readonly("Efficiencies", &BASE::GetEfficiencies);
 
 
@@ -101,9 +116,11 @@ PYBIND11_MODULE(Scatterer, module) {
            py::arg("Phi"),
            py::arg("Theta"))
 
-      .def("an", &SHELLSPHERE1::An, py::arg("MaxOrder")  = 5)
+      .def("an", &BASE::An, py::arg("MaxOrder")  = 5)
+
+      .def("bn", &BASE::Bn, py::arg("MaxOrder")  = 5)
 
-      .def("bn", &SHELLSPHERE1::Bn, py::arg("MaxOrder")  = 5)
+      .def_property_readonly("MaxOrder", &BASE::GetOrder)
 
       .def_property_readonly("Efficiencies", &SHELLSPHERE1::GetEfficiencies);
 
@@ -147,11 +164,37 @@ PYBIND11_MODULE(Scatterer, module) {
            py::arg("Phi"),
            py::arg("Theta"))
 
-      .def("an", &CYLINDER::An, py::arg("MaxOrder")  = 5)
+      .def("an", &BASE::An, py::arg("MaxOrder")  = 5)
 
-      .def("bn", &CYLINDER::Bn, py::arg("MaxOrder")  = 5)
+      .def("bn", &BASE::Bn, py::arg("MaxOrder")  = 5)
+
+      .def_property_readonly("MaxOrder", &BASE::GetOrder)
 
       .def_property_readonly("Efficiencies", &BASE::GetEfficiencies);
+
+
+
+      module.def("SphereEfficiencies",
+                 &SphereEfficiencies,
+                 py::arg("Index"),
+                 py::arg("Diameter"),
+                 py::arg("Wavelength"),
+                 py::arg("nMedium"),
+                 "Compute (Qsca, Qext, Qabs, Qback, Qratio, g, Qpr) for flat arrays of spheres");
+
+      module.def("Efficiencies",
+                 &Efficiencies,
+                 py::arg("Index"),
+                 py::arg("Diameter"),
+                 py::arg("Wavelength"),
+                 py::arg("nMedium") = 1.,
+                 "Compute the sphere efficiencies for every broadcast combination of the inputs");
+
+      module.def("PiTau",
+                 &PiTau,
+                 py::arg("Phi"),
+                 py::arg("MaxOrder"),
+                 "Compute the angular functions pi_n and tau_n [len(Phi), MaxOrder] used by S1S2");
 }
 
 
@@ -5,7 +5,10 @@ class BASE{
     public:
         double E0, k, Polarization;
 
-        void  ComputePrefactor(double* prefactor, uint MaxOrder);
+        iVec   anCache, bnCache;
+
+        void  ComputePrefactor(double* prefactor, uint MaxOrder),
+              CacheAnBn(uint MaxOrder);
 
         virtual void ComputeAnBn(complex128* an, complex128* bn, uint MaxOrder){};
 
@@ -15,17 +18,24 @@ class BASE{
 
         virtual double& GetPolarization(){return this->Polarization;};
 
-        virtual double& GetSizeParam(){};
+        virtual double& GetSizeParam() = 0;
+
+        uint GetOrder(){ return GetMaxOrder(this->GetSizeParam()); };
 
         std::tuple<double, double, double, double, double, double, double> GetEfficiencies();
 
+        Cndarray An(uint MaxOrder),
+                 Bn(uint MaxOrder);
+
+        void  ComputeS1S2(double* PhiPtr, uint PhiLength, complex128* s1Ptr, complex128* s2Ptr);
+
         std::tuple<Cndarray,Cndarray> S1S2(const ndarray Phi),
                                       sS1S2(  ndarray& Phi, ndarray& Theta),
                                       uS1S2(  ndarray& Phi, ndarray& Theta),
                                       sFields(ndarray& Phi, ndarray& Theta, double R),
                                       uFields(ndarray& Phi, ndarray& Theta, double R);
 
-        inline void MiePiTau(double mu, uint MaxOrder, complex128 *pin, complex128 *taun);
+        static void MiePiTau(double mu, uint MaxOrder, complex128 *pin, complex128 *taun);
 
         BASE(){}
 
@@ -69,84 +79,141 @@ BASE::ComputePrefactor(double* prefactor, uint MaxOrder)
 
 
 
+void
+BASE::CacheAnBn(uint MaxOrder)
+{
+  if (anCache.size() >= MaxOrder) return;
+
+  anCache.resize(MaxOrder);
+  bnCache.resize(MaxOrder);
+
+  PROFILE("ComputeAnBn");
+
+  this->ComputeAnBn(anCache.data(), bnCache.data(), MaxOrder);
+}
+
+
+Cndarray
+BASE::An(uint MaxOrder)
+{
+  this->CacheAnBn(MaxOrder);
+
+  return Cndarray(MaxOrder, anCache.data());
+}
+
+
+Cndarray
+BASE::Bn(uint MaxOrder)
+{
+  this->CacheAnBn(MaxOrder);
+
+  return Cndarray(MaxOrder, bnCache.data());
+}
+
+
 std::tuple<Cndarray,Cndarray>
 BASE::S1S2(const ndarray Phi)
 {
-  uint MaxOrder           = GetMaxOrder(this->GetSizeParam());
+  uint         PhiLength    = Phi.request().shape[0];
 
-  uint PhiLength          = Phi.request().shape[0];
+  double     * PhiPtr       = (double*) Phi.request().ptr;
 
-  double     * PhiPtr     = (double*) Phi.request().ptr,
-             * prefactor  = (double*) calloc(MaxOrder, sizeof(double));
+  Cndarray     s1           = Cndarray(PhiLength),
+               s2           = Cndarray(PhiLength);
 
-  Cndarray     s1         = Cndarray(PhiLength),
-               s2         = Cndarray(PhiLength);
+  complex128 * s1Ptr        = (complex128 *) s1.request().ptr,
+             * s2Ptr        = (complex128 *) s2.request().ptr;
 
-  complex128 * s1Ptr      = (complex128 *) s1.request().ptr,
-             * s2Ptr      = (complex128 *) s2.request().ptr,
-             * an         = (complex128*) calloc(MaxOrder, sizeof(complex128)),
-             * bn         = (complex128*) calloc(MaxOrder, sizeof(complex128)),
-             * pin        = (complex128*) calloc(MaxOrder, sizeof(complex128)),
-             * taun       = (complex128*) calloc(MaxOrder, sizeof(complex128));
+  this->CacheAnBn( GetMaxOrder(this->GetSizeParam()) );
 
-  this->ComputeAnBn(an, bn, MaxOrder);
+  {
+    py::gil_scoped_release Release;
+
+    this->ComputeS1S2(PhiPtr, PhiLength, s1Ptr, s2Ptr);
+  }
+
+  return std::make_tuple(s1, s2)  ;
+}
+
+
+void
+BASE::ComputeS1S2(double* PhiPtr, uint PhiLength, complex128* s1Ptr, complex128* s2Ptr)
+{
+  PROFILE("S1S2");
+
+  uint MaxOrder           = GetMaxOrder(this->GetSizeParam());
+
+  double     * prefactor  = Reserve(GetScratch().Prefactor, MaxOrder);
+
+  this->CacheAnBn(MaxOrder);
+
+  complex128 * an         = anCache.data(),
+             * bn         = bnCache.data();
 
   this->ComputePrefactor(prefactor, MaxOrder);
 
-  for (uint i = 0; i < PhiLength; i++){
+  #pragma omp parallel num_threads(NumThreads)
+  {
+    Scratch&     Buffer   = GetScratch();
 
-      MiePiTau( cos( PhiPtr[i]-PI/2 ), MaxOrder, pin, taun );
-      s1Ptr[i] = 0.;
-      s2Ptr[i] = 0.;
+    complex128 * pin      = Reserve(Buffer.Pin, MaxOrder),
+               * taun     = Reserve(Buffer.Taun, MaxOrder);
 
-      for (uint m = 0; m < MaxOrder ; m++){
-          s1Ptr[i]    += prefactor[m] * ( an[m] * pin[m] +  bn[m] * taun[m] );
-          s2Ptr[i]    += prefactor[m] * ( an[m] * taun[m] + bn[m] * pin[m]  );
-        }
-  }
+    #pragma omp for
+    for (int i = 0; i < (int) PhiLength; i++){
 
-  free(pin);
-  free(taun);
-  free(an);
-  free(bn);
-  free(prefactor);
-  s1Ptr = NULL;
-  s2Ptr = NULL;
+        MiePiTau( cos( PhiPtr[i]-PI/2 ), MaxOrder, pin, taun );
+        s1Ptr[i] = 0.;
+        s2Ptr[i] = 0.;
 
-  return std::make_tuple(s1, s2)  ;
+        for (uint m = 0; m < MaxOrder ; m++){
+            s1Ptr[i]    += prefactor[m] * ( an[m] * pin[m] +  bn[m] * taun[m] );
+            s2Ptr[i]    += prefactor[m] * ( an[m] * taun[m] + bn[m] * pin[m]  );
+          }
+    }
+  }
 }
 
 
 std::tuple<Cndarray,Cndarray>
 BASE::sFields(ndarray& Phi, ndarray& Theta, double R)
 {
+  PROFILE("sFields");
+
   uint         PhiLength    = Phi.request().shape[0],
                ThetaLength  = Theta.request().shape[0];
 
- Cndarray     ETheta     = Cndarray(PhiLength*ThetaLength),
-              EPhi       = Cndarray(PhiLength*ThetaLength);
+  Cndarray     ETheta       = Cndarray(PhiLength*ThetaLength),
+               EPhi         = Cndarray(PhiLength*ThetaLength),
+               S1           = Cndarray(PhiLength),
+               S2           = Cndarray(PhiLength);
 
-  double     * ThetaPtr     = (double*) Theta.request().ptr,
-             * CosTerm      = (double*) calloc(ThetaLength, sizeof(double)),
-             * SinTerm      = (double*) calloc(ThetaLength, sizeof(double));
+  double     * PhiPtr       = (double*) Phi.request().ptr,
+             * ThetaPtr     = (double*) Theta.request().ptr;
 
-  Cndarray     S1, S2;
+  complex128   propagator   = this->GetE0() / (this->Getk() * R) * exp(-JJ*this->Getk()*R);
 
-  complex128   propagator = this->GetE0() / (this->Getk() * R) * exp(-JJ*this->Getk()*R);
+  complex128 * EPhiPtr      = (complex128*) ETheta.request().ptr,
+             * EThetaPtr    = (complex128*) EPhi.request().ptr,
+             * S1Ptr        = (complex128*) S1.request().ptr,
+             * S2Ptr        = (complex128*) S2.request().ptr;
 
-  PolarizationTerm(ThetaLength, ThetaPtr, CosTerm, SinTerm, this->GetPolarization());
+  this->CacheAnBn( GetMaxOrder(this->GetSizeParam()) );
 
+  {
+    py::gil_scoped_release Release;
 
-  std::tie(S1, S2) = S1S2(Phi);
+    double   * CosTerm      = Reserve(GetScratch().CosTerm, ThetaLength),
+             * SinTerm      = Reserve(GetScratch().SinTerm, ThetaLength);
 
-  complex128 * EPhiPtr    = (complex128*) ETheta.request().ptr,
-             * EThetaPtr  = (complex128*) EPhi.request().ptr,
-             * S1Ptr      = (complex128*) S1.request().ptr,
-             * S2Ptr      = (complex128*) S2.request().ptr;
+    PolarizationTerm(ThetaLength, ThetaPtr, CosTerm, SinTerm, this->GetPolarization());
 
-   Structured(ThetaLength, PhiLength, S2Ptr, CosTerm, - propagator, EPhiPtr);
+    this->ComputeS1S2(PhiPtr, PhiLength, S1Ptr, S2Ptr);
 
-   Structured(ThetaLength, PhiLength, S1Ptr, SinTerm, JJ * propagator, EThetaPtr);
+    Structured(ThetaLength, PhiLength, S2Ptr, CosTerm, - propagator, EPhiPtr);
+
+    Structured(ThetaLength, PhiLength, S1Ptr, SinTerm, JJ * propagator, EThetaPtr);
+  }
 
    EPhi.resize({PhiLength,ThetaLength});
    ETheta.resize({PhiLength,ThetaLength});
@@ -162,35 +229,43 @@ BASE::sFields(ndarray& Phi, ndarray& Theta, double R)
 std::tuple<Cndarray,Cndarray>
 BASE::uFields(ndarray& Phi, ndarray& Theta, double R)
 {
+  PROFILE("uFields");
+
   uint         PhiLength    = Phi.request().shape[0],
                ThetaLength  = Theta.request().shape[0];
 
-  double     * ThetaPtr     = (double*) Theta.request().ptr,
-             * CosTerm      = (double*) calloc(ThetaLength, sizeof(double)),
-             * SinTerm      = (double*) calloc(ThetaLength, sizeof(double));
+  double     * PhiPtr       = (double*) Phi.request().ptr,
+             * ThetaPtr     = (double*) Theta.request().ptr;
+
+  Cndarray     ETheta       = Cndarray(PhiLength),
+               EPhi         = Cndarray(PhiLength),
+               S1           = Cndarray(PhiLength),
+               S2           = Cndarray(PhiLength);
 
-  Cndarray     ETheta     = Cndarray(PhiLength),
-               EPhi       = Cndarray(PhiLength),
-               S1,
-               S2;
+  complex128   propagator   = this->GetE0() / (this->Getk() * R) * exp(-JJ*this->Getk()*R);
 
-  complex128   propagator = this->GetE0() / (this->Getk() * R) * exp(-JJ*this->Getk()*R);
+  complex128 * EPhiPtr      = (complex128*) ETheta.request().ptr,
+             * EThetaPtr    = (complex128*) EPhi.request().ptr,
+             * S1Ptr        = (complex128*) S1.request().ptr,
+             * S2Ptr        = (complex128*) S2.request().ptr;
 
-  PolarizationTerm(ThetaLength, ThetaPtr, CosTerm, SinTerm, this->GetPolarization());
+  this->CacheAnBn( GetMaxOrder(this->GetSizeParam()) );
 
-  std::tie(S1, S2) = this->S1S2(Phi);
+  {
+    py::gil_scoped_release Release;
 
-  complex128 * EPhiPtr    = (complex128*) ETheta.request().ptr,
-             * EThetaPtr  = (complex128*) EPhi.request().ptr,
-             * S1Ptr      = (complex128*) S1.request().ptr,
-             * S2Ptr      = (complex128*) S2.request().ptr;
+    double   * CosTerm      = Reserve(GetScratch().CosTerm, ThetaLength),
+             * SinTerm      = Reserve(GetScratch().SinTerm, ThetaLength);
 
-  Unstructured(ThetaLength, PhiLength, S2Ptr, CosTerm, - propagator, EPhiPtr);
+    PolarizationTerm(ThetaLength, ThetaPtr, CosTerm, SinTerm, this->GetPolarization());
 
-  Unstructured(ThetaLength, PhiLength, S1Ptr, SinTerm, JJ * propagator, EThetaPtr);
+    this->ComputeS1S2(PhiPtr, PhiLength, S1Ptr, S2Ptr);
+
+    Unstructured(ThetaLength, PhiLength, S2Ptr, CosTerm, - propagator, EPhiPtr);
+
+    Unstructured(ThetaLength, PhiLength, S1Ptr, SinTerm, JJ * propagator, EThetaPtr);
+  }
 
-  free(CosTerm);
-  free(SinTerm);
   return std::make_tuple(EPhi, ETheta)  ;
 }
 
@@ -200,31 +275,41 @@ BASE::uFields(ndarray& Phi, ndarray& Theta, double R)
 std::tuple<Cndarray,Cndarray>
 BASE::sS1S2(ndarray& Phi, ndarray& Theta)
 {
+  PROFILE("sS1S2");
+
 
   uint         PhiLength    = Phi.request().shape[0],
                ThetaLength  = Theta.request().shape[0];
 
-  double     * ThetaPtr     = (double*) Theta.request().ptr,
-             * CosTerm      = (double*) calloc(ThetaLength, sizeof(double)),
-             * SinTerm      = (double*) calloc(ThetaLength, sizeof(double));
+  double     * PhiPtr       = (double*) Phi.request().ptr,
+             * ThetaPtr     = (double*) Theta.request().ptr;
+
+  Cndarray     ETheta       = Cndarray(PhiLength*ThetaLength),
+               EPhi         = Cndarray(PhiLength*ThetaLength),
+               S1           = Cndarray(PhiLength),
+               S2           = Cndarray(PhiLength);
+
+  complex128 * EPhiPtr      = (complex128*) ETheta.request().ptr,
+             * EThetaPtr    = (complex128*) EPhi.request().ptr,
+             * S1Ptr        = (complex128*) S1.request().ptr,
+             * S2Ptr        = (complex128*) S2.request().ptr;
+
+  this->CacheAnBn( GetMaxOrder(this->GetSizeParam()) );
 
-  Cndarray     ETheta     = Cndarray(PhiLength*ThetaLength),
-               EPhi       = Cndarray(PhiLength*ThetaLength),
-               S1,
-               S2;
+  {
+    py::gil_scoped_release Release;
 
-  PolarizationTerm(ThetaLength, ThetaPtr, CosTerm, SinTerm, this->GetPolarization());
+    double   * CosTerm      = Reserve(GetScratch().CosTerm, ThetaLength),
+             * SinTerm      = Reserve(GetScratch().SinTerm, ThetaLength);
 
-  std::tie(S1, S2) = this->S1S2(Phi);
+    PolarizationTerm(ThetaLength, ThetaPtr, CosTerm, SinTerm, this->GetPolarization());
 
-  complex128 * EPhiPtr    = (complex128*) ETheta.request().ptr,
-             * EThetaPtr  = (complex128*) EPhi.request().ptr,
-             * S1Ptr      = (complex128*) S1.request().ptr,
-             * S2Ptr      = (complex128*) S2.request().ptr;
+    this->ComputeS1S2(PhiPtr, PhiLength, S1Ptr, S2Ptr);
 
-  Structured(ThetaLength, PhiLength, S2Ptr, CosTerm, this->GetE0(), EPhiPtr);
+    Structured(ThetaLength, PhiLength, S2Ptr, CosTerm, this->GetE0(), EPhiPtr);
 
-  Structured(ThetaLength, PhiLength, S1Ptr, SinTerm, this->GetE0(), EThetaPtr);
+    Structured(ThetaLength, PhiLength, S1Ptr, SinTerm, this->GetE0(), EThetaPtr);
+  }
 
   EPhi.resize({PhiLength,ThetaLength});
   ETheta.resize({PhiLength,ThetaLength});
@@ -232,8 +317,6 @@ BASE::sS1S2(ndarray& Phi, ndarray& Theta)
   EPhi   = EPhi.attr("transpose")();
   ETheta = ETheta.attr("transpose")();
 
-  free(CosTerm);
-  free(SinTerm);
   return std::make_tuple(EPhi, ETheta)  ;
 }
 
@@ -242,34 +325,42 @@ BASE::sS1S2(ndarray& Phi, ndarray& Theta)
 std::tuple<Cndarray,Cndarray>
 BASE::uS1S2(ndarray& Phi, ndarray& Theta)
 {
+  PROFILE("uS1S2");
+
 
   uint         PhiLength    = Phi.request().shape[0],
                ThetaLength  = Theta.request().shape[0];
 
-  double     * ThetaPtr     = (double*) Theta.request().ptr,
-             * CosTerm      = (double*) calloc(ThetaLength, sizeof(double)),
-             * SinTerm      = (double*) calloc(ThetaLength, sizeof(double));
+  double     * PhiPtr       = (double*) Phi.request().ptr,
+             * ThetaPtr     = (double*) Theta.request().ptr;
+
+  Cndarray     ETheta       = Cndarray(PhiLength),
+               EPhi         = Cndarray(PhiLength),
+               S1           = Cndarray(PhiLength),
+               S2           = Cndarray(PhiLength);
+
+  complex128 * EPhiPtr      = (complex128*) ETheta.request().ptr,
+             * EThetaPtr    = (complex128*) EPhi.request().ptr,
+             * S1Ptr        = (complex128*) S1.request().ptr,
+             * S2Ptr        = (complex128*) S2.request().ptr;
 
-  Cndarray     ETheta     = Cndarray(PhiLength),
-               EPhi       = Cndarray(PhiLength),
-               S1,
-               S2;
+  this->CacheAnBn( GetMaxOrder(this->GetSizeParam()) );
 
-  PolarizationTerm(ThetaLength, ThetaPtr, CosTerm, SinTerm, this->GetPolarization());
+  {
+    py::gil_scoped_release Release;
 
-  std::tie(S1, S2) = this->S1S2(Phi);
+    double   * CosTerm      = Reserve(GetScratch().CosTerm, ThetaLength),
+             * SinTerm      = Reserve(GetScratch().SinTerm, ThetaLength);
 
-  complex128 * EPhiPtr    = (complex128*) ETheta.request().ptr,
-             * EThetaPtr  = (complex128*) EPhi.request().ptr,
-             * S1Ptr      = (complex128*) S1.request().ptr,
-             * S2Ptr      = (complex128*) S2.request().ptr;
+    PolarizationTerm(ThetaLength, ThetaPtr, CosTerm, SinTerm, this->GetPolarization());
 
-  Unstructured(ThetaLength, PhiLength, S2Ptr, CosTerm, this->GetE0(), EPhiPtr);
+    this->ComputeS1S2(PhiPtr, PhiLength, S1Ptr, S2Ptr);
 
-  Unstructured(ThetaLength, PhiLength, S1Ptr, SinTerm, this->GetE0(), EThetaPtr);
+    Unstructured(ThetaLength, PhiLength, S2Ptr, CosTerm, this->GetE0(), EPhiPtr);
+
+    Unstructured(ThetaLength, PhiLength, S1Ptr, SinTerm, this->GetE0(), EThetaPtr);
+  }
 
-  free(CosTerm);
-  free(SinTerm);
   return std::make_tuple(EPhi, ETheta)  ;
 
 }
@@ -280,12 +371,14 @@ BASE::uS1S2(ndarray& Phi, ndarray& Theta)
 std::tuple<double, double, double, double, double, double, double>
 BASE::GetEfficiencies()
 {
+  PROFILE("Efficiencies");
+
     uint MaxOrder   = GetMaxOrder(this->GetSizeParam());
 
-    complex128 * an         = (complex128*) calloc(MaxOrder, sizeof(complex128)),
-               * bn         = (complex128*) calloc(MaxOrder, sizeof(complex128));
+    this->CacheAnBn(MaxOrder);
 
-    this->ComputeAnBn(an, bn, MaxOrder);
+    complex128 * an         = anCache.data(),
+               * bn         = bnCache.data();
 
     double Qsca   = GetQsca(an, bn, MaxOrder, this->GetSizeParam());
     double Qext   = GetQext(an, bn, MaxOrder, this->GetSizeParam());
@@ -295,8 +388,6 @@ BASE::GetEfficiencies()
     double Qpr    = Qext - g * Qsca;
     double Qratio = Qback / Qsca;
 
-    free(an);
-    free(bn);
     return std::make_tuple(Qsca, Qext, Qabs, Qback, Qratio, g, Qpr);
 }
 
@@ -1,3 +1,28 @@
+struct Scratch
+{
+  Vec  Psi, Chi, Prefactor, CosTerm, SinTerm;
+
+  iVec Dn, Cnx, Psim, Pin, Taun, Du, Dv, Dw, Pv, Pw, Py, Chv, Chw, Chy;
+};
+
+
+inline Scratch&
+GetScratch()
+{
+  static thread_local Scratch Buffer;
+  return Buffer;
+}
+
+
+template <class T>
+inline T*
+Reserve(std::vector<T>& Buffer, uint Size)
+{
+  if (Buffer.size() < Size) Buffer.resize(Size);
+  return Buffer.data();
+}
+
+
 double
 GetQsca(complex128* an, complex128* bn, uint MaxOrder, double &SizeParam)
 {
@@ -33,25 +58,94 @@ GetQext(complex128* an, complex128* bn, uint MaxOrder, double &SizeParam)
 
 
 void
-ComputeDn(double nmx, complex128 mx, iVec& Dn)
+ComputeDn(double nmx, complex128 mx, complex128* Dn)
 {
+  Dn[(uint) nmx - 1] = 0.;
+
   for (double i = nmx - 1; i > 1; i--)
    {
-     Dn[i-1] = (i / mx) - ( 1. / (Dn[i] + i/mx) );
+     Dn[(uint) i-1] = (i / mx) - ( 1. / (Dn[(uint) i] + i/mx) );
    }
 }
 
 
 void
-ComputeDn(double nmx, double mx, Vec& Dn)
+ComputeDn(double nmx, double mx, double* Dn)
 {
+  Dn[(uint) nmx - 1] = 0.;
+
   for (double i = nmx - 1; i > 1; i--)
    {
-     Dn[i-1] = (i / mx) - ( 1. / (Dn[i] + i/mx) );
+     Dn[(uint) i-1] = (i / mx) - ( 1. / (Dn[(uint) i] + i/mx) );
    }
 }
 
 
+// psi_n = x j_n(x) by Miller's downward recurrence, started well above
+// MaxOrder and max(nmx, |x|), then normalised to the exact psi_0 = sin x or
+// psi_1 = sin x / x - cos x, whichever is larger. The upward recurrence
+// seeded with sin x is lost whenever sin x vanishes, i.e. x = k pi.
+template <class T>
+void
+RiccatiPsi(T x, uint MaxOrder, uint nmx, T* psi)
+{
+  uint Start   = std::max( nmx, MaxOrder + (uint) sqrt(40. * MaxOrder) ) + 16;
+
+  T    Next    = 0.,
+       Current = 1.,
+       psi1    = 0.;
+
+  for (uint n = Start; n > 0; n--)
+  {
+    if (std::abs(Current) > 1e150)
+    {
+      Current *= 1e-150; Next *= 1e-150;
+      for (uint m = n + 1; m < MaxOrder + 1; m++){ psi[m] *= 1e-150; }
+    }
+
+    if (n < MaxOrder + 1) psi[n] = Current;
+    if (n == 1)           psi1   = Current;
+
+    T Previous = (double)(2*n + 1) / x * Current - Next;
+
+    Next       = Current;
+    Current    = Previous;
+  }
+
+  psi[0]  = Current;
+
+  T Psi0  = sin(x),
+    Psi1  = sin(x) / x - cos(x),
+    Scale = std::abs(Psi0) > std::abs(Psi1) ? Psi0 / Current : Psi1 / psi1;
+
+  for (uint n = 1; n < MaxOrder + 1; n++){ psi[n] *= Scale; }
+
+  psi[0]  = Psi0;
+}
+
+
+void
+RiccatiBessel(double x, uint MaxOrder, uint nmx, double* psi, double* chi)
+{
+  RiccatiPsi(x, MaxOrder, nmx, psi);
+
+  chi[0] = cos(x);
+  chi[1] = cos(x) / x + sin(x);
+
+  for (uint n = 2; n < MaxOrder + 1; n++)
+  {
+    chi[n] = (double)(2*n - 1) / x * chi[n-1] - chi[n-2];
+  }
+}
+
+
+void
+RiccatiBessel(complex128 mx, uint MaxOrder, uint nmx, complex128* psi)
+{
+  RiccatiPsi(mx, MaxOrder, nmx, psi);
+}
+
+
 double
 Getg(complex128* an, complex128* bn, uint MaxOrder, double& SizeParam, double& Qsca)
 {
@@ -131,10 +225,10 @@ Unstructured(uint        ThetaLength,
              complex128  scalar,
              complex128 *output)
 {
-  for (uint p=0; p < PhiLength; p++ )
+  #pragma omp parallel for num_threads(NumThreads)
+  for (int p=0; p < (int) PhiLength; p++ )
   {
-    *output   = scalar * array0[p] * array1[p];
-     output++;
+    output[p] = scalar * array0[p] * array1[p];
   }
 }
 
@@ -147,12 +241,12 @@ Structured(uint        ThetaLength,
            complex128  scalar,
            complex128 *output)
 {
-  for (uint p=0; p < PhiLength; p++ )
+  #pragma omp parallel for num_threads(NumThreads)
+  for (int p=0; p < (int) PhiLength; p++ )
   {
     for (uint t=0; t < ThetaLength; t++ )
     {
-      *output   = scalar * array0[p] * array1[t];
-       output++;
+      output[p * ThetaLength + t] = scalar * array0[p] * array1[t];
     }
   }
 }
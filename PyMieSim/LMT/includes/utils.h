@@ -5,6 +5,9 @@
 #include <pybind11/pybind11.h>
 #include <pybind11/complex.h>
 #include <pybind11/numpy.h>
+#ifdef _OPENMP
+  #include <omp.h>
+#endif
 namespace py = pybind11;
 
 typedef py::array_t<double> ndarray;
@@ -12,6 +15,23 @@ typedef py::array_t<std::complex<double>> Cndarray;
 typedef py::buffer_info info;
 
 
+int
+DefaultNumThreads()
+{
+#ifdef _OPENMP
+  return omp_get_max_threads();
+#else
+  return 1;
+#endif
+}
+
+static int NumThreads = DefaultNumThreads();
+
+void SetNumThreads(int N){ NumThreads = std::max(N, 1); }
+
+int  GetNumThreads(){ return NumThreads; }
+
+
 uint
 GetMaxOrder(double SizeParam) {return (int) (2 + SizeParam + 4 * pow(SizeParam,1./3.)); }
 
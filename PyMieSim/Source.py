@@ -3,8 +3,11 @@
 
 
 import pandas as pd
-from numpy import cos, sin, exp, sqrt, pi, linspace, abs, arccos, array, all
+from numpy import cos, sin, exp, sqrt, pi, linspace, abs, arccos, array, all, vstack
 
+from PyMieSim.Tools.Cache             import DiskCache
+from PyMieSim.Tools                   import Stats
+from PyMieSim.Tools.Directories       import BSCPath
 from PyMieSim.Physics                 import _Polarization
 from PyMieSim.Tools.BaseClasses       import BaseSource
 from PyMieSim.Tools.utils             import IO
@@ -12,10 +15,17 @@ from PyMieSim.Tools.Constants         import *
 from PyMieSim.GLMT.GaussianBeam       import ( Anm,
                                                Anm_integrand,
                                                Bnm,
-                                               Bnm_integrand )
+                                               Bnm_integrand,
+                                               BSCTable,
+                                               BSCLocalized )
 
 
 EPS = 1e-20
+
+ImMethods = ['bessel', 'trapz', 'simpson']
+
+BSCCache = DiskCache(Path = BSCPath)
+
 class PlaneWave(BaseSource):
     """
     .. note::
@@ -254,19 +264,38 @@ class GaussianBeam(BaseSource):
         return tuple( zip( nlist, mlist ) )
 
 
-    def GetBSC(self, MaxOrder=5, save=False, Sampling=200):
+    def GetBSC(self, MaxOrder=5, save=False, Sampling=200, Tolerance=None, Cache=True, Method='quadrature', ImMethod='bessel'):
+        """
+        .. note::
+            Compute the beam shape coefficients up to MaxOrder.
+
+            With Method='quadrature' the whole table is evaluated in a
+            single c++ call on a Sampling points Simpson quadrature, unless
+            a Tolerance is given in which case each coefficient is
+            integrated adaptively to that tolerance. Results are stored in
+            the on-disk BSCCache, keyed by
+            (Wavelength, NA, Offset, MaxOrder, Sampling, Tolerance), and
+            reloaded from it on later calls unless Cache is False.
+
+            With Method='localized' the coefficients come from the closed
+            form integral localized approximation, which is only accurate
+            in the paraxial regime (see BSCError).
+
+            The modified Bessel functions :math:`I_m(\\beta)` of the
+            quadrature are evaluated in closed form (ImMethod='bessel'),
+            or, for validation, from their integral representation
+            (ImMethod='trapz' or 'simpson').
+
+        """
         #MaxOrder = self.GetMaxOrder(Precision)
         MaxOrder = (1,MaxOrder)
         idx = self.Getidx(MaxOrder)
         index = pd.MultiIndex.from_tuples(idx, names=["n", "m"])
 
-        BSCTE = r'$BSC_{TE}$'; BSCTM = r'$BSC_{TM}$'
-        BSC = pd.DataFrame(columns=[BSCTE, BSCTM], index=index)
-
-        for n, m in idx:
+        Table = self._BSCTable(MaxOrder[1], Sampling, Tolerance, Cache, Method, ImMethod)
 
-            BSC.at[(n,m), BSCTE] = self.BSC( n, m, mode='TE')
-            BSC.at[(n,m), BSCTM] = self.BSC( n, m, mode='TM')
+        BSCTE = r'$BSC_{TE}$'; BSCTM = r'$BSC_{TM}$'
+        BSC = pd.DataFrame(Table[:,2:], columns=[BSCTE, BSCTM], index=index)
 
 
         if save:
@@ -274,12 +303,84 @@ class GaussianBeam(BaseSource):
             print(f" Saving BSC into file:\n {fileName}")
             BSC.to_csv(f'./{fileName}', mode='w')
 
-        self._BSC_ = BSC.reset_index(level=[0,1]).to_numpy().astype(complex)
+        self._BSC_ = Table
 
         self.MaxOrder = MaxOrder[1]#int(self._BSC_[:,0].max().real)
 
         return BSC
 
+
+    def _BSCTable(self, MaxOrder, Sampling=200, Tolerance=None, Cache=True, Method='quadrature', ImMethod='bessel'):
+        assert Method in ['quadrature', 'localized'], IO( f"Method {Method} not in ['quadrature', 'localized']" )
+        assert ImMethod in ImMethods, IO( f"ImMethod {ImMethod} not in {ImMethods}" )
+
+        OnAxis = all( self.offset <= EPS )
+
+        if Method == 'localized':
+            return BSCLocalized(MaxOrder = MaxOrder,
+                                k        = self.k,
+                                w0       = self.w0,
+                                Offset   = self.Offset,
+                                OnAxis   = OnAxis)
+
+        Key = BSCCache.Key(Wavelength = self.Wavelength,
+                           NA         = self.NA,
+                           Offset     = self.offset,
+                           MaxOrder   = MaxOrder,
+                           Sampling   = Sampling if Tolerance is None else 0,
+                           Tolerance  = Tolerance or 0,
+                           ImMethod   = ImMethods.index(ImMethod))
+
+        Table = BSCCache.Load(Key) if Cache else None
+
+        if Cache: Stats.Hit('BSC', Table is not None)
+
+        if Table is not None: return Table['BSC']
+
+        with Stats.Timer('BSC'):
+            if Tolerance is None:
+                Table = BSCTable(MaxOrder = MaxOrder,
+                                 k        = self.k,
+                                 w0       = self.w0,
+                                 Offset   = self.Offset,
+                                 OnAxis   = OnAxis,
+                                 Sampling = Sampling,
+                                 Method   = ImMethod)
+            else:
+                idx   = self.Getidx((1, MaxOrder))
+                Table = array( [ (n, m, self.Bnm(n, m, Tolerance, ImMethod), self.Anm(n, m, Tolerance=Tolerance, ImMethod=ImMethod)) for n, m in idx ], dtype=complex )
+
+        if Cache: BSCCache.Save(Key, BSC=Table)
+
+        return Table
+
+
+    def BSCError(self, MaxOrder=5, Sampling=200):
+        """
+        .. note::
+            Error report of the localized approximation against the
+            quadrature method. Each coefficient error is normalised to the
+            largest quadrature coefficient of the same mode, the last
+            row ('max') holds the worst case of each mode.
+
+        Returns
+        -------
+        :class:`DataFrame`
+            Normalised error of the TE and TM coefficients.
+
+        """
+        idx   = self.Getidx((1, MaxOrder))
+        index = pd.MultiIndex.from_tuples(idx + (('max', 'max'),), names=["n", "m"])
+
+        Quad  = self._BSCTable(MaxOrder, Sampling=Sampling, Method='quadrature')[:,2:]
+        Loc   = self._BSCTable(MaxOrder, Method='localized')[:,2:]
+
+        Error = abs(Loc - Quad) / abs(Quad).max(axis=0)
+        Error = vstack( [Error, Error.max(axis=0)] )
+
+        return pd.DataFrame(Error, columns=[r'$BSC_{TE}$', r'$BSC_{TM}$'], index=index)
+
+
     def _BSC(self):
         if self._BSC_:
             return self._BSC_
@@ -386,7 +487,7 @@ class GaussianBeam(BaseSource):
         return term0 * exp(term1 * ( term2 + term3 ) )
 
 
-    def Bnm(self, n, m):
+    def Bnm(self, n, m, Tolerance=1e-8, ImMethod='bessel'):
         """
         .. note::
             From ref[2]:Eq:18-19
@@ -438,17 +539,19 @@ class GaussianBeam(BaseSource):
 
         """
 
-        return Bnm(n        = n,
-                   m        = m,
-                   k        = self.k,
-                   w0       = self.w0,
-                   Offset   = self.Offset)
+        return Bnm(n         = n,
+                   m         = m,
+                   k         = self.k,
+                   w0        = self.w0,
+                   Offset    = self.Offset,
+                   Tolerance = Tolerance,
+                   Method    = ImMethod)
 
 
 
 
 
-    def Anm(self, n, m, Sampling=200):
+    def Anm(self, n, m, Sampling=200, Tolerance=1e-8, ImMethod='bessel'):
         """
         .. note::
             From ref[2]:Eq:18-19
@@ -500,11 +603,13 @@ class GaussianBeam(BaseSource):
 
         """
 
-        return Anm(n        = n,
-                   m        = m,
-                   k        = self.k,
-                   w0       = self.w0,
-                   Offset   = self.Offset)
+        return Anm(n         = n,
+                   m         = m,
+                   k         = self.k,
+                   w0        = self.w0,
+                   Offset    = self.Offset,
+                   Tolerance = Tolerance,
+                   Method    = ImMethod)
 
 
 
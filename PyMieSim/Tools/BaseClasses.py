@@ -2,9 +2,8 @@
 # -*- coding: utf-8 -*-
 
 import numpy  as np
-import matplotlib.pyplot as plt
-from mayavi import mlab
 import os
+from collections import OrderedDict
 
 from PyMieSim.Tools.Representations import *
 from PyMieSim.Tools.Directories     import *
@@ -15,7 +14,7 @@ from PyMieSim.Tools.Mesh            import FibonacciMesh
 from PyMieSim.Tools.Constants       import *
 from PyMieSim.Tools.Config          import *
 from PyMieSim.Tools                 import Coupling
-import PyMieSim.Tools.Plots         as plot
+from PyMieSim.Tools                 import Stats
 
 EPS = 1e-6
 
@@ -87,6 +86,26 @@ class BaseDetector(object):
 
     """
 
+    @property
+    def Scalar(self):
+        """
+        .. note::
+            Scalar field of the detector, converted once to a contiguous
+            complex128 array, the layout expected by the coupling kernel.
+
+        """
+        return self._Scalar
+
+    @Scalar.setter
+    def Scalar(self, val):
+        val = np.ascontiguousarray(val, dtype=complex).ravel()
+
+        if val.size != self.Mesh.Sampling:
+            raise ValueError(f'Scalar field of size {val.size} does not match the mesh sampling {self.Mesh.Sampling}.')
+
+        self._Scalar = val
+
+
     def Coupling(self, Scatterer):
         """
         .. note::
@@ -183,6 +202,9 @@ class BaseDetector(object):
 
         """
 
+        from mayavi import mlab
+        import PyMieSim.Tools.Plots as plot
+
         Figure = plot.Unstructured(Scalar  = self.Scalar,
                                    Mesh    = self.Mesh,
                                    Name    = 'Mode field',
@@ -192,6 +214,9 @@ class BaseDetector(object):
 
 
     def SaveFig(self, Directory):
+        from mayavi import mlab
+        import PyMieSim.Tools.Plots as plot
+
         dir = os.path.join(ZeroPath, Directory) + '.png'
 
         print(f'Saving figure in {dir}...')
@@ -447,6 +472,65 @@ class BaseScatterer(object):
 
     """
 
+    FarFieldCacheSize = 64e6
+
+    def __init__(self):
+        self._FarFields = OrderedDict()
+
+        super().__init__()
+
+
+    def MeshFarField(self, Mesh):
+        """
+        .. note::
+            Return the unstructured far field (EPhi, ETheta) evaluated on the
+            Mesh, see :func:`uFarField`. Results are kept in a least recently
+            used cache of at most FarFieldCacheSize bytes, keyed by the mesh
+            coordinates, which are shared by every mesh of same parameters
+            (see :func:`CachedMesh`) and replaced by any
+            :func:`FibonacciMesh.UpdateSphere`. Detectors of same geometry
+            thus reuse the stored fields. The returned arrays are read-only.
+
+        Parameters
+        ----------
+        Mesh : :class:`FibonacciMesh`
+            Angular mesh on which to evaluate the far field.
+
+        Returns
+        -------
+        :class:`tuple`
+            The unstructured far field (EPhi, ETheta).
+
+        """
+        Points = getattr(Mesh, 'bind', Mesh)
+
+        Key    = id(Points)
+
+        Entry  = self._FarFields.get(Key)
+
+        if Entry is not None and Entry[0] is Points:
+            Stats.Hit('FarField', True)
+            self._FarFields.move_to_end(Key)
+            return Entry[1]
+
+        Stats.Hit('FarField', False)
+
+        with Stats.Timer('FarField'):
+            Fields = tuple( self.uFarField(Mesh.Phi.Radian, Mesh.Theta.Radian, 1.) )
+
+        for field in Fields: field.setflags(write=False)
+
+        self._FarFields[Key] = (Points, Fields)
+
+        Size = sum( field.nbytes for _, fields in self._FarFields.values() for field in fields )
+
+        while Size > self.FarFieldCacheSize and len(self._FarFields) > 1:
+            _, (_, fields) = self._FarFields.popitem(last=False)
+            Size -= sum( field.nbytes for field in fields )
+
+        return Fields
+
+
     def GetProperties(self):
         """
         .. note::
@@ -711,7 +795,7 @@ class BaseScatterer(object):
 
         """
 
-        EPhi, ETheta = self.uFarField(Mesh.Phi.Radian, Mesh.Theta.Radian,1.)
+        EPhi, ETheta = self.MeshFarField(Mesh)
 
         NormE        = np.sqrt(np.abs(EPhi)**2 + np.abs(ETheta)**2)
 
@@ -0,0 +1,147 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+import glob
+import hashlib
+import zipfile
+import numpy as np
+
+
+class DiskCache(object):
+    """
+    .. note::
+        Content-addressed store of numpy arrays on disk, one compressed
+        .npz file per key. Reading an entry refreshes its modification
+        time and the least recently used entries are evicted once the
+        store grows over MaxSize bytes.
+
+    Parameters
+    ----------
+    Path : str
+        Directory holding the cached entries.
+    MaxSize : float
+        Maximal size of the store in bytes.
+
+    """
+    def __init__(self, Path, MaxSize = 256e6):
+        self.Path    = Path
+        self.MaxSize = MaxSize
+
+
+    def Key(self, **kwargs):
+        """
+        .. note::
+            Hash the keyword arguments into a key. Floats are written with 12
+            significant digits so that a same parameter computed in two
+            ways maps to the same entry.
+
+        """
+        Items = []
+        for name in sorted(kwargs):
+            Value = np.atleast_1d( np.asarray(kwargs[name]) ).ravel()
+            Items.append( name + ':' + ','.join( f'{v:.12e}' for v in Value.astype(float) ) )
+
+        return hashlib.sha1( ';'.join(Items).encode() ).hexdigest()
+
+
+    def File(self, Key):
+        return os.path.join(self.Path, Key + '.npz')
+
+
+    def Load(self, Key):
+        """
+        .. note::
+            Return the dict of arrays stored under Key, None if absent or
+            unreadable.
+
+        """
+        File = self.File(Key)
+
+        if not os.path.exists(File): return None
+
+        try:
+            with np.load(File) as Data:
+                Output = {name: Data[name] for name in Data.files}
+            os.utime(File)
+        except (OSError, ValueError, zipfile.BadZipFile):
+            self.Remove(Key)
+            return None
+
+        return Output
+
+
+    def Save(self, Key, **arrays):
+        """
+        .. note::
+            Store the arrays under Key. Failing to write (read-only or full
+            file system) is not an error, the cache is only an accelerator.
+
+        """
+        File = self.File(Key)
+        Temp = f'{File}.{os.getpid()}.tmp'
+        try:
+            os.makedirs(self.Path, exist_ok=True)
+            with open(Temp, 'wb') as f:
+                np.savez_compressed(f, **arrays)
+            os.replace(Temp, File)
+        except OSError:
+            if os.path.exists(Temp): os.remove(Temp)
+            return
+
+        self.Evict()
+
+
+    def Remove(self, Key):
+        try:
+            os.remove( self.File(Key) )
+        except OSError:
+            pass
+
+
+    def Entries(self):
+        """
+        .. note::
+            Return the (modification time, size, file) of every entry,
+            most recently used first.
+
+        """
+        Entries = []
+        for File in glob.glob( os.path.join(self.Path, '*.npz') ):
+            try:
+                Stat = os.stat(File)
+            except OSError:
+                continue
+            Entries.append( (Stat.st_mtime, Stat.st_size, File) )
+
+        return sorted(Entries, reverse=True)
+
+
+    def Evict(self):
+        Size = 0
+        for _, size, File in self.Entries():
+            Size += size
+            if Size > self.MaxSize:
+                try:
+                    os.remove(File)
+                except OSError:
+                    pass
+
+
+    def Clear(self):
+        for *_, File in self.Entries():
+            os.remove(File)
+
+
+    @property
+    def Size(self):
+        return sum( size for _, size, _ in self.Entries() )
+
+
+
+
+
+
+
+
+# -
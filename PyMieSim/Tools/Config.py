@@ -319,4 +319,14 @@ PROPTYPE   = set().union(EFFTYPE, CROSSTYPE, OTHERTYPE, MUTYPE )
 
 INPUTTYPE  = PROPTYPE.union( set( ['Coupling'] ) )
 
+EFFINDEX   = { 'Qsca'   : 0,
+               'Qext'   : 1,
+               'Qabs'   : 2,
+               'Qback'  : 3,
+               'Qratio' : 4,
+               'g'      : 5,
+               'Qpr'    : 6 }
+
+BATCHTYPE  = set(EFFINDEX).union(CROSSTYPE)
+
 exList  = Union[int, float, list, np.ndarray, tuple]
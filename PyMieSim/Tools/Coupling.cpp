@@ -7,6 +7,7 @@
 #include <pybind11/pybind11.h>
 #include <pybind11/complex.h>
 #include <pybind11/numpy.h>
+#include "../includes/Profiler.h"
 namespace py = pybind11;
 
 typedef std::complex<double> complex128;
@@ -16,18 +17,15 @@ typedef py::buffer_info info;
 using namespace std;
 
 
+typedef py::array_t<complex128, py::array::c_style> CCndarray;
+
+
 std::tuple<complex128, complex128>
-CoherentLoop(Cndarray& ScalarField, Cndarray& ETheta, Cndarray& EPhi)
+CoherentLoop(complex128* ScalarFieldPtr, complex128* EThetaPtr, complex128* EPhiPtr, uint size)
 {
   complex128   CouplingTheta  = 0.0,
                CouplingPhi    = 0.0;
 
-  complex128 * ScalarFieldPtr = (complex128 *) ScalarField.request().ptr,
-             * EPhiPtr        = (complex128 *) EPhi.request().ptr,
-             * EThetaPtr      = (complex128 *) ETheta.request().ptr;
-
-  uint size = ScalarField.request().size ;
-
   for (uint i=0; i<size; i++)
   {
     CouplingTheta += ScalarFieldPtr[i] * EThetaPtr[i];
@@ -37,18 +35,25 @@ CoherentLoop(Cndarray& ScalarField, Cndarray& ETheta, Cndarray& EPhi)
   return tie(CouplingTheta, CouplingPhi);
 }
 
+
+std::tuple<complex128, complex128>
+CoherentLoop(Cndarray& ScalarField, Cndarray& ETheta, Cndarray& EPhi)
+{
+  info ScalarInfo = ScalarField.request();
+
+  return CoherentLoop((complex128 *) ScalarInfo.ptr,
+                      (complex128 *) ETheta.request().ptr,
+                      (complex128 *) EPhi.request().ptr,
+                      ScalarInfo.size);
+}
+
+
 std::tuple<double, double>
-NoCoherentLoop(Cndarray& ScalarField, Cndarray& ETheta, Cndarray& EPhi)
+NoCoherentLoop(complex128* ScalarFieldPtr, complex128* EThetaPtr, complex128* EPhiPtr, uint size)
 {
   double       CouplingTheta  = 0.0,
                CouplingPhi    = 0.0;
 
-  complex128 * ScalarFieldPtr = (complex128 *) ScalarField.request().ptr,
-             * EPhiPtr        = (complex128 *) EPhi.request().ptr,
-             * EThetaPtr      = (complex128 *) ETheta.request().ptr;
-
-  uint size = ScalarField.request().size ;
-
   for (uint i=0; i<size; i++)
   {
     CouplingTheta += pow( abs( ScalarFieldPtr[i] * EThetaPtr[i]), 2 );
@@ -58,6 +63,18 @@ NoCoherentLoop(Cndarray& ScalarField, Cndarray& ETheta, Cndarray& EPhi)
   return tie(CouplingTheta, CouplingPhi);
 }
 
+
+std::tuple<double, double>
+NoCoherentLoop(Cndarray& ScalarField, Cndarray& ETheta, Cndarray& EPhi)
+{
+  info ScalarInfo = ScalarField.request();
+
+  return NoCoherentLoop((complex128 *) ScalarInfo.ptr,
+                        (complex128 *) ETheta.request().ptr,
+                        (complex128 *) EPhi.request().ptr,
+                        ScalarInfo.size);
+}
+
 //_________________________POINT_COUPLING_________________________________________________________________________________
 
 double
@@ -67,6 +84,8 @@ NoCoherentPointCouplingFilter(Cndarray&    ScalarField,
                               const double dOmega,
                               const double Filter)
 {
+  PROFILE("NoCoherentPointCouplingFilter");
+
   double CouplingTheta,
          CouplingPhi,
          ThetaFiltering  = pow( sin(Filter), 2 ),
@@ -87,6 +106,8 @@ NoCoherentPointCoupling(Cndarray&    ScalarField,
                         Cndarray&    EPhi,
                         const double dOmega)
 {
+  PROFILE("NoCoherentPointCoupling");
+
   double CouplingTheta, CouplingPhi;
 
   std::tie(CouplingTheta, CouplingPhi) = NoCoherentLoop(ScalarField, ETheta, EPhi) ;
@@ -104,6 +125,8 @@ CoherentPointCouplingFilter(Cndarray&    ScalarField,
                             const double dOmega,
                             const double Filter)
 {
+  PROFILE("CoherentPointCouplingFilter");
+
   complex128   CouplingTheta, CouplingPhi;
 
   double       ThetaFiltering = pow( sin(Filter), 2 ),
@@ -124,6 +147,8 @@ CoherentPointCoupling(Cndarray&    ScalarField,
                       Cndarray&    EPhi,
                       const double dOmega)
 {
+  PROFILE("CoherentPointCoupling");
+
   complex128 CouplingTheta = 0.0, CouplingPhi   = 0.0;
 
   std::tie(CouplingTheta, CouplingPhi) = CoherentLoop(ScalarField, ETheta, EPhi) ;
@@ -146,6 +171,8 @@ CoherentMeanCoupling(Cndarray&     ScalarField,
                      const double  dOmega,
                      const double  Omega)
 {
+  PROFILE("CoherentMeanCoupling");
+
   double CouplingTheta, CouplingPhi;
 
   double factor = dOmega / Omega;
@@ -167,6 +194,8 @@ CoherentMeanCouplingFilter(Cndarray&     ScalarField,
                            const double  Omega,
                            const double  Filter)
 {
+  PROFILE("CoherentMeanCouplingFilter");
+
   double CouplingTheta,
          CouplingPhi;
 
@@ -189,6 +218,8 @@ NoCoherentMeanCoupling(Cndarray&    ScalarField,
                        const double dOmega,
                        const double Omega)
 {
+  PROFILE("NoCoherentMeanCoupling");
+
   return NoCoherentPointCoupling(ScalarField, ETheta,  EPhi, dOmega);
 }
 
@@ -201,14 +232,158 @@ NoCoherentMeanCouplingFilter(Cndarray&     ScalarField,
                              const double  Omega,
                              const double  Filter)
 {
+  PROFILE("NoCoherentMeanCouplingFilter");
+
   return NoCoherentPointCouplingFilter(ScalarField, ETheta, EPhi, dOmega, Filter);
 }
 
 
 
+//_________________________FUSED_COUPLING_________________________________________________________________________________
+
+double
+CouplingKernel(complex128 * ScalarField,
+               complex128 * ETheta,
+               complex128 * EPhi,
+               uint         Size,
+               double       dOmega,
+               double       Omega,
+               double       Filter,
+               bool         Coherent,
+               bool         Mean)
+{
+  bool   Filtered       = !std::isnan(Filter);
+
+  double ThetaFiltering = Filtered ? pow( sin(Filter), 2 ) : 1.,
+         PhiFiltering   = Filtered ? pow( cos(Filter), 2 ) : 1.,
+         CouplingTheta,
+         CouplingPhi,
+         Factor;
+
+  if (Coherent && !Mean)
+  {
+    PROFILE("CoherentPoint");
+    complex128 Theta, Phi;
+    std::tie(Theta, Phi) = CoherentLoop(ScalarField, ETheta, EPhi, Size);
+    CouplingTheta        = pow( abs(Theta), 2 );
+    CouplingPhi          = pow( abs(Phi),   2 );
+  }
+  else if (Coherent)
+  {
+    PROFILE("CoherentMean");
+    std::tie(CouplingTheta, CouplingPhi) = NoCoherentLoop(ScalarField, ETheta, EPhi, Size);
+  }
+  else if (Mean)
+  {
+    PROFILE("NoCoherentMean");
+    std::tie(CouplingTheta, CouplingPhi) = NoCoherentLoop(ScalarField, ETheta, EPhi, Size);
+  }
+  else
+  {
+    PROFILE("NoCoherentPoint");
+    std::tie(CouplingTheta, CouplingPhi) = NoCoherentLoop(ScalarField, ETheta, EPhi, Size);
+  }
+
+  // same normalisation as the single detector functions above
+  if      (Coherent && Mean)     Factor = dOmega / Omega;
+  else if (!Coherent && Filtered) Factor = 1.;
+  else                            Factor = dOmega;
+
+  return abs( CouplingTheta * ThetaFiltering + CouplingPhi * PhiFiltering ) * Factor;
+}
+
+
+double
+DetectorCoupling(CCndarray&   ScalarField,
+                 CCndarray&   ETheta,
+                 CCndarray&   EPhi,
+                 const double dOmega,
+                 const double Omega,
+                 const double Filter,
+                 const bool   Coherent,
+                 const bool   Mean)
+{
+  PROFILE("DetectorCoupling");
+
+  info ScalarInfo = ScalarField.request(),
+       EThetaInfo = ETheta.request(),
+       EPhiInfo   = EPhi.request();
+
+  if (EThetaInfo.size != ScalarInfo.size || EPhiInfo.size != ScalarInfo.size)
+    throw std::invalid_argument("ScalarField, ETheta and EPhi must have the same size.");
+
+  py::gil_scoped_release Release;
+
+  return CouplingKernel((complex128 *) ScalarInfo.ptr,
+                        (complex128 *) EThetaInfo.ptr,
+                        (complex128 *) EPhiInfo.ptr,
+                        ScalarInfo.size,
+                        dOmega,
+                        Omega,
+                        Filter,
+                        Coherent,
+                        Mean);
+}
+
+
+ndarray
+MultiCoupling(Cndarray&                ScalarFields,
+              Cndarray&                ETheta,
+              Cndarray&                EPhi,
+              ndarray&                 dOmega,
+              ndarray&                 Omega,
+              ndarray&                 Filter,
+              py::array_t<bool>&       Coherent,
+              py::array_t<bool>&       Mean)
+{
+  PROFILE("MultiCoupling");
+
+  uint         Size           = ETheta.request().size,
+               NDetector      = dOmega.request().size;
+
+  if (ScalarFields.request().size != NDetector * Size)
+    throw std::invalid_argument("ScalarFields must be of shape [number of detectors, number of mesh points].");
+
+  complex128 * ScalarFieldPtr = (complex128 *) ScalarFields.request().ptr,
+             * EThetaPtr      = (complex128 *) ETheta.request().ptr,
+             * EPhiPtr        = (complex128 *) EPhi.request().ptr;
+
+  double     * dOmegaPtr      = (double *) dOmega.request().ptr,
+             * OmegaPtr       = (double *) Omega.request().ptr,
+             * FilterPtr      = (double *) Filter.request().ptr;
+
+  bool       * CoherentPtr    = (bool *) Coherent.request().ptr,
+             * MeanPtr        = (bool *) Mean.request().ptr;
+
+  ndarray      Output         = ndarray(NDetector);
+
+  double     * OutputPtr      = Output.mutable_data();
+
+  {
+    py::gil_scoped_release Release;
+
+    for (uint d=0; d<NDetector; d++)
+      OutputPtr[d] = CouplingKernel(ScalarFieldPtr + d * Size,
+                                    EThetaPtr,
+                                    EPhiPtr,
+                                    Size,
+                                    dOmegaPtr[d],
+                                    OmegaPtr[d],
+                                    FilterPtr[d],
+                                    CoherentPtr[d],
+                                    MeanPtr[d]);
+  }
+
+  return Output;
+}
+
+
+
 PYBIND11_MODULE(_Coupling, module) {
     module.doc() = "Coherent and non-coherent coupling";
 
+    Profiler::Bind(module);
+
     module.def("NoCoherentPointCouplingFilter", &NoCoherentPointCouplingFilter,
                py::arg("ScalarField"),
                py::arg("ETheta"),
@@ -268,6 +443,26 @@ PYBIND11_MODULE(_Coupling, module) {
               py::arg("dOmega"),
               py::arg("Omega") );
 
+    module.def("DetectorCoupling", &DetectorCoupling,
+               py::arg("ScalarField").noconvert(),
+               py::arg("ETheta").noconvert(),
+               py::arg("EPhi").noconvert(),
+               py::arg("dOmega"),
+               py::arg("Omega"),
+               py::arg("Filter"),
+               py::arg("Coherent"),
+               py::arg("Mean") );
+
+    module.def("MultiCoupling", &MultiCoupling,
+               py::arg("ScalarFields"),
+               py::arg("ETheta"),
+               py::arg("EPhi"),
+               py::arg("dOmega"),
+               py::arg("Omega"),
+               py::arg("Filter"),
+               py::arg("Coherent"),
+               py::arg("Mean") );
+
 }
 
 
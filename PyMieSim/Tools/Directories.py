@@ -14,6 +14,11 @@ StaticPath   = os.path.join(ZeroPath, 'docs/images')
 
 LPModePath   = os.path.join(RootPath, 'Data/LPmodes')
 
+CachePath    = os.environ.get('PYMIESIM_CACHE',
+                              os.path.join(os.path.expanduser('~'), '.cache', 'PyMieSim'))
+
+BSCPath      = os.path.join(CachePath, 'BSC')
+
 RTDExample   = 'https://pymiesim.readthedocs.io/en/latest/Examples.html'
 
 RTDMaterial  = 'https://pymiesim.readthedocs.io/en/latest/Material.html'
@@ -5,6 +5,7 @@
 #include <pybind11/pybind11.h>
 #include <pybind11/complex.h>
 #include <pybind11/numpy.h>
+#include "../includes/Profiler.h"
 
 namespace py = pybind11;
 
@@ -70,6 +71,8 @@ class FibonacciMesh{
                   double PhiOffset,
                   double GammaOffset)
     {
+      PROFILE("FibonacciMesh");
+
       this->Samples     = Samples;
       this->MaxAngle    = MaxAngle;
       this->PhiOffset   = PhiOffset;
@@ -232,6 +235,7 @@ FibonacciMesh::GenCoordinate()
 PYBIND11_MODULE(Fibonacci, module) {
     module.doc() = "LGeneralized Lorenz-Mie Theory (GLMT) c++ binding module for light scattering from a spherical scatterer";
 
+    Profiler::Bind(module);
 
       py::class_<FibonacciMesh>(module, "Mesh")
       .def(py::init<int, double, double, double>())
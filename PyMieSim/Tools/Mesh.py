@@ -1,11 +1,50 @@
 import numpy as np
-from mayavi import mlab
+from collections import OrderedDict
 
 from PyMieSim.Physics         import Angle
-from PyMieSim.Tools.Plots     import Unstructured
 from PyMieSim.Tools.Fibonacci import Mesh as FMesh
+from PyMieSim.LMT.Scatterer   import PiTau
+from PyMieSim.Tools           import Stats
 pi = np.pi
 
+MeshCacheSize = 128
+
+_MeshCache    = OrderedDict()
+
+
+def CachedMesh(Sampling, MaxAngle, PhiOffset, GammaOffset):
+    """Function return the coordinates of a Fibonacci mesh, built by the
+    c++ layer only the first time a (Sampling, MaxAngle, PhiOffset,
+    GammaOffset) is requested. The coordinate arrays are read-only as they
+    are shared between every mesh of same parameters in the process. At
+    most MeshCacheSize meshes are kept, least recently used first out.
+
+    Returns
+    -------
+    :class:`Namespace`
+        Mesh coordinates with the attributes of the c++ Fibonacci mesh.
+
+    """
+    Key = (int(Sampling), float(MaxAngle), float(PhiOffset), float(GammaOffset))
+
+    Stats.Hit('Mesh', Key in _MeshCache)
+
+    if Key in _MeshCache:
+        _MeshCache.move_to_end(Key)
+        return _MeshCache[Key]
+
+    bind = FMesh(Sampling, MaxAngle, np.deg2rad(PhiOffset), np.deg2rad(GammaOffset))
+
+    Coordinates = { name: np.array( getattr(bind, name) ) for name in ['x', 'y', 'z', 'r', 'phi', 'theta', 'PhiBase', 'ThetaBase'] }
+
+    for array in Coordinates.values(): array.setflags(write=False)
+
+    _MeshCache[Key] = Namespace(**Coordinates, dOmega = bind.dOmega, Omega = bind.Omega)
+
+    while len(_MeshCache) > MeshCacheSize: _MeshCache.popitem(last=False)
+
+    return _MeshCache[Key]
+
 
 
 class FibonacciMesh(object):
@@ -43,6 +82,8 @@ class FibonacciMesh(object):
         self.MaxAngle    = MaxAngle
         self.PhiOffset   = PhiOffset
         self.GammaOffset = GammaOffset
+        self.Version     = 0
+        self._Basis      = None
         self.GenerateLedevedMesh()
 
 
@@ -68,6 +109,8 @@ class FibonacciMesh(object):
 
 
     def Plot(self):
+        from mayavi import mlab
+        from PyMieSim.Tools.Plots import Unstructured
 
         Name = 'Angular mesh'
 
@@ -78,10 +121,10 @@ class FibonacciMesh(object):
 
     def GenerateLedevedMesh(self):
 
-        self.bind = FMesh(self.Sampling,
-                          self.MaxAngle,
-                          np.deg2rad(self.PhiOffset),
-                          np.deg2rad(self.GammaOffset) )
+        self.bind = CachedMesh(self.Sampling,
+                               self.MaxAngle,
+                               self.PhiOffset,
+                               self.GammaOffset)
 
 
         self.base = (self.bind.PhiBase, self.bind.ThetaBase)
@@ -89,6 +132,21 @@ class FibonacciMesh(object):
         self.MakeProperties()
 
 
+    def AngularBasis(self, MaxOrder):
+        """
+        .. note::
+            Return the :class:`AngularBasis` of the mesh up to MaxOrder. The
+            last basis is kept and reused as long as the mesh is not updated
+            and the order bound is not exceeded.
+
+        """
+        if self._Basis is None or self._Basis.Version != self.Version or self._Basis.MaxOrder < MaxOrder:
+            self._Basis         = AngularBasis(Phi = self.Phi.Radian, MaxOrder = MaxOrder)
+            self._Basis.Version = self.Version
+
+        return self._Basis
+
+
     def UpdateSphere(self, **kwargs):
 
         if 'MaxAngle'    in kwargs: self.MaxAngle    = kwargs['MaxAngle']
@@ -96,9 +154,79 @@ class FibonacciMesh(object):
         if 'PhiOffset'   in kwargs: self.PhiOffset   = kwargs['PhiOffset']
         if 'Sampling'    in kwargs: self.Sampling    = kwargs['Sampling']
 
+        self.Version += 1
+
         self.GenerateLedevedMesh()
 
 
+class AngularBasis(object):
+    """
+    Class which holds the angular functions :math:`\pi_n` and :math:`\tau_n`
+    of a fixed set of angles, weighted by :math:`(2n+1)/(n(n+1))`. The
+    S1 and S2 amplitudes of many scatterers are then obtained as one
+    matrix product against their :math:`a_n` and :math:`b_n`.
+
+    Parameters
+    ----------
+    Phi : :class:`numpy.ndarray`
+        Angles in radian, as given to the scatterer S1S2 method.
+    MaxOrder : int
+        Order bound, at least the maximal order of the scatterers.
+
+    """
+    def __init__(self, Phi, MaxOrder: int):
+
+        self.MaxOrder  = MaxOrder
+
+        n              = np.arange(1, MaxOrder + 1)
+
+        Prefactor      = (2 * n + 1) / ( n * (n + 1) )
+
+        Pi, Tau        = PiTau(Phi = np.ascontiguousarray(Phi, dtype=float).ravel(), MaxOrder = MaxOrder)
+
+        self.Pi        = Pi * Prefactor
+        self.Tau       = Tau * Prefactor
+
+
+    def Coefficients(self, Scatterers):
+        """
+        .. note::
+            Return the :math:`a_n` and :math:`b_n` [len(Scatterers), MaxOrder] of
+            the scatterers, each truncated at its own maximal order and zero
+            padded up to MaxOrder.
+
+        """
+        an = np.zeros([len(Scatterers), self.MaxOrder], dtype=complex)
+        bn = np.zeros([len(Scatterers), self.MaxOrder], dtype=complex)
+
+        for i, Scatterer in enumerate(Scatterers):
+            Order = Scatterer.Bind.MaxOrder
+
+            if Order > self.MaxOrder:
+                raise ValueError(f'Scatterer maximal order {Order} exceeds the basis order bound {self.MaxOrder}.')
+
+            an[i, :Order] = Scatterer.Bind.an(Order)
+            bn[i, :Order] = Scatterer.Bind.bn(Order)
+
+        return an, bn
+
+
+    def S1S2(self, Scatterers):
+        """
+        .. note::
+            Return the S1 and S2 amplitudes [len(Scatterers), number of angles]
+            of the scatterers.
+
+        """
+        an, bn = self.Coefficients(Scatterers)
+
+        S1 = an @ self.Pi.T + bn @ self.Tau.T
+        S2 = an @ self.Tau.T + bn @ self.Pi.T
+
+        return S1, S2
+
+
+
 class StructuredFullMesh(object):
     """Class wich represent an angular mesh.
 
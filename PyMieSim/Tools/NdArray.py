@@ -3,7 +3,8 @@
 
 import numpy as np
 import copy
-import matplotlib.pyplot as plt
+import json
+import os
 from itertools import product
 import pprint
 pp = pprint.PrettyPrinter(indent=4)
@@ -12,7 +13,6 @@ from PyMieSim.Tools.Config      import *
 from PyMieSim.Tools.Directories import *
 from PyMieSim.Tools.ErrorMsg    import *
 from PyMieSim.Tools.utils       import FormatStr, FormatString, ToList, Table
-from PyMieSim.Tools.Plots       import ExperimentPlot
 
 
 
@@ -101,7 +101,69 @@ class Table:
             yield name, label, format, size, dim
 
 
+def ToJSON(obj):
+    """Function return a JSON serializable copy of a configuration. Complex
+    numbers and tuples are tagged so that :func:`FromJSON` restores them,
+    objects without JSON representation (e.g. materials) are stored as
+    their string.
+
+    """
+    if isinstance(obj, dict):
+        return { str(key): ToJSON(val) for key, val in obj.items() }
+
+    if isinstance(obj, tuple):
+        return { '__tuple__': [ ToJSON(val) for val in obj ] }
+
+    if isinstance(obj, (list, np.ndarray)):
+        return [ ToJSON(val) for val in obj ]
+
+    if isinstance(obj, (bool, np.bool_)):
+        return bool(obj)
+
+    if isinstance(obj, (int, np.integer)):
+        return int(obj)
+
+    if isinstance(obj, (float, np.floating)):
+        return float(obj)
+
+    if isinstance(obj, (complex, np.complexfloating)):
+        return { '__complex__': [obj.real, obj.imag] }
+
+    if obj is None or isinstance(obj, str):
+        return obj
+
+    return str(obj)
+
+
+def FromJSON(obj):
+    """Function invert :func:`ToJSON`, the integer keys of the axis table
+    are restored."""
+    if isinstance(obj, list):
+        return [ FromJSON(val) for val in obj ]
+
+    if not isinstance(obj, dict):
+        return obj
+
+    if '__tuple__' in obj:
+        return tuple( FromJSON(val) for val in obj['__tuple__'] )
+
+    if '__complex__' in obj:
+        return complex( *obj['__complex__'] )
+
+    return { int(key) if key.isdigit() else key: FromJSON(val) for key, val in obj.items() }
+
+
 class PMSArray(object):
+    """
+    .. note::
+        Multi-dimensional array of the properties computed by
+        :func:`Setup.Get` together with its axis table. The data can be a
+        :class:`numpy.memmap`, in which case the reductions (:func:`Mean`,
+        :func:`Std`, :func:`Rsd`, :func:`Monotonic`) read it chunk by
+        chunk.
+
+    """
+    ChunkSize = 64e6                                                            # bytes read per reduction chunk
 
     def __init__(self, array, conf):
         self.data = array
@@ -171,8 +233,7 @@ class PMSArray(object):
 
         """
 
-        arr  = np.gradient(self.data,
-                           axis = self.Table[axis]).std( axis = self.Table[axis])
+        _, arr = self.Moments(axis, Gradient = True)
 
         conf = self.UpdateConf(axis)
 
@@ -197,7 +258,7 @@ class PMSArray(object):
 
         """
 
-        arr  = np.mean(self.data, axis=self.Table[axis] )
+        arr, _ = self.Moments(axis)
 
         conf = self.UpdateConf(axis)
 
@@ -222,7 +283,7 @@ class PMSArray(object):
 
         """
 
-        arr  = np.std(self.data, axis=self.Table[axis] )
+        _, arr = self.Moments(axis)
 
         conf = self.UpdateConf(axis)
 
@@ -248,14 +309,109 @@ class PMSArray(object):
 
         """
 
-        arr  = np.std(self.data, axis=self.Table[axis] ) \
-              /np.mean(self.data, axis=self.Table[axis] )
+        Mean, Std = self.Moments(axis)
+
+        arr  = Std / Mean
 
         conf = self.UpdateConf(axis)
 
         return PMSArray(array=arr, conf=conf)
 
 
+    def Moments(self, axis, Gradient=False):
+        """Method compute the mean and the standard deviation along the
+        specified axis. The data are read in blocks of at most ChunkSize
+        bytes, sliced along the reduced axis and along the largest other
+        one, whose moments are merged pairwise (Chan et al.), so that a
+        memory-mapped array is never loaded at once.
+
+        Parameters
+        ----------
+        axis : :class:`str`
+            Axis for which to perform the operation.
+        Gradient : :class:`bool`
+            If True, the moments are the ones of the gradient along axis,
+            computed on blocks overlapping by one point.
+
+        Returns
+        -------
+        :class:`tuple`
+            Mean and standard deviation arrays.
+
+        """
+        Axis   = self.Table[axis]
+
+        Shape  = self.data.shape
+
+        Length = Shape[Axis]
+
+        Other  = max( (d for d in range(len(Shape)) if d != Axis), key = lambda d: Shape[d] )
+
+        Slab   = self.data.nbytes / Length                                      # bytes per index of the reduced axis
+
+        AStep  = max( 1, int( self.ChunkSize / Slab ) )
+
+        OStep  = max( 1, int( self.ChunkSize * Shape[Other] / ( Slab * AStep ) ) )
+
+        Out    = Other if Other < Axis else Other - 1
+
+        Means  = np.empty( Shape[:Axis] + Shape[Axis+1:] )
+
+        Stds   = np.empty( Shape[:Axis] + Shape[Axis+1:] )
+
+        for o in range(0, Shape[Other], OStep):
+            Output      = [slice(None)] * Means.ndim
+            Output[Out] = slice(o, o + OStep)
+
+            Count, Mean, M2 = 0, 0., 0.
+
+            for a in range(0, Length, AStep):
+                Block = self._Block(Axis, Other, slice(o, o + OStep), a, min(a + AStep, Length), Gradient)
+
+                n     = Block.shape[Axis]
+                mean  = Block.mean(axis = Axis)
+                m2    = ( ( Block - np.expand_dims(mean, Axis) )**2 ).sum(axis = Axis)
+                Delta = mean - Mean
+
+                Count += n
+                Mean   = Mean + Delta * n / Count
+                M2     = M2 + m2 + Delta**2 * (Count - n) * n / Count
+
+            Means[tuple(Output)] = Mean
+            Stds[tuple(Output)]  = np.sqrt(M2 / Count)
+
+        return Means, Stds
+
+
+    def _Block(self, Axis, Other, Slice, Start, Stop, Gradient=False):
+        """Method load the points [Start, Stop) of Axis within the Slice of
+        the Other axis, or their gradient along Axis, which is evaluated
+        with one more point on each side when available.
+
+        Returns
+        -------
+        :class:`numpy.ndarray`
+            Block of the data.
+
+        """
+        In         = [slice(None)] * self.data.ndim
+        In[Other]  = Slice
+
+        if not Gradient:
+            In[Axis] = slice(Start, Stop)
+            return np.asarray( self.data[tuple(In)] )
+
+        Lower      = max(Start - 1, 0)
+        In[Axis]   = slice(Lower, min(Stop + 1, self.data.shape[Axis]))
+
+        Block      = np.gradient( np.asarray( self.data[tuple(In)] ), axis = Axis )
+
+        Keep       = [slice(None)] * self.data.ndim
+        Keep[Axis] = slice(Start - Lower, Stop - Lower)
+
+        return Block[tuple(Keep)]
+
+
     def UpdateConf(self, axis):
         """Method update the configuration variable (config) in order to
         ouput a new :class:`PMSArray` instance.
@@ -288,8 +444,13 @@ class PMSArray(object):
         return newConf
 
 
-    @ExperimentPlot
-    def _Plot(self, y, x, figure=None, ax=None, *args, **kwargs):
+    def _Plot(self, *args, **kwargs):
+        from PyMieSim.Tools.Plots import ExperimentPlot
+
+        return ExperimentPlot(PMSArray._DataPlot)(self, *args, **kwargs)
+
+
+    def _DataPlot(self, y, x, figure=None, ax=None, *args, **kwargs):
         """Method plot the multi-dimensional array with the x key as abscissa.
         args and kwargs can be passed as standard input to matplotlib.pyplot.
 
@@ -315,13 +476,15 @@ class PMSArray(object):
 
                 ax.plot(xval, self.data[idx], label=label)
 
-        plt.gcf().text(0.12, 0.95, common, fontsize = 8,
-                       bbox      = dict(facecolor='none',
-                       edgecolor = 'black',
-                       boxstyle  = 'round'))
+        figure.text(0.12, 0.95, common, fontsize = 8,
+                    bbox      = dict(facecolor='none',
+                    edgecolor = 'black',
+                    boxstyle  = 'round'))
 
 
     def Plot(self, *args, **kwargs):
+        import matplotlib.pyplot as plt
+
         self._Plot(*args, **kwargs)
         plt.show()
 
@@ -335,6 +498,55 @@ class PMSArray(object):
 
 
 
+    def Save(self, Path):
+        """Method write the array to Path.npy and its configuration to the
+        JSON sidecar Path.json, see :func:`Load`.
+
+        Parameters
+        ----------
+        Path : :class:`str`
+            Path of the files, without extension.
+
+        """
+        Path = os.path.splitext(Path)[0]
+
+        if isinstance(self.data, np.memmap) and os.path.abspath(self.data.filename) == os.path.abspath(Path + '.npy'):
+            self.data.flush()
+
+        else:
+            np.save(Path + '.npy', self.data)
+
+        with open(Path + '.json', 'w') as f:
+            json.dump( ToJSON(self.conf), f, indent = 2 )
+
+
+    @staticmethod
+    def Load(Path, mmap_mode='r'):
+        """Method read an array written by :func:`Save`.
+
+        Parameters
+        ----------
+        Path : :class:`str`
+            Path of the files, without extension.
+        mmap_mode : :class:`str`
+            Memory-map mode of :func:`numpy.load`, None to load the array
+            in memory.
+
+        Returns
+        -------
+        :class:`PMSArray`
+            The loaded array, its data being a :class:`numpy.memmap` unless
+            mmap_mode is None.
+
+        """
+        Path = os.path.splitext(Path)[0]
+
+        with open(Path + '.json') as f:
+            conf = FromJSON( json.load(f) )
+
+        return PMSArray(array = np.load(Path + '.npy', mmap_mode = mmap_mode), conf = conf)
+
+
     def GetSlicer(self, x):
         shape       = list(self.data.shape)
 
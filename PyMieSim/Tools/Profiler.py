@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import importlib
+
+
+Modules = { 'LMT'          : 'PyMieSim.LMT.Scatterer',
+            'GLMT'         : 'PyMieSim.GLMT.Scatterer',
+            'GaussianBeam' : 'PyMieSim.GLMT.GaussianBeam',
+            'Coupling'     : 'PyMieSim.Tools._Coupling',
+            'Fibonacci'    : 'PyMieSim.Tools.Fibonacci' }
+
+
+def Bindings():
+    return { name: importlib.import_module(path) for name, path in Modules.items() }
+
+
+def Compiled():
+    """Function return True if the c++ kernels were built with the
+    profiling probes (cmake -DPYMIESIM_PROFILING=ON)."""
+    return all( module.ProfileCompiled for module in Bindings().values() )
+
+
+def Enable(enable=True):
+    """Function enable or disable the c++ kernels probes of every binding."""
+    for module in Bindings().values(): module.ProfileEnable(enable)
+
+
+def Reset():
+    for module in Bindings().values(): module.ProfileReset()
+
+
+def Kernels():
+    """Function return {'module.kernel': (calls, nanoseconds)} of the c++
+    kernels called since the last :func:`Reset`."""
+    Output = {}
+    for name, module in Bindings().items():
+        for kernel, value in module.ProfileStats().items():
+            Output[f'{name}.{kernel}'] = value
+
+    return Output
+
+
+class KernelProfile(object):
+    """
+    .. note::
+        Context manager recording the number of calls and the cumulative
+        time of the c++ kernels (ComputeAnBn, S1S2, uFields, sFields,
+        coupling variants, BSC, Fibonacci mesh, ...) run within the block.
+        Times are inclusive, e.g. uFields contains the S1S2 it calls, and
+        summed over the OpenMP threads. The probes are only compiled when
+        the package is built with PYMIESIM_PROFILING=ON (see
+        :func:`Compiled`); otherwise Kernels stays empty.
+
+    """
+    def __enter__(self):
+        self.Kernels = {}
+        Reset()
+        Enable(True)
+        return self
+
+
+    def __exit__(self, *args):
+        Enable(False)
+        self.Kernels = Kernels()
+        return False
+
+
+    def __str__(self):
+        text = f'{"kernel":30s} {"calls":>10s} {"total [ms]":>12s} {"mean [us]":>12s}\n'
+
+        for kernel, (calls, ns) in sorted( self.Kernels.items(), key = lambda item: -item[1][1] ):
+            text += f'{kernel:30s} {calls:10d} {ns * 1e-6:12.3f} {ns * 1e-3 / calls:12.3f}\n'
+
+        return text
+
+
+
+
+
+
+
+
+
+# -
@@ -1,8 +1,5 @@
 import numpy             as np
-import matplotlib.pyplot as plt
-from mayavi              import mlab
 
-from PyMieSim.Tools.Plots       import StructuredAmplitude, StokesPlot, StructuredAbs
 from PyMieSim.Tools.utils       import Direct2spherical, AngleUnit2DirectUnit
 from PyMieSim.Tools.units       import Area
 from PyMieSim.Tools.Directories import *
@@ -63,6 +60,8 @@ class Stokes(dict): # https://en.wikipedia.org/wiki/Stokes_parameters
 
 
     def _Plot(self):
+        from PyMieSim.Tools.Plots import StokesPlot
+
         Name = 'Scattering phase function'
 
         StokesPlot(I            = self['I'],
@@ -76,12 +75,16 @@ class Stokes(dict): # https://en.wikipedia.org/wiki/Stokes_parameters
 
 
     def Plot(self):
+        from mayavi import mlab
+
         self._Plot()
 
         mlab.show()
 
 
     def SaveFig(self, Directory):
+        from mayavi import mlab
+
         dir = os.path.join(ZeroPath, Directory) + '.png'
 
         print(f'Saving figure in {dir}...')
@@ -138,6 +141,7 @@ class SPF(dict):
 
 
     def _Plot(self):
+        from PyMieSim.Tools.Plots import StructuredAbs
 
         StructuredAbs(Scalar       = self['SPF'],
                       Phi          = self['Phi'],
@@ -148,12 +152,16 @@ class SPF(dict):
 
 
     def Plot(self):
+        from mayavi import mlab
+
         self._Plot()
 
         mlab.show()
 
 
     def SaveFig(self, Directory):
+        from mayavi import mlab
+
         dir = os.path.join(ZeroPath, Directory) + '.png'
 
         print(f'Saving figure in {dir}...')
@@ -210,6 +218,7 @@ class S1S2(dict):
 
 
     def _Plot(self):
+        import matplotlib.pyplot as plt
 
         S1 = np.abs(self['S1'])
         S2 = np.abs(self['S2'])
@@ -240,12 +249,16 @@ class S1S2(dict):
 
 
     def Plot(self):
+        import matplotlib.pyplot as plt
+
         self._Plot()
 
         plt.show()
 
 
     def SaveFig(self, Directory):
+        import matplotlib.pyplot as plt
+
         dir = os.path.join(ZeroPath, Directory) + '.png'
 
         print(f'Saving figure in {dir}...')
@@ -308,6 +321,8 @@ class ScalarFarField(dict):
 
 
     def _Plot(self):
+        from PyMieSim.Tools.Plots import StructuredAmplitude
+
         StructuredAmplitude(Scalar       = self['EPhi'],
                             Phi          = self['Phi'],
                             Theta        = self['Theta'],
@@ -322,12 +337,16 @@ class ScalarFarField(dict):
 
 
     def Plot(self):
+        from mayavi import mlab
+
         self._Plot()
 
         mlab.show()
 
 
     def SaveFig(self, Directory):
+        from mayavi import mlab
+
         dir = os.path.join(ZeroPath, Directory) + '.png'
 
         print(f'Saving figure in {dir}...')
@@ -417,6 +436,7 @@ class Footprint(dict):
 
 
     def Plot(self):
+        import matplotlib.pyplot as plt
 
         fig = plt.figure()
 
@@ -0,0 +1,212 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import time
+
+
+Current = None                                                                  # Stats collecting the measures, None when disabled
+
+
+class _Null(object):
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+Null = _Null()
+
+
+def Timer(Name):
+    """Function return a context manager adding its duration to the Name
+    timer of the active :class:`Stats`, a shared no-op one if none is
+    active.
+
+    """
+    return Null if Current is None else _Timer(Current, Name)
+
+
+def Hit(Cache, hit):
+    """Function record a hit (True) or a miss (False) of Cache."""
+    if Current is not None: Current.Hit(Cache, hit)
+
+
+def Count(Name):
+    """Function increment the Name counter, e.g. calls of a cost function."""
+    if Current is not None: Current.Counts[Name] = Current.Counts.get(Name, 0) + 1
+
+
+def Progress(Points):
+    """Function record that Points more points were evaluated."""
+    if Current is not None: Current.Progress(Points)
+
+
+class _Timer(object):
+    """Context manager timing a section. Timers are exclusive: the time
+    spent in a nested timer is not counted by the enclosing one, so that
+    the sections add up to the total."""
+    __slots__ = ('Stats', 'Name', 'Start')
+
+    def __init__(self, Stats, Name):
+        self.Stats = Stats
+        self.Name  = Name
+
+    def __enter__(self):
+        Now   = time.perf_counter()
+        Stack = self.Stats._Stack
+
+        if Stack: Stack[-1].Pause(Now)
+
+        self.Start = Now
+        Stack.append(self)
+
+        return self
+
+    def __exit__(self, *args):
+        Now   = time.perf_counter()
+        Stack = self.Stats._Stack
+
+        self.Pause(Now)
+        Stack.pop()
+
+        if Stack: Stack[-1].Start = Now
+
+        return False
+
+    def Pause(self, Now):
+        Times            = self.Stats.Times
+        Times[self.Name] = Times.get(self.Name, 0.) + Now - self.Start
+
+
+class Stats(object):
+    """
+    .. note::
+        Instrumentation of :func:`Setup.Get` and :class:`Optimizer` runs.
+        While the instance is active, i.e. within a :code:`with` block or
+        when passed as the Stats argument, it records the time spent in
+        scatterer construction, far-field evaluation and coupling, the
+        number of evaluated points and the hit rate of the caches. When no
+        instance is active each probe costs a global lookup.
+        Measures of worker processes (Workers > 1 outside of the batch
+        kernel) are not collected, only their points are counted.
+
+    Parameters
+    ----------
+    Callback : :class:`function`
+        Function called with the instance as the points are evaluated, at
+        most once per Interval.
+    Interval : :class:`float`
+        Minimal time in seconds between two calls of Callback.
+
+    """
+    def __init__(self, Callback=None, Interval=1.):
+        self.Callback = Callback
+        self.Interval = Interval
+        self.Times    = {}
+        self.Hits     = {}
+        self.Counts   = {}
+        self.Points   = 0
+        self.Total    = None
+        self._Elapsed = 0.
+        self._Since   = None
+        self._Last    = 0.
+        self._Outer   = []
+        self._Stack   = []
+
+
+    def __enter__(self):
+        global Current
+
+        self._Outer.append(Current)
+
+        if self._Since is None: self._Since = time.perf_counter()
+
+        Current = self
+
+        return self
+
+
+    def __exit__(self, *args):
+        global Current
+
+        Current = self._Outer.pop()
+
+        if self not in self._Outer and Current is not self:
+            self._Elapsed += time.perf_counter() - self._Since
+            self._Since    = None
+
+        return False
+
+
+    def Hit(self, Cache, hit):
+        Count     = self.Hits.setdefault(Cache, [0, 0])
+        Count[0] += hit
+        Count[1] += 1
+
+
+    def Progress(self, Points):
+        self.Points += Points
+
+        if self.Callback is None: return
+
+        Now = time.perf_counter()
+        if Now - self._Last >= self.Interval or self.Points == self.Total:
+            self._Last = Now
+            self.Callback(self)
+
+
+    @property
+    def Elapsed(self):
+        """Wall time in seconds during which the instance was active."""
+        if self._Since is None: return self._Elapsed
+
+        return self._Elapsed + time.perf_counter() - self._Since
+
+
+    @property
+    def Rate(self):
+        """Evaluated points per second."""
+        return self.Points / self.Elapsed if self.Elapsed else 0.
+
+
+    @property
+    def Split(self):
+        """Time in seconds of each timer, the remainder of the run being
+        attributed to 'Python'."""
+        Split           = dict(self.Times)
+        Split['Python'] = max( 0., self.Elapsed - sum(self.Times.values()) )
+
+        return Split
+
+
+    @property
+    def HitRate(self):
+        """Fraction of the lookups of each cache served from it."""
+        return { Cache: hit / total for Cache, (hit, total) in self.Hits.items() }
+
+
+    def __str__(self):
+        Total = f' / {self.Total}' if self.Total else ''
+
+        text  = f'Points      : {self.Points}{Total} in {self.Elapsed:.3f} s ({self.Rate:.1f} /s)\n'
+
+        for name, t in self.Split.items():
+            text += f'{name:12s}: {t:9.4f} s ({100 * t / (self.Elapsed or 1):5.1f} %)\n'
+
+        for Cache, (hit, total) in self.Hits.items():
+            text += f'{Cache:12s}: {100 * hit / total:5.1f} % hits of {total}\n'
+
+        for name, count in self.Counts.items():
+            text += f'{name:12s}: {count} calls\n'
+
+        return text
+
+
+
+
+
+
+
+
+
+# -
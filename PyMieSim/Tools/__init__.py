@@ -1,43 +1,70 @@
 import numpy                    as np
 from PyMieSim.Tools._Coupling   import *
+from PyMieSim.Tools             import Stats
 
 def Coupling(Scatterer, Detector):
-    EPhi, ETheta = Scatterer.uFarField(Detector.Mesh.Phi.Radian, Detector.Mesh.Theta.Radian, 1)
-    dOmega     = float(Detector.Mesh.dOmega.Radian)
-    Omega      = float(Detector.Mesh.Omega.Radian)
-    Filter     = Detector.Filter.Radian
-    Scalar     = Detector.Scalar
-
-    kwarg = {'ScalarField': Scalar.astype(np.complex),
-             'EPhi'   :     EPhi.astype(np.complex),
-             'ETheta' :     ETheta.astype(np.complex),
-             'dOmega' :     dOmega}
-
-    if Detector.CouplingMode[1] == 'Centered':
-        if Detector.CouplingMode[0] == "Intensity":
-            if Filter is None:
-                return NoCoherentPointCoupling(**kwarg)
-            else:
-                return NoCoherentPointCouplingFilter(**kwarg, Filter = Filter)
-
-        elif Detector.CouplingMode[0] == "Amplitude":
-            if Filter is None:
-                return CoherentPointCoupling(**kwarg)
-            else:
-                return CoherentPointCouplingFilter(**kwarg, Filter = Filter)
-
-
-    elif Detector.CouplingMode[1] == 'Mean':
-        if Detector.CouplingMode[0] == "Intensity":                                    # same thing as intensity point coupling
-            if Filter is None:
-                return NoCoherentMeanCoupling(**kwarg, Omega = Omega)
-            else:
-                return NoCoherentMeanCouplingFilter(**kwarg, Filter = Filter, Omega = Omega)
-
-
-
-        elif Detector.CouplingMode[0] == "Amplitude":
-            if Filter is None:
-                return CoherentMeanCoupling(**kwarg, Omega = Omega)
-            else:
-                return CoherentMeanCouplingFilter(**kwarg, Filter = Filter, Omega = Omega)
+    """Function return the coupling of the scatterer with the detector.
+    The detector scalar field is stored as a contiguous complex128 array
+    and the far field is produced as such by the c++ layer, so no array is
+    copied on the way to the coupling kernel.
+
+    """
+    EPhi, ETheta = Scatterer.MeshFarField(Detector.Mesh)
+    Filter       = Detector.Filter.Radian
+
+    with Stats.Timer('Coupling'):
+        return DetectorCoupling(ScalarField = Detector.Scalar,
+                                ETheta      = ETheta,
+                                EPhi        = EPhi,
+                                dOmega      = float(Detector.Mesh.dOmega.Radian),
+                                Omega       = float(Detector.Mesh.Omega.Radian),
+                                Filter      = np.nan if Filter is None else Filter,
+                                Coherent    = Detector.CouplingMode[0] == 'Amplitude',
+                                Mean        = Detector.CouplingMode[1] == 'Mean')
+
+
+
+def MeshKey(Mesh):
+    return (Mesh.Sampling, Mesh.MaxAngle, Mesh.PhiOffset, Mesh.GammaOffset)
+
+
+def Couplings(Scatterer, Detectors):
+    """Function return the coupling of the scatterer with every detector.
+    Detectors are grouped by angular mesh, the far field is computed once
+    per distinct mesh and each group is coupled in a single c++ call.
+
+    Parameters
+    ----------
+    Scatterer : :class:`Scatterer`
+        Scatterer instance (sphere, cylinder, ...).
+    Detectors : :class:`list`
+        Detector instances.
+
+    Returns
+    -------
+    :class:`numpy.ndarray`
+        Coupling of each detector, in the Detectors order.
+
+    """
+    Groups = {}
+    for n, Detector in enumerate(Detectors):
+        Groups.setdefault( MeshKey(Detector.Mesh), [] ).append(n)
+
+    Output = np.empty( len(Detectors) )
+
+    for Index in Groups.values():
+        Group        = [ Detectors[n] for n in Index ]
+        Mesh         = Group[0].Mesh
+        EPhi, ETheta = Scatterer.MeshFarField(Mesh)
+
+        with Stats.Timer('Coupling'):
+            Output[Index] = MultiCoupling(ScalarFields = np.asarray( [D.Scalar for D in Group], dtype=complex ),
+                                          ETheta       = np.asarray(ETheta, dtype=complex),
+                                          EPhi         = np.asarray(EPhi, dtype=complex),
+                                          dOmega       = [ float(D.Mesh.dOmega.Radian) for D in Group ],
+                                          Omega        = [ float(D.Mesh.Omega.Radian) for D in Group ],
+                                          Filter       = [ np.nan if D.Filter.Radian is None else D.Filter.Radian for D in Group ],
+                                          Coherent     = [ D.CouplingMode[0] == 'Amplitude' for D in Group ],
+                                          Mean         = [ D.CouplingMode[1] == 'Mean' for D in Group ] )
+
+    return Output
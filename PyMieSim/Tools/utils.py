@@ -45,6 +45,39 @@ def RotateComplex(Input, Rotation):
     return InputReal + 1j * InputImag
 
 
+def BilinearInterp(Input, i, j):
+    """
+    Interpolate a regularly gridded array at fractional indices.
+
+    Parameters:
+
+    * Input : 2D array
+        Gridded data, real or complex.
+    * i, j : 1D arrays
+        Fractional indices along the first and second axis of Input. Points
+        outside of the grid take the value of the nearest edge.
+
+    Returns:
+
+    * v : 1D array
+        1D array with the interpolated values.
+
+    """
+    i  = np.clip(i, 0, Input.shape[0] - 1)
+    j  = np.clip(j, 0, Input.shape[1] - 1)
+
+    i0 = np.minimum( i.astype(int), Input.shape[0] - 2 )
+    j0 = np.minimum( j.astype(int), Input.shape[1] - 2 )
+
+    di = i - i0
+    dj = j - j0
+
+    return ( Input[i0,   j0  ] * (1 - di) * (1 - dj)
+           + Input[i0+1, j0  ] * di       * (1 - dj)
+           + Input[i0,   j0+1] * (1 - di) * dj
+           + Input[i0+1, j0+1] * di       * dj )
+
+
 def interp_at(x, y, v, xp, yp, algorithm='cubic', extrapolate=False):
     """
     Interpolate data onto the specified points.
@@ -300,6 +333,23 @@ def GeneratorFromDict(dictionnary):
         yield order
 
 
+def ChunkSlices(size, n):
+    """Return a list of at most n contiguous slices covering range(size)."""
+    bounds = np.linspace(0, size, min(n, size) + 1).astype(int)
+    return [slice(start, stop) for start, stop in zip(bounds[:-1], bounds[1:])]
+
+
+def AsArray(values):
+    """Return a 1D array of values, using an object array when the elements
+    are themselves sequences (e.g. LP mode tuples)."""
+    array = np.asarray(values)
+    if array.ndim == 1: return array
+
+    array = np.empty(len(values), dtype=object)
+    for n, value in enumerate(values): array[n] = value
+    return array
+
+
 def _GeneratorFromDict(dictionnary):
     order = {a: n for n, a in enumerate(dictionnary.keys())}
     return itertools.product( *( a for a in dictionnary.values() ) ), order
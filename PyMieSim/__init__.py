@@ -4,7 +4,6 @@ import csv
 import urllib.request
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
 from pathlib import Path
 
 PATH = os.path.join( Path(__file__).parent, 'Data/_Material' )
@@ -31,6 +30,8 @@ class Material(BaseMaterial):
 
 
     def _Plot(self):
+        import matplotlib.pyplot as plt
+
         fig = plt.figure(figsize=(6,3.5))
         ax = fig.add_subplot(111)
         ax.set_xlabel(r'Wavelength $\lambda$ [m]')
@@ -51,10 +52,14 @@ class Material(BaseMaterial):
 
 
     def Plot(self):
+        import matplotlib.pyplot as plt
+
         self._Plot()
         plt.show()
 
     def SaveFig(self, dir):
+        import matplotlib.pyplot as plt
+
         dir = os.path.join(ZeroPath, 'docs/images', dir) + '.png'
         self._Plot()
         plt.savefig(dir)
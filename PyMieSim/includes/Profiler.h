@@ -0,0 +1,114 @@
+#pragma once
+
+#include <atomic>
+#include <chrono>
+#include <mutex>
+#include <pybind11/pybind11.h>
+
+// Opt-in per-kernel call counts and cumulative time. The probes are only
+// compiled when the package is built with -DPYMIESIM_PROFILING=ON (cmake
+// defines PYMIESIM_NO_PROFILING otherwise); once compiled a probe costs one
+// relaxed atomic load while recording is disabled (the default).
+// Times are inclusive (a kernel calling another one counts both) and are
+// summed over the OpenMP threads.
+
+namespace Profiler
+{
+namespace                                                                       // internal linkage: one registry per binding module
+{
+  struct Counter
+  {
+    const char                       * Name;
+    std::atomic<unsigned long long>    Calls{0},
+                                       Nanoseconds{0};
+    Counter                          * Next;
+
+    Counter(const char * name);
+  };
+
+
+  inline std::atomic<bool>& Enabled(){ static std::atomic<bool> enabled{false}; return enabled; }
+
+  inline Counter*& Head(){ static Counter* head = nullptr; return head; }
+
+  inline std::mutex& Lock(){ static std::mutex lock; return lock; }
+
+
+  inline Counter::Counter(const char * name) : Name(name)
+  {
+    std::lock_guard<std::mutex> Guard(Lock());
+    Next   = Head();
+    Head() = this;
+  }
+
+
+  class Scope
+  {
+    public:
+      Counter                                          * counter;
+      std::chrono::steady_clock::time_point              Start;
+
+      Scope(Counter& c) : counter( Enabled().load(std::memory_order_relaxed) ? &c : nullptr )
+      {
+        if (counter) Start = std::chrono::steady_clock::now();
+      }
+
+      ~Scope()
+      {
+        if (!counter) return;
+
+        auto Duration = std::chrono::duration_cast<std::chrono::nanoseconds>(std::chrono::steady_clock::now() - Start).count();
+
+        counter->Calls.fetch_add(1, std::memory_order_relaxed);
+        counter->Nanoseconds.fetch_add(Duration, std::memory_order_relaxed);
+      }
+  };
+
+
+  inline void Reset()
+  {
+    for (Counter* c = Head(); c; c = c->Next){ c->Calls = 0; c->Nanoseconds = 0; }
+  }
+
+
+  inline pybind11::dict Stats()
+  {
+    pybind11::dict Output;
+
+    for (Counter* c = Head(); c; c = c->Next)
+      if (c->Calls) Output[c->Name] = pybind11::make_tuple( (unsigned long long) c->Calls, (unsigned long long) c->Nanoseconds );
+
+    return Output;
+  }
+
+
+  inline void Bind(pybind11::module& module)
+  {
+    module.def("ProfileEnable", [](bool enable){ Enabled() = enable; }, pybind11::arg("Enable") = true,
+               "Enable or disable the recording of the kernels calls and duration.");
+
+    module.def("ProfileReset", &Reset,
+               "Reset the kernels counters.");
+
+    module.def("ProfileStats", &Stats,
+               "Return {kernel: (calls, nanoseconds)} for the kernels called since the last reset.");
+
+#ifdef PYMIESIM_NO_PROFILING
+    module.attr("ProfileCompiled") = false;
+#else
+    module.attr("ProfileCompiled") = true;
+#endif
+  }
+}
+}
+
+
+#ifdef PYMIESIM_NO_PROFILING
+  #define PROFILE(Name)
+#else
+  #define PROFILE(Name) static Profiler::Counter _ProfileCounter_(Name); Profiler::Scope _ProfileScope_(_ProfileCounter_)
+#endif
+
+
+
+// -
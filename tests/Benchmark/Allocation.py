@@ -0,0 +1,51 @@
+import numpy as np
+import timeit
+
+
+BatchSize = 100000
+
+def Speed(setup, Number = 20000):
+
+    Benchs = { 'Construction + Efficiencies' : """SPHERE(Index = 1.4, Diameter = 50e-9, Wavelength = 1e-6).Efficiencies""",
+               'Construction + an/bn'        : """s = SPHERE(Index = 1.4, Diameter = 50e-9, Wavelength = 1e-6); s.an(5); s.bn(5)""",
+               'Construction + cn/dn'        : """s = SPHERE(Index = 1.4, Diameter = 50e-9, Wavelength = 1e-6); s.cn(5); s.dn(5)""",
+               'Construction + S1S2'         : """SPHERE(Index = 1.4, Diameter = 50e-9, Wavelength = 1e-6).S1S2(Phi)""",
+               'Construction + uFields'      : """SPHERE(Index = 1.4, Diameter = 50e-9, Wavelength = 1e-6).uFields(Phi, Phi, 1.)""",
+               'Reused S1S2'                 : """scat.S1S2(Phi)""" }
+
+    print('\nPER-CALL LATENCY (small particle, x ~ 0.16)\n' + '='*50)
+
+    for name, stmt in Benchs.items():
+        Bench = timeit.timeit(setup = setup, stmt = stmt, number = Number)
+        print(f'{name:30s} {Bench / Number * 1e6:8.2f} us')
+
+    Bench = timeit.timeit(setup = setup, stmt = """SphereEfficiencies(Index, Diameter, Wavelength, nMedium)""", number = 20)
+    print(f'{"Batch efficiencies (C++ loop)":30s} {Bench / 20 / BatchSize * 1e6:8.2f} us')
+
+
+
+setup = f"""
+import numpy as np
+from PyMieSim.LMT.Scatterer import SPHERE, SphereEfficiencies
+Diameter   = np.linspace(20e-9, 100e-9, {BatchSize})
+Index      = np.full(Diameter.size, 1.4 + 0j)
+Wavelength = np.full(Diameter.size, 1e-6)
+nMedium    = np.ones(Diameter.size)
+Phi  = np.linspace(-np.pi/2, np.pi/2, 8)
+scat = SPHERE(Index = 1.4, Diameter = 50e-9, Wavelength = 1e-6)
+"""
+
+if __name__ == '__main__':
+
+    Speed(setup)
+
+
+
+
+
+
+
+
+
+
+    # -
@@ -0,0 +1,59 @@
+import subprocess
+import sys
+
+
+Modules = ['PyMieSim.Scatterer',
+           'PyMieSim.Source',
+           'PyMieSim.Detector',
+           'PyMieSim.Experiment']
+
+Backends = ['mayavi', 'matplotlib', 'vtk', 'pyface']
+
+Code = """
+import sys, time
+t0 = time.perf_counter()
+import {Module}
+t1 = time.perf_counter()
+print(t1 - t0)
+print(','.join( name for name in {Backends} if name in sys.modules ))
+"""
+
+
+def ImportTime(Module, Number = 5):
+    """Return the best wall time of a cold import of Module in a fresh
+    interpreter, and the plotting backends it pulled in.
+
+    """
+    Times = []
+    for _ in range(Number):
+        Output = subprocess.run([sys.executable, '-c', Code.format(Module=Module, Backends=Backends)],
+                                capture_output = True,
+                                text           = True,
+                                check          = True).stdout.split('\n')
+
+        Times.append( float(Output[0]) )
+
+    return min(Times), Output[1]
+
+
+def Speed():
+    print('\nCOLD IMPORT TIME\n' + '='*50)
+
+    for Module in Modules:
+        Time, Loaded = ImportTime(Module)
+        print(f'{Module:25s} {Time * 1e3:8.1f} ms    backends loaded: {Loaded or "none"}')
+
+
+if __name__ == '__main__':
+
+    Speed()
+
+
+
+
+
+
+
+
+
+# -
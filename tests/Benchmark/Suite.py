@@ -0,0 +1,202 @@
+"""
+Benchmark suite of the PyMieSim hot paths.
+
+Every case runs in its own interpreter so that its peak resident memory
+is not polluted by the other cases. Results are printed as a table and
+can be written as JSON to compare two releases:
+
+    python tests/Benchmark/Suite.py --output new.json
+    python tests/Benchmark/Suite.py --compare old.json new.json
+"""
+
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import time
+import timeit
+
+try:
+    import resource
+except ImportError:                                                             # not available on Windows
+    resource = None
+
+
+Imports = """
+import numpy as np
+from PyMieSim.Source     import PlaneWave, GaussianBeam
+from PyMieSim.Scatterer  import Sphere
+from PyMieSim.Detector   import Photodiode, LPmode
+from PyMieSim.Experiment import ScatSet, SourceSet, DetectorSet, Setup
+from PyMieSim.Tools.Mesh import FibonacciMesh, _MeshCache
+source = PlaneWave(Wavelength = 1e-6, Polarization = 0)
+scat   = Sphere(Diameter = 1e-6, Index = 1.4, Source = source)
+"""
+
+#         Name                 : (Setup, Statement, Number, Repeat)
+Cases = { 'Import'             : ( "",
+                                   "import PyMieSim.Scatterer, PyMieSim.Source, PyMieSim.Detector, PyMieSim.Experiment",
+                                   1, 1 ),
+
+          'Construction'       : ( Imports,
+                                   "Sphere(Diameter = 1e-6, Index = 1.4, Source = source)",
+                                   2000, 5 ),
+
+          'Efficiencies'       : ( Imports,
+                                   "Sphere(Diameter = 1e-6, Index = 1.4, Source = source).Qsca",
+                                   2000, 5 ),
+
+          'uFields'            : ( Imports + "Phi = np.random.rand(10000); Theta = np.random.rand(10000)",
+                                   "scat.uFarField(Phi, Theta, 1.)",
+                                   50, 5 ),
+
+          'sFields'            : ( Imports + "Phi = np.linspace(-np.pi/2, np.pi/2, 200); Theta = np.linspace(0, 2*np.pi, 200)",
+                                   "scat.sFarField(Phi, Theta, 1.)",
+                                   50, 5 ),
+
+          'Coupling'           : ( Imports + "det = LPmode(Mode = (1, 1), NA = 0.2, Sampling = 1000)",
+                                   "scat._FarFields.clear(); det.Coupling(scat)",
+                                   200, 5 ),
+
+          'FibonacciMesh'      : ( Imports,
+                                   "_MeshCache.clear(); FibonacciMesh(MaxAngle = 0.5, Sampling = 5000)",
+                                   50, 5 ),
+
+          'BSC'                : ( Imports + "beam = GaussianBeam(Wavelength = 1e-6, NA = 0.2, Offset = [0.5e-6, 0.5e-6, 0])",
+                                   "beam.GetBSC(MaxOrder = 10, Cache = False)",
+                                   5, 3 ),
+
+          'SetupGet[Qsca]'     : ( Imports + """
+scatSet   = ScatSet(Scatterer = Sphere, kwargs = {'Diameter' : np.linspace(100e-9, 5e-6, 1000), 'Index' : [1.4, 1.5]})
+sourceSet = SourceSet(Source = PlaneWave, kwargs = {'Wavelength' : np.linspace(400e-9, 1e-6, 50), 'Polarization' : [0]})
+setup     = Setup(ScattererSet = scatSet, SourceSet = sourceSet)""",
+                                   "setup.Get(Input = ['Qsca', 'g'])",
+                                   1, 3 ),
+
+          'SetupGet[Coupling]' : ( Imports + """
+scatSet   = ScatSet(Scatterer = Sphere, kwargs = {'Diameter' : np.linspace(100e-9, 5e-6, 50), 'Index' : [1.4]})
+sourceSet = SourceSet(Source = PlaneWave, kwargs = {'Wavelength' : [1e-6], 'Polarization' : [0]})
+detSet    = DetectorSet(Detector = Photodiode, kwargs = {'NA' : [0.1, 0.2, 0.3], 'Sampling' : [500]})
+setup     = Setup(ScattererSet = scatSet, SourceSet = sourceSet, DetectorSet = detSet)""",
+                                   "setup.Get(Input = ['Coupling'])",
+                                   1, 3 ) }
+
+
+def PeakRSS():
+    """Return the peak resident memory of the current process in MB."""
+    if resource is None: return None
+
+    Peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    return Peak / 2**20 if sys.platform == 'darwin' else Peak / 2**10           # bytes on macOS, kB on Linux
+
+
+def RunCase(Name):
+    """Run one case in the current process and return its measurements."""
+    Setup, Stmt, Number, Repeat = Cases[Name]
+
+    Timer = timeit.Timer(stmt = Stmt, setup = Setup)
+
+    Times = Timer.repeat(repeat = Repeat, number = Number)
+
+    return { 'name'     : Name,
+             'time'     : min(Times) / Number,
+             'mean'     : sum(Times) / len(Times) / Number,
+             'number'   : Number,
+             'repeat'   : Repeat,
+             'peak_rss' : PeakRSS() }
+
+
+def Run(Names = None):
+    """Run every case, each one in a fresh interpreter."""
+    Results = []
+
+    for Name in Names or Cases:
+        Process = subprocess.run([sys.executable, __file__, '--case', Name], capture_output = True, text = True)
+
+        if Process.returncode != 0:
+            Results.append( { 'name': Name, 'error': Process.stderr.strip().split('\n')[-1] } )
+            continue
+
+        Results.append( json.loads( Process.stdout.strip().split('\n')[-1] ) )
+
+    return { 'meta'    : { 'date'     : time.strftime('%Y-%m-%dT%H:%M:%S'),
+                           'python'   : platform.python_version(),
+                           'platform' : platform.platform(),
+                           'version'  : Version() },
+             'results' : Results }
+
+
+def Version():
+    Process = subprocess.run([sys.executable, '-c', 'import PyMieSim, importlib.metadata as m; print(m.version("PyMieSim"))'],
+                             capture_output = True, text = True)
+
+    return Process.stdout.strip() or None
+
+
+def Print(Report):
+    print('\nBENCHMARK SUITE\n' + '='*62)
+    print(f'{"case":22s} {"best":>12s} {"mean":>12s} {"peak RSS":>12s}')
+
+    for Result in Report['results']:
+        if 'error' in Result:
+            print(f'{Result["name"]:22s} failed: {Result["error"]}')
+            continue
+
+        RSS = '-' if Result['peak_rss'] is None else f'{Result["peak_rss"]:.1f} MB'
+        print(f'{Result["name"]:22s} {Result["time"]*1e3:9.3f} ms {Result["mean"]*1e3:9.3f} ms {RSS:>12s}')
+
+
+def Compare(Old, New, Tolerance = 0.1):
+    """Print the time and memory ratio New/Old of every case, flagging
+    the cases slower or bigger than 1 + Tolerance.
+
+    """
+    Old = { R['name']: R for R in Old['results'] if 'error' not in R }
+
+    print('\nCOMPARISON (new / old)\n' + '='*50)
+    for R in New['results']:
+        if 'error' in R or R['name'] not in Old: continue
+
+        O         = Old[R['name']]
+        TimeRatio = R['time'] / O['time']
+        RSSRatio  = R['peak_rss'] / O['peak_rss'] if R['peak_rss'] and O['peak_rss'] else float('nan')
+        Flag      = '  <-- regression' if TimeRatio > 1 + Tolerance or RSSRatio > 1 + Tolerance else ''
+
+        print(f'{R["name"]:22s} time x{TimeRatio:6.2f}   RSS x{RSSRatio:6.2f}{Flag}')
+
+
+if __name__ == '__main__':
+
+    Parser = argparse.ArgumentParser(description = 'PyMieSim benchmark suite')
+    Parser.add_argument('--case',    help = 'run a single case in this process and print its JSON result')
+    Parser.add_argument('--only',    nargs = '+', choices = list(Cases), help = 'subset of cases to run')
+    Parser.add_argument('--output',  help = 'write the JSON report to this file')
+    Parser.add_argument('--compare', nargs = 2, metavar = ('OLD', 'NEW'), help = 'compare two JSON reports')
+    Args   = Parser.parse_args()
+
+    if Args.case:
+        print( json.dumps( RunCase(Args.case) ) )
+
+    elif Args.compare:
+        with open(Args.compare[0]) as f: Old = json.load(f)
+        with open(Args.compare[1]) as f: New = json.load(f)
+        Compare(Old, New)
+
+    else:
+        Report = Run(Args.only)
+        Print(Report)
+
+        if Args.output:
+            with open(Args.output, 'w') as f: json.dump(Report, f, indent = 2)
+
+
+
+
+
+
+
+
+
+# -
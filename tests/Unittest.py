@@ -2,6 +2,9 @@
 # -*- coding: utf-8 -*-
 
 import unittest
+import os
+import json
+import tempfile
 import mayavi
 import matplotlib._pylab_helpers
 from mayavi              import mlab
@@ -17,6 +20,10 @@ from PyMieSim.GLMT.python.Sphere    import SPF
 from PyMieSim.Detector              import LPmode, Photodiode, _Photodiode
 from PyMieSim.Experiment            import ScatSet, Setup, SourceSet, SampleSet, DetectorSet
 from PyMieSim.Tools.Mesh            import FibonacciMesh
+from PyMieSim.Tools.NdArray         import PMSArray
+from PyMieSim.Tools.Stats           import Stats
+from PyMieSim.Tools.Profiler        import KernelProfile, Compiled as ProfileCompiled
+from PyMieSim.Tools                 import Stats as Instrument
 from PyMieSim.Tools.Plots           import *
 from PyMieSim.Tools.Representations import S1S2
 from unittest.mock                  import patch
@@ -116,6 +123,64 @@ class DetectorTestCase(unittest.TestCase):
         print('IntegratingSphere Plotting passed')
 
 
+    def test06(self):
+        from PyMieSim.Detector        import LPmode as LP
+        from PyMieSim.Tools           import Couplings
+        from PyMieSim.Tools.Constants import eps0, c
+        Detectors = [ Photodiode(Sampling = 11, NA = 0.2),
+                      Photodiode(Sampling = 11, NA = 0.2, Filter = 30, CouplingMode = 'Mean'),
+                      LP(Mode = (0, 1), Sampling = 11, NA = 0.2),
+                      LP(Mode = (1, 1), Sampling = 11, NA = 0.2, Filter = 60, CouplingMode = 'Mean'),
+                      Photodiode(Sampling = 11, NA = 0.3, PhiOffset = 10) ]
+
+        Fused = Couplings(Scatterer = Scat, Detectors = Detectors) * eps0 * c * 0.5
+        Ref   = [ float( D.Coupling(Scat) ) for D in Detectors ]
+        assert np.allclose( Fused, Ref, rtol=1e-12 )
+        print('Fused multi-detector coupling passed')
+
+
+    def test07(self):
+        from PyMieSim.Tools import Coupling, NoCoherentPointCoupling
+        assert Detector1.Scalar.dtype == complex and Detector1.Scalar.flags.c_contiguous
+        EPhi, ETheta = Scat.uFarField(Detector1.Mesh.Phi.Radian, Detector1.Mesh.Theta.Radian, 1)
+        Ref = NoCoherentPointCoupling(ScalarField = Detector1.Scalar.real,
+                                      ETheta      = ETheta,
+                                      EPhi        = EPhi,
+                                      dOmega      = float(Detector1.Mesh.dOmega.Radian))
+        assert np.isclose( Coupling(Scatterer = Scat, Detector = Detector1), Ref, rtol=1e-12 )
+        with self.assertRaises(ValueError):
+            Detector1.Scalar = np.ones(Detector1.Mesh.Sampling + 1)
+        print('Zero-copy coupling path passed')
+
+
+    def test08(self):
+        D0 = Photodiode(Sampling = 101, NA = 0.3, PhiOffset = 10)
+        D1 = Photodiode(Sampling = 101, NA = 0.3, PhiOffset = 10, Filter = 20)
+        assert D0.Mesh is not D1.Mesh and D0.Mesh.Phi.Radian is D1.Mesh.Phi.Radian
+        assert not D0.Mesh.Phi.Radian.flags.writeable
+        D1.Mesh.UpdateSphere(PhiOffset = 0)
+        assert D0.Mesh.Phi.Radian is not D1.Mesh.Phi.Radian and D0.Mesh.PhiOffset == 10
+        print('Shared Fibonacci mesh cache passed')
+
+
+    def test09(self):
+        from PyMieSim.Detector import LPmode as LP
+        Mode   = LP(Mode = (0, 1), Sampling = 500, NA = 0.2)
+        Center = np.argmax(Mode.Mesh.base[0])
+        assert np.abs(Mode.Scalar[Center]) > 0.9 * np.abs(Mode.Scalar).max()
+        print('LP mode grid resampling passed')
+
+
+    def test10(self):
+        from PyMieSim.Detector import LPmode as LP, LoadMode
+        assert isinstance(LoadMode((1, 1)), np.memmap) and LoadMode((1, 1)) is LoadMode((1, 1))
+        Mode0 = LP(Mode = (1, 1), Sampling = 200, NA = 0.2)
+        Mode1 = LP(Mode = (1, 1), Sampling = 200, NA = 0.2, Rotation = 360)
+        assert np.allclose(Mode0.Scalar, Mode1.Scalar)
+        assert Mode0.FarField(Num = 50, Structured = True) is Mode1.FarField(Num = 50, Structured = True)
+        print('Memory-mapped LP mode bank passed')
+
+
 class ScattererTestCase(unittest.TestCase):
 
     def test00(self):
@@ -207,6 +272,84 @@ class ScattererTestCase(unittest.TestCase):
         print('LPmode footprint compute passed')
 
 
+    def test15(self):
+        an = sScat.an(20); cn = sScat.cn(20)
+        assert np.allclose( sScat.an(5), an[:5] )
+        assert np.allclose( sScat.cn(5), cn[:5] )
+        assert np.allclose( sScat.an(20), an )
+        print('Cached Mie coefficients passed')
+
+        Small = Sphere(Diameter = 50e-9, Index = 1.5, Source = PlaneWave(Wavelength = 1e-6))   # x = 0.157
+        an    = [5.7849582467e-07-7.6058891000e-04j, 1.1237827042e-12-1.0600861777e-06j, 4.8339626789e-19-6.9526704790e-10j]
+        bn    = [7.0486956265e-12-2.6549379704e-06j, 3.4974393079e-18-1.8701441944e-09j, 5.3639435354e-25-7.3238948214e-13j]
+        assert np.allclose( Small.an(3), an, rtol = 1e-6, atol = 0 )
+        assert np.allclose( Small.bn(3), bn, rtol = 1e-6, atol = 0 )
+        print('Exact Mie coefficients of small sphere passed')
+
+
+    def test16(self):
+        Mesh = FibonacciMesh(MaxAngle = 0.5, Sampling = 100)
+        EPhi, ETheta = sScat.MeshFarField(Mesh)
+        assert sScat.MeshFarField(Mesh)[0] is EPhi
+        Mesh.UpdateSphere(PhiOffset = 20)
+        assert sScat.MeshFarField(Mesh)[0] is not EPhi
+        assert np.allclose( sScat.MeshFarField(Mesh)[1], sScat.uFarField(Mesh.Phi.Radian, Mesh.Theta.Radian, 1.)[1] )
+        print('Cached far field on mesh passed')
+
+
+    def test17(self):
+        Mesh  = FibonacciMesh(MaxAngle = 0.8, Sampling = 200)
+        Scats = [ Sphere(Diameter = d, Index = 1.4, Source = LightSource) for d in [100e-9, 500e-9, 1e-6] ]
+        Basis = Mesh.AngularBasis( MaxOrder = max( S.Bind.MaxOrder for S in Scats ) )
+        S1, S2 = Basis.S1S2(Scats)
+        for i, S in enumerate(Scats):
+            s1, s2 = S.Bind.S1S2(Phi = Mesh.Phi.Radian)
+            assert np.allclose(S1[i], s1) and np.allclose(S2[i], s2)
+        assert Mesh.AngularBasis(MaxOrder = 2) is Basis
+        print('S1S2 from precomputed angular basis passed')
+
+
+    def test18(self):
+        import subprocess, sys
+        Code   = "import sys, PyMieSim.Scatterer, PyMieSim.Detector; print(any(m in sys.modules for m in ['mayavi', 'matplotlib']))"
+        Loaded = subprocess.run([sys.executable, '-c', Code], capture_output=True, text=True, check=True).stdout.strip()
+        assert Loaded == 'False'
+        print('Plotting backends lazily imported passed')
+
+
+    def test19(self):
+        if not ProfileCompiled(): self.skipTest('c++ kernels built with PYMIESIM_PROFILING=OFF')
+
+        source = PlaneWave(Wavelength = 1e-6, Polarization = 0)
+        det    = Photodiode(NA = 0.2, Sampling = 300)
+        scat   = Sphere(Diameter = 1e-6, Index = 1.4, Source = source)
+
+        with KernelProfile() as Profile:
+            det.Coupling(scat)
+
+        Calls, Time = Profile.Kernels['LMT.uFields']
+
+        assert Calls >= 1 and Time > 0
+        assert any( kernel.startswith('Coupling.') for kernel in Profile.Kernels )
+        assert 'LMT.uFields' in str(Profile)
+
+        scat.Qsca
+        with KernelProfile() as Profile: pass
+        assert Profile.Kernels == {}
+
+        print('c++ kernels profiling passed')
+
+
+    def test20(self):
+        Scats  = [ Cylinder(Diameter = 300e-9, Index = 1.4, Source = LightSource),
+                   Sphere(Diameter = 300e-9, Index = 1.4, Source = LightSource) ]
+        assert Scats[0].Bind.MaxOrder == Scats[1].Bind.MaxOrder > 0
+        an, bn = FibonacciMesh(MaxAngle = 0.8, Sampling = 50).AngularBasis(MaxOrder = Scats[0].Bind.MaxOrder).Coefficients(Scats)
+        assert np.allclose( an[0], Scats[0].Bind.an(Scats[0].Bind.MaxOrder) )
+        assert np.allclose( bn[1], Scats[1].Bind.bn(Scats[1].Bind.MaxOrder) )
+        print('Cylinder maximal order passed')
+
+
 
 
 class ExperiementTestCase(unittest.TestCase):
@@ -281,6 +424,207 @@ class ExperiementTestCase(unittest.TestCase):
         print("<Experiment> 'optimizer' output passed")
 
 
+    def test10(self):
+        Batch = ExpSet.Get(['Qsca', 'Csca']).data.reshape(-1, 2)
+
+        for n, wl in enumerate( sourceKwargs['Wavelength'] ):
+            Scat = Sphere(Diameter = 200e-9, Index = 4, Source = PlaneWave(Wavelength = wl))
+            idx  = ExpSet.config['Y']
+            assert np.isclose( Batch[n, idx['Qsca']['order']], Scat.Qsca )
+            assert np.isclose( Batch[n, idx['Csca']['order']], Scat.Csca )
+
+        print("<Experiment> batch efficiencies passed")
+
+
+    def test11(self):
+        for Input in ['Qsca', 'Coupling']:
+            Serial   = ExpSet.Get(Input).data
+            Parallel = ExpSet.Get(Input, Workers = 2).data
+            assert np.allclose( Serial, Parallel )
+
+        print("<Experiment> parallel workers passed")
+
+
+    def test12(self):
+        for Input in ['Qsca', 'Coupling']:
+            Full     = ExpSet.Get(Input).data
+            Streamed = np.empty_like(Full)
+
+            for Index, Chunk in ExpSet.Stream(Input, ChunkSize = 3):
+                assert Chunk.shape[0] <= 3
+                Streamed[Index] = Chunk
+
+            assert np.allclose( Full, Streamed )
+
+            with tempfile.TemporaryDirectory() as Dir:
+                Written = ExpSet.Get(Input, Output = os.path.join(Dir, 'array.npy'), ChunkSize = 3).data
+                assert isinstance(Written, np.memmap)
+                assert np.allclose( Full, Written )
+                del Written
+
+        print("<Experiment> streamed output passed")
+
+
+    def test13(self):
+        Array = ExpSet.Get(['Qsca', 'Qext'])
+
+        with tempfile.TemporaryDirectory() as Dir:
+            Array.Save( os.path.join(Dir, 'array') )
+            Loaded = PMSArray.Load( os.path.join(Dir, 'array') )
+
+            assert isinstance(Loaded.data, np.memmap)
+            assert np.array_equal( Array.data, Loaded.data )
+            assert Loaded.conf['X'].keys() == Array.conf['X'].keys()
+            assert np.allclose( Array['Qsca'], Loaded['Qsca'] )
+
+            Loaded.ChunkSize = 64
+            for Reduction in ['Mean', 'Std', 'Rsd', 'Monotonic']:
+                assert np.allclose( getattr(Array, Reduction)('wavelength').data,
+                                    getattr(Loaded, Reduction)('wavelength').data )
+
+            del Loaded
+
+        print("<Experiment> PMSArray save/load passed")
+
+
+    def test14(self):
+        Full       = ExpSet.Get('Qsca').data
+        IterChunks = Setup.IterChunks
+        Computed   = []
+
+        def Interrupted(setup, *args, **kwargs):
+            for n, Chunk in enumerate( IterChunks(setup, *args, **kwargs) ):
+                if n == 2: raise KeyboardInterrupt
+                yield Chunk
+
+        def Recorded(setup, *args, **kwargs):
+            for Chunk in IterChunks(setup, *args, **kwargs):
+                Computed.append(Chunk[0])
+                yield Chunk
+
+        with tempfile.TemporaryDirectory() as Dir:
+            Path = os.path.join(Dir, 'run.npy')
+
+            with patch.object(Setup, 'IterChunks', Interrupted):
+                self.assertRaises(KeyboardInterrupt, ExpSet.Get, 'Qsca', Output = Path, ChunkSize = 3, Checkpoint = 0)
+
+            with open( os.path.join(Dir, 'run.manifest.json') ) as f:
+                assert json.load(f)['done'] == [0, 1]
+
+            with patch.object(Setup, 'IterChunks', Recorded):
+                Resumed = ExpSet.Get('Qsca', Output = Path, ChunkSize = 3, Resume = True).data
+
+            assert Computed == [2, 3]
+            assert np.allclose( Full, Resumed )
+            del Resumed
+
+        print("<Experiment> resumed run passed")
+
+
+    def test15(self):
+        Calls = []
+        stats = Stats(Callback = lambda s: Calls.append(s.Points), Interval = 0)
+        setup = Setup(ScattererSet = sScatSet, SourceSet = sourceSet, DetectorSet = ExpSet.DetectorSet)
+
+        Array = setup.Get('Coupling', Stats = stats)
+
+        assert stats.Points == stats.Total == Array.data.size
+        assert Calls[-1] == stats.Points
+        assert {'Coupling', 'Python'}.issubset( stats.Split )
+        assert 0 <= stats.HitRate['FarField'] <= 1
+        assert stats.Rate > 0
+        assert Instrument.Current is None
+
+        print("<Experiment> instrumentation passed")
+
+
+    def test16(self):
+        scatSet   = ScatSet(Scatterer = Sphere, kwargs = {'Diameter' : [0.5e-6, 1e-6, 2e-6], 'Index' : [1.4], 'nMedium' : [1]})
+        sourceSet = SourceSet(Source = PlaneWave, kwargs = {'Wavelength' : [1e-6], 'Polarization' : [0]})
+        detSet    = DetectorSet(Detector = Photodiode, kwargs = {'NA' : [0.1, 0.2], 'Sampling' : [300]})
+        setup     = Setup(ScattererSet = scatSet, SourceSet = sourceSet, DetectorSet = detSet)
+
+        setup.Coupling()
+        Scatterers = dict( setup._Scatterers )
+
+        detSet.kwargs['NA'][0] = 0.3
+        stats = Stats()
+        with stats:
+            Array = setup.Coupling()
+
+        assert all( setup._Scatterers[key] is scat for key, scat in Scatterers.items() )
+        assert stats.HitRate['Scatterer'] == 1
+
+        with Stats() as stats: setup.Coupling()
+        assert stats.HitRate['FarField'] == 1 and 'FarField' not in stats.Split
+
+        setup.ClearCache()
+        with Stats() as stats: setup.Coupling()
+        assert stats.HitRate['Scatterer'] == 0 and 'FarField' in stats.Split
+
+        Fresh = Setup(ScattererSet = ScatSet(Scatterer = Sphere, kwargs = scatSet.kwargs),
+                      SourceSet    = SourceSet(Source = PlaneWave, kwargs = sourceSet.kwargs),
+                      DetectorSet  = DetectorSet(Detector = Photodiode, kwargs = detSet.kwargs))
+
+        assert np.allclose( Array.data, Fresh.Coupling().data )
+
+        scatSet.kwargs['Index'][0] = 1.5
+        setup.Coupling()
+        assert all( scat.kwargs['Index'] == 1.5 for scat in setup._Scatterers.values() )
+
+        print("<Experiment> scatterers reuse passed")
+
+
+    def test17(self):
+        Full       = ExpSet.Get('Qsca').data
+        IterChunks = Setup.IterChunks
+
+        def Interrupted(setup, *args, **kwargs):
+            for n, Chunk in enumerate( IterChunks(setup, *args, **kwargs) ):
+                if n == 1: raise KeyboardInterrupt
+                yield Chunk
+
+        with tempfile.TemporaryDirectory() as Dir:
+            Path = os.path.join(Dir, 'run.npy')
+
+            ExpSet.Get('Qsca', Output = Path, ChunkSize = 3)
+
+            with patch.object(Setup, 'IterChunks', Interrupted):
+                self.assertRaises(KeyboardInterrupt, ExpSet.Get, 'Qsca', Output = Path, ChunkSize = 3)
+
+            with open( os.path.join(Dir, 'run.manifest.json') ) as f:
+                assert json.load(f)['done'] == []
+
+            Resumed = ExpSet.Get('Qsca', Output = Path, ChunkSize = 3, Resume = True).data
+            assert np.allclose( Full, Resumed )
+            del Resumed
+
+            np.save(Path, np.zeros(3))
+            self.assertRaises(ValueError, ExpSet.Get, 'Qsca', Output = Path, ChunkSize = 3, Resume = True)
+
+        print("<Experiment> fresh run over a finished checkpoint passed")
+
+
+    def test18(self):
+        setup = Setup(ScattererSet = ScatSet(Scatterer = Sphere, kwargs = { 'Diameter' : np.linspace(100e-9, 1e-6, 50), 'Index' : [1.4], 'nMedium' : [1] }),
+                      SourceSet    = SourceSet(Source = PlaneWave, kwargs = { 'Wavelength' : [1e-6], 'Polarization' : [0] }))
+
+        Array = setup.Get(['Qsca', 'g'])
+
+        with tempfile.TemporaryDirectory() as Dir:
+            setup.Get(['Qsca', 'g'], Output = os.path.join(Dir, 'sweep.npy'))
+            Loaded = PMSArray.Load( os.path.join(Dir, 'sweep') )
+
+            Loaded.ChunkSize = 64
+            for Reduction in ['Mean', 'Std', 'Rsd', 'Monotonic']:
+                assert np.allclose( getattr(Array, Reduction)('diameter').data,
+                                    getattr(Loaded, Reduction)('diameter').data )
+
+            del Loaded
+
+        print("<Experiment> chunked reduction along the swept axis passed")
+
+
 class GLMTTestCase(unittest.TestCase):
 
 
@@ -310,6 +654,62 @@ class GLMTTestCase(unittest.TestCase):
         print('GaussianBeam beam BSC compute passed')
 
 
+    def test04(self):
+        import tempfile
+        from PyMieSim.Source import BSCCache
+        with patch.object(BSCCache, 'Path', tempfile.mkdtemp()):
+            BSC0 = Gbeam.GetBSC(MaxOrder=3, Cache=True)
+            assert len(BSCCache.Entries()) == 1
+            BSC1 = Gbeam.GetBSC(MaxOrder=3, Cache=True)
+            assert np.allclose( BSC0.to_numpy().astype(complex), BSC1.to_numpy().astype(complex) )
+            BSCCache.Clear()
+        print('GaussianBeam BSC disk cache passed')
+
+
+    def test05(self):
+        beam  = GaussianBeam(Wavelength = 1e-6, NA = 0.3, Offset = [0.3e-6, 0.2e-6, 0])
+        Table = beam.GetBSC(MaxOrder=4, Sampling=201, Cache=False).to_numpy().astype(complex)
+        Ref   = beam.GetBSC(MaxOrder=4, Tolerance=1e-8, Cache=False).to_numpy().astype(complex)
+        assert np.allclose( Table, Ref, atol=1e-6 * np.abs(Ref).max() )
+        print('GaussianBeam BSC table vs per-coefficient quadrature passed')
+
+
+    def test06(self):
+        from PyMieSim.GLMT.GaussianBeam import Im
+        for m, beta in [(0, 2.), (3, 5. - 2j), (-4, -7. + 1j), (10, 0.5j)]:
+            assert np.isclose( Im(m, beta, 'bessel'), Im(m, beta, 'trapz'), rtol=1e-8 )
+        print('Closed-form modified Bessel I_m vs integral representation passed')
+
+
+    def test07(self):
+        beam  = GaussianBeam(Wavelength = 1e-6, NA = 0.05, Offset = [0.3e-6, 0.2e-6, 0])
+        Error = beam.BSCError(MaxOrder=4)
+        assert Error.loc[('max', 'max')].max() < 2e-2
+        BSC   = beam.GetBSC(MaxOrder=4, Method='localized')
+        assert BSC.shape == (len(beam.Getidx((1, 4))), 2)
+        print('GaussianBeam localized approximation vs quadrature passed')
+
+
+    def test08(self):
+        beam  = GaussianBeam(Wavelength = 1e-6, NA = 0.3, Offset = [0.3e-6, 0.2e-6, 0])
+        Ref   = beam.GetBSC(MaxOrder=4, Sampling=101, Cache=False).to_numpy().astype(complex)
+        for ImMethod in ['trapz', 'simpson']:
+            BSC = beam.GetBSC(MaxOrder=4, Sampling=101, Cache=False, ImMethod=ImMethod).to_numpy().astype(complex)
+            assert np.allclose( BSC, Ref, atol=1e-10 * np.abs(Ref).max() )
+        print('GaussianBeam BSC closed-form vs integral I_m passed')
+
+
+    def test09(self):
+        beam      = GaussianBeam(Wavelength = 1e-6, NA = 0.3, Offset = [0.3e-6, 0.2e-6, 0])
+        Trapz     = lambda y: ( y[1:] + y[:-1] ).sum()
+        _, A0     = beam.Anm_integrand(3, 1, Sampling=2001)
+        _, A1     = beam.Anm_integrand(3, -2, Sampling=2001)
+        _, B0     = beam.Bnm_integrand(3, 1, Sampling=2001)
+        assert np.isclose( Trapz(A0) / Trapz(A1), beam.Anm(3, 1, Tolerance=1e-10) / beam.Anm(3, -2, Tolerance=1e-10), rtol=1e-8 )
+        assert np.isclose( Trapz(B0) / Trapz(A0), beam.Bnm(3, 1, Tolerance=1e-10) / beam.Anm(3, 1, Tolerance=1e-10), rtol=1e-8 )
+        print('GaussianBeam BSC integrands vs Anm/Bnm passed')
+
+
 class QuantitativeTestCase(unittest.TestCase):
 
     def test00(self):
@@ -355,6 +755,49 @@ class QuantitativeTestCase(unittest.TestCase):
         print('Validation extinction sross-section -> Scott Prahl')
 
 
+    def test05(self):
+        from PyMieSim.LMT.Scatterer import Efficiencies
+        Diameter = np.linspace(100e-9, 1e-6, 5)
+        Index    = np.array([1.4, 1.5 + 0.01j])[:, None]
+        Eff      = Efficiencies(Diameter = Diameter, Index = Index, Wavelength = 1e-6, nMedium = 1.)
+        assert Eff['Qsca'].shape == (2, 5)
+
+        Source   = PlaneWave(Wavelength = 1e-6)
+        Scat     = Sphere(Diameter = Diameter[3], Index = Index[1, 0], Source = Source)
+        assert np.isclose( Eff['Qsca'][1, 3], Scat.Qsca )
+        assert np.isclose( Eff['g'][1, 3], Scat.g )
+        print('Validation broadcast efficiencies -> Sphere')
+
+
+    def test06(self):
+        from PyMieSim.LMT.Scatterer import SetNumThreads, GetNumThreads
+        Mesh     = FibonacciMesh(MaxAngle = pi/4, Sampling = 500, PhiOffset = 0, GammaOffset = 0)
+        NThreads = GetNumThreads()
+
+        SetNumThreads(1)
+        val0 = Scat.uFarField(Mesh.Phi.Radian, Mesh.Theta.Radian, 1.)
+
+        SetNumThreads(4)
+        assert GetNumThreads() == 4
+        val1 = Scat.uFarField(Mesh.Phi.Radian, Mesh.Theta.Radian, 1.)
+
+        SetNumThreads(NThreads)
+        assert all( np.allclose(v0, v1) for v0, v1 in zip(val0, val1) )
+        print('Validation multi-threaded fields -> single-threaded')
+
+
+    def test07(self):
+        Source = PlaneWave(Wavelength = 1e-6)
+        Scat   = Sphere(Diameter = 1e-6, Index = 1.5, Source = Source)            # size parameter x = pi, sin(x) = 0
+        assert np.isclose( Scat.Qsca, 3.48224, 1e-5 )
+        assert np.isclose( Scat.g, 0.72924, 1e-5 )
+
+        Scat   = Sphere(Diameter = 5e-6, Index = 1.5, Source = Source)            # x = 5 pi
+        assert np.isclose( Scat.Qsca, 2.254279, 1e-5 )
+        assert np.isclose( Scat.g, 0.771270, 1e-5 )
+        print('Validation size parameter x = k pi -> Scott Prahl')
+
+
 
 def suite():
     suite = unittest.TestSuite()
@@ -364,6 +807,11 @@ def suite():
     suite.addTest(DetectorTestCase('test03'))
     suite.addTest(DetectorTestCase('test04'))
     suite.addTest(DetectorTestCase('test05'))
+    suite.addTest(DetectorTestCase('test06'))
+    suite.addTest(DetectorTestCase('test07'))
+    suite.addTest(DetectorTestCase('test08'))
+    suite.addTest(DetectorTestCase('test09'))
+    suite.addTest(DetectorTestCase('test10'))
 
     suite.addTest(ScattererTestCase('test00'))
     suite.addTest(ScattererTestCase('test01'))
@@ -380,6 +828,12 @@ def suite():
     suite.addTest(ScattererTestCase('test12'))
     suite.addTest(ScattererTestCase('test13'))
     suite.addTest(ScattererTestCase('test14'))
+    suite.addTest(ScattererTestCase('test15'))
+    suite.addTest(ScattererTestCase('test16'))
+    suite.addTest(ScattererTestCase('test17'))
+    suite.addTest(ScattererTestCase('test18'))
+    suite.addTest(ScattererTestCase('test19'))
+    suite.addTest(ScattererTestCase('test20'))
 
     suite.addTest(ExperiementTestCase('test00'))
     suite.addTest(ExperiementTestCase('test01'))
@@ -391,17 +845,35 @@ def suite():
     suite.addTest(ExperiementTestCase('test07'))
     suite.addTest(ExperiementTestCase('test08'))
     suite.addTest(ExperiementTestCase('test09'))
+    suite.addTest(ExperiementTestCase('test10'))
+    suite.addTest(ExperiementTestCase('test11'))
+    suite.addTest(ExperiementTestCase('test12'))
+    suite.addTest(ExperiementTestCase('test13'))
+    suite.addTest(ExperiementTestCase('test14'))
+    suite.addTest(ExperiementTestCase('test15'))
+    suite.addTest(ExperiementTestCase('test16'))
+    suite.addTest(ExperiementTestCase('test17'))
+    suite.addTest(ExperiementTestCase('test18'))
 
     suite.addTest(GLMTTestCase('test00'))
     suite.addTest(GLMTTestCase('test01'))
     suite.addTest(GLMTTestCase('test02'))
     suite.addTest(GLMTTestCase('test03'))
+    suite.addTest(GLMTTestCase('test04'))
+    suite.addTest(GLMTTestCase('test05'))
+    suite.addTest(GLMTTestCase('test06'))
+    suite.addTest(GLMTTestCase('test07'))
+    suite.addTest(GLMTTestCase('test08'))
+    suite.addTest(GLMTTestCase('test09'))
 
     suite.addTest(QuantitativeTestCase('test00'))
     suite.addTest(QuantitativeTestCase('test01'))
     suite.addTest(QuantitativeTestCase('test02'))
     suite.addTest(QuantitativeTestCase('test03'))
     suite.addTest(QuantitativeTestCase('test04'))
+    suite.addTest(QuantitativeTestCase('test05'))
+    suite.addTest(QuantitativeTestCase('test06'))
+    suite.addTest(QuantitativeTestCase('test07'))
 
     return suite
 